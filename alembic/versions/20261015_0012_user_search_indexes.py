@@ -0,0 +1,31 @@
+"""add trigram search and created_at indexes on users
+
+Revision ID: 20261015_0012
+Revises: 20260710_0011
+Create Date: 2026-10-15 09:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0012"
+down_revision = "20260710_0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_users_created_at", "users", ["created_at"], unique=False, if_not_exists=True)
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_users_email_lower_trgm ON users USING gin (lower(email) gin_trgm_ops)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_users_full_name_lower_trgm ON users USING gin (lower(full_name) gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_users_full_name_lower_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_users_email_lower_trgm")
+    op.drop_index("ix_users_created_at", table_name="users")
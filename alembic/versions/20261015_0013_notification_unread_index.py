@@ -0,0 +1,29 @@
+"""add unread notifications index
+
+Revision ID: 20261015_0013
+Revises: 20261015_0012
+Create Date: 2026-10-15 12:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0013"
+down_revision = "20261015_0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_notifications_user_read_created_at",
+        "notifications",
+        ["user_id", "read_at", "created_at"],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notifications_user_read_created_at", table_name="notifications")
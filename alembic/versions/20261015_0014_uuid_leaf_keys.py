@@ -0,0 +1,45 @@
+"""store message and notification ids as 16-byte uuids
+
+Revision ID: 20261015_0014
+Revises: 20261015_0013
+Create Date: 2026-10-15 13:00:00.000000
+"""
+
+import uuid
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0014"
+down_revision = "20261015_0013"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("messages", "notifications")
+
+
+def _rewrite_ids(table: str, convert) -> None:
+    bind = op.get_bind()
+    ids = bind.execute(sa.text(f"SELECT id FROM {table}")).scalars().all()
+    for value in ids:
+        bind.execute(sa.text(f"UPDATE {table} SET id = :new WHERE id = :old"), {"new": convert(value), "old": value})
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for table in _TABLES:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE uuid USING id::uuid")
+        return
+    for table in _TABLES:
+        _rewrite_ids(table, lambda value: uuid.UUID(str(value)).bytes)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for table in _TABLES:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE varchar(36) USING id::text")
+        return
+    for table in _TABLES:
+        _rewrite_ids(table, lambda value: str(uuid.UUID(bytes=bytes(value))))
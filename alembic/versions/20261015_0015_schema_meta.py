@@ -0,0 +1,30 @@
+"""add schema_meta table for runtime schema version stamps
+
+Revision ID: 20261015_0015
+Revises: 20261015_0014
+Create Date: 2026-10-15 14:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0015"
+down_revision = "20261015_0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "schema_meta",
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("value", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("key", name="pk_schema_meta"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("schema_meta")
@@ -0,0 +1,34 @@
+"""add homeowner/status visitor session index and drop redundant single-column indexes
+
+Revision ID: 20261015_0016
+Revises: 20261015_0015
+Create Date: 2026-10-15 15:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0016"
+down_revision = "20261015_0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_visitor_sessions_homeowner_status_started_at",
+        "visitor_sessions",
+        ["homeowner_id", "status", "started_at"],
+        unique=False,
+        if_not_exists=True,
+    )
+    # Both are leading-column prefixes of existing composite indexes.
+    op.drop_index("ix_visitor_sessions_homeowner_id", table_name="visitor_sessions", if_exists=True)
+    op.drop_index("ix_messages_session_id", table_name="messages", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index("ix_messages_session_id", "messages", ["session_id"], unique=False, if_not_exists=True)
+    op.create_index("ix_visitor_sessions_homeowner_id", "visitor_sessions", ["homeowner_id"], unique=False, if_not_exists=True)
+    op.drop_index("ix_visitor_sessions_homeowner_status_started_at", table_name="visitor_sessions")
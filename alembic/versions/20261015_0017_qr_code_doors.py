@@ -0,0 +1,70 @@
+"""move qr_codes.doors_csv into a qr_code_doors association table
+
+Revision ID: 20261015_0017
+Revises: 20261015_0016
+Create Date: 2026-10-15 16:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0017"
+down_revision = "20261015_0016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    op.create_table(
+        "qr_code_doors",
+        sa.Column("qr_code_id", sa.String(length=36), nullable=False),
+        sa.Column("door_id", sa.String(length=36), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["qr_code_id"], ["qr_codes.id"], name="fk_qr_code_doors_qr_code_id_qr_codes", ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["door_id"], ["doors.id"], name="fk_qr_code_doors_door_id_doors", ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("qr_code_id", "door_id", name="pk_qr_code_doors"),
+        if_not_exists=True,
+    )
+    op.create_index("ix_qr_code_doors_door_id", "qr_code_doors", ["door_id"], unique=False, if_not_exists=True)
+
+    columns = {col["name"] for col in sa.inspect(bind).get_columns("qr_codes")}
+    if "doors_csv" not in columns:
+        return
+    door_ids = set(bind.execute(sa.text("SELECT id FROM doors")).scalars())
+    links = []
+    for qr_code_id, doors_csv in bind.execute(sa.text("SELECT id, doors_csv FROM qr_codes")).all():
+        seen: list[str] = []
+        for raw in (doors_csv or "").split(","):
+            door_id = raw.strip()
+            # Skip blanks, duplicates and ids of doors that no longer exist (the CSV had no FK).
+            if door_id and door_id in door_ids and door_id not in seen:
+                seen.append(door_id)
+        links.extend({"qr_code_id": qr_code_id, "door_id": door_id, "position": index} for index, door_id in enumerate(seen))
+    if links:
+        bind.execute(
+            sa.text("INSERT INTO qr_code_doors (qr_code_id, door_id, position) VALUES (:qr_code_id, :door_id, :position)"),
+            links,
+        )
+    with op.batch_alter_table("qr_codes") as batch:
+        batch.drop_column("doors_csv")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    with op.batch_alter_table("qr_codes") as batch:
+        batch.add_column(sa.Column("doors_csv", sa.Text(), nullable=True))
+    grouped: dict[str, list[str]] = {}
+    rows = bind.execute(sa.text("SELECT qr_code_id, door_id FROM qr_code_doors ORDER BY qr_code_id, position")).all()
+    for qr_code_id, door_id in rows:
+        grouped.setdefault(qr_code_id, []).append(door_id)
+    if grouped:
+        bind.execute(
+            sa.text("UPDATE qr_codes SET doors_csv = :doors_csv WHERE id = :id"),
+            [{"id": qr_code_id, "doors_csv": ",".join(ids)} for qr_code_id, ids in grouped.items()],
+        )
+    bind.execute(sa.text("UPDATE qr_codes SET doors_csv = '' WHERE doors_csv IS NULL"))
+    op.drop_index("ix_qr_code_doors_door_id", table_name="qr_code_doors")
+    op.drop_table("qr_code_doors")
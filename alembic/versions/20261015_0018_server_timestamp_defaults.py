@@ -0,0 +1,56 @@
+"""generate created_at/updated_at timestamps in the database
+
+Revision ID: 20261015_0018
+Revises: 20261015_0017
+Create Date: 2026-10-15 17:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0018"
+down_revision = "20261015_0017"
+branch_labels = None
+depends_on = None
+
+
+TIMESTAMP_COLUMNS = {
+    "estates": ("created_at",),
+    "homes": ("created_at",),
+    "payment_purposes": ("created_at",),
+    "subscription_plans": ("created_at", "updated_at"),
+    "users": ("created_at", "updated_at"),
+    "notifications": ("created_at",),
+    "qr_codes": ("created_at",),
+    "referral_rewards": ("created_at",),
+    "resident_settings": ("created_at", "updated_at"),
+    "resident_wallet_transactions": ("created_at",),
+    "resident_wallets": ("created_at", "updated_at"),
+    "visitor_sessions": ("started_at",),
+    "call_sessions": ("created_at",),
+    "messages": ("created_at",),
+}
+
+# Must match the compiled forms of app.db.types.UTCNow.
+_UTC_NOW_SQL = {
+    "postgresql": "TIMEZONE('utc', STATEMENT_TIMESTAMP())",
+    "sqlite": "(STRFTIME('%Y-%m-%d %H:%M:%f000', 'now'))",
+}
+
+
+def _set_defaults(server_default) -> None:
+    for table_name, columns in TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table_name) as batch:
+            for column in columns:
+                batch.alter_column(column, existing_type=sa.DateTime(), server_default=server_default)
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    _set_defaults(sa.text(_UTC_NOW_SQL.get(dialect, "CURRENT_TIMESTAMP")))
+
+
+def downgrade() -> None:
+    _set_defaults(None)
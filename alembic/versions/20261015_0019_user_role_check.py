@@ -0,0 +1,47 @@
+"""store users.role as VARCHAR with a CHECK constraint instead of a native enum
+
+Revision ID: 20261015_0019
+Revises: 20261015_0018
+Create Date: 2026-10-15 18:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0019"
+down_revision = "20261015_0018"
+branch_labels = None
+depends_on = None
+
+
+ROLES = ("homeowner", "estate", "office", "office_staff", "admin", "security")
+ROLE_CHECK = "role IN ({})".format(", ".join(f"'{role}'" for role in ROLES))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("ALTER TABLE users ALTER COLUMN role TYPE VARCHAR(16) USING role::text")
+        op.execute("DROP TYPE IF EXISTS userrole")
+        op.execute("ALTER TABLE users DROP CONSTRAINT IF EXISTS ck_users_role")
+        op.create_check_constraint(op.f("ck_users_role"), "users", ROLE_CHECK)
+        return
+    existing = {check["name"] for check in sa.inspect(bind).get_check_constraints("users")}
+    with op.batch_alter_table("users") as batch:
+        batch.alter_column("role", existing_type=sa.String(length=12), type_=sa.String(length=16), existing_nullable=False)
+        if "ck_users_role" not in existing:
+            batch.create_check_constraint(op.f("ck_users_role"), ROLE_CHECK)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("ALTER TABLE users DROP CONSTRAINT IF EXISTS ck_users_role")
+        op.execute("CREATE TYPE userrole AS ENUM ({})".format(", ".join(f"'{role}'" for role in ROLES)))
+        op.execute("ALTER TABLE users ALTER COLUMN role TYPE userrole USING role::userrole")
+        return
+    with op.batch_alter_table("users") as batch:
+        batch.drop_constraint(op.f("ck_users_role"), type_="check")
+        batch.alter_column("role", existing_type=sa.String(length=16), type_=sa.String(length=12), existing_nullable=False)
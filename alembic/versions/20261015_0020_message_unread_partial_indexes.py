@@ -0,0 +1,44 @@
+"""replace full read-marker indexes on messages with partial unread indexes
+
+Revision ID: 20261015_0020
+Revises: 20261015_0019
+Create Date: 2026-10-15 19:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0020"
+down_revision = "20261015_0019"
+branch_labels = None
+depends_on = None
+
+
+UNREAD_INDEXES = {
+    "ix_messages_session_unread_by_homeowner": "read_by_homeowner_at IS NULL",
+    "ix_messages_session_unread_by_security": "read_by_security_at IS NULL",
+}
+
+
+def upgrade() -> None:
+    for name, predicate in UNREAD_INDEXES.items():
+        op.create_index(
+            name,
+            "messages",
+            ["session_id"],
+            unique=False,
+            postgresql_where=sa.text(predicate),
+            sqlite_where=sa.text(predicate),
+            if_not_exists=True,
+        )
+    op.drop_index("ix_messages_read_by_homeowner_at", table_name="messages", if_exists=True)
+    op.drop_index("ix_messages_read_by_security_at", table_name="messages", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index("ix_messages_read_by_security_at", "messages", ["read_by_security_at"], unique=False, if_not_exists=True)
+    op.create_index("ix_messages_read_by_homeowner_at", "messages", ["read_by_homeowner_at"], unique=False, if_not_exists=True)
+    for name in UNREAD_INDEXES:
+        op.drop_index(name, table_name="messages", if_exists=True)
@@ -0,0 +1,34 @@
+"""compare qr_id columns byte-wise on PostgreSQL
+
+Revision ID: 20261015_0021
+Revises: 20261015_0020
+Create Date: 2026-10-15 20:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0021"
+down_revision = "20261015_0020"
+branch_labels = None
+depends_on = None
+
+
+QR_ID_TABLES = ("qr_codes", "visitor_sessions")
+
+
+def _set_collation(collation: str) -> None:
+    # SQLite already compares with BINARY; only PostgreSQL carries a locale collation.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table_name in QR_ID_TABLES:
+        op.execute(f'ALTER TABLE {table_name} ALTER COLUMN qr_id TYPE VARCHAR(64) COLLATE "{collation}"')
+
+
+def upgrade() -> None:
+    _set_collation("C")
+
+
+def downgrade() -> None:
+    _set_collation("default")
@@ -0,0 +1,36 @@
+"""index users.email for prefix lookups on PostgreSQL
+
+Revision ID: 20261015_0022
+Revises: 20261015_0021
+Create Date: 2026-10-15 21:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0022"
+down_revision = "20261015_0021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Username logins match "name@%"; locale-collated btree indexes cannot serve LIKE prefixes.
+    # SQLite has no operator classes and its LIKE is case-insensitive, so it keeps the plain index.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.create_index(
+        "ix_users_email_prefix",
+        "users",
+        ["email"],
+        unique=False,
+        postgresql_ops={"email": "varchar_pattern_ops"},
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_users_email_prefix", table_name="users", if_exists=True)
@@ -0,0 +1,30 @@
+"""index device_sessions.refresh_token
+
+Revision ID: 20261015_0023
+Revises: 20261015_0022
+Create Date: 2026-10-15 22:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0023"
+down_revision = "20261015_0022"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Refresh and logout look sessions up by token value; without this each call scans device_sessions.
+    op.create_index(
+        "ix_device_sessions_refresh_token",
+        "device_sessions",
+        ["refresh_token"],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_device_sessions_refresh_token", table_name="device_sessions", if_exists=True)
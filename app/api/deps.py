@@ -1,17 +1,71 @@
 from __future__ import annotations
 
 import logging
+import time
+from functools import lru_cache
+from threading import Lock
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached
 
-from app.core.security import decode_token
+from app.core.config import get_settings
+from app.core.security import decode_token_cached
 from app.db.models import User
-from app.db.session import get_db
+from app.db.session import get_cached, get_db
 
 bearer_scheme = HTTPBearer(auto_error=False)
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_USER_CACHE_MAX_ENTRIES = 4096
+_user_cache: dict[str, tuple[float, User]] = {}
+_user_cache_lock = Lock()
+
+
+def invalidate_cached_user(user_id: str | None) -> None:
+    if not user_id:
+        return
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
+def clear_user_cache() -> None:
+    with _user_cache_lock:
+        _user_cache.clear()
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_user_on_change(_mapper, _connection, target: User) -> None:
+    invalidate_cached_user(target.id)
+
+
+def _load_authenticated_user(db: Session, user_id: str | None) -> User | None:
+    # Authenticated requests reuse a detached snapshot for a short TTL and merge it into the
+    # request session without a SELECT. ORM updates in this process drop the entry immediately.
+    if not user_id:
+        return None
+    ttl_seconds = settings.AUTH_USER_CACHE_TTL_SECONDS
+    if ttl_seconds <= 0:
+        return get_cached(db, User, user_id)
+
+    now = time.monotonic()
+    with _user_cache_lock:
+        cached = _user_cache.get(user_id)
+    if cached and cached[0] > now:
+        return db.merge(cached[1], load=False)
+
+    user = get_cached(db, User, user_id)
+    if user is not None:
+        snapshot = User(**{attr.key: getattr(user, attr.key) for attr in User.__mapper__.column_attrs})
+        make_transient_to_detached(snapshot)
+        with _user_cache_lock:
+            if len(_user_cache) >= _USER_CACHE_MAX_ENTRIES:
+                _user_cache.clear()
+            _user_cache[user_id] = (now + ttl_seconds, snapshot)
+    return user
 
 
 def get_current_user(
@@ -24,7 +78,7 @@ def get_current_user(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing token")
 
     try:
-        payload = decode_token(credentials.credentials)
+        payload = decode_token_cached(credentials.credentials)
     except ValueError:
         logger.warning("auth.failed reason=invalid_or_expired_token path=%s origin=%s", request.url.path, request.headers.get("origin"))
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
@@ -33,7 +87,7 @@ def get_current_user(
         logger.warning("auth.failed reason=invalid_token_type path=%s token_type=%s", request.url.path, payload.get("type"))
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type")
 
-    user = db.query(User).filter(User.id == payload.get("sub")).first()
+    user = _load_authenticated_user(db, payload.get("sub"))
     if not user or not user.is_active:
         logger.warning("auth.failed reason=user_not_found path=%s user_id=%s", request.url.path, payload.get("sub"))
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
@@ -52,7 +106,7 @@ def get_optional_current_user(
         return None
 
     try:
-        payload = decode_token(credentials.credentials)
+        payload = decode_token_cached(credentials.credentials)
     except ValueError:
         logger.warning("auth.optional_failed reason=invalid_or_expired_token path=%s", request.url.path)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
@@ -61,7 +115,7 @@ def get_optional_current_user(
         logger.warning("auth.optional_failed reason=invalid_token_type path=%s token_type=%s", request.url.path, payload.get("type"))
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type")
 
-    user = db.query(User).filter(User.id == payload.get("sub")).first()
+    user = _load_authenticated_user(db, payload.get("sub"))
     if not user or not user.is_active:
         logger.warning("auth.optional_failed reason=user_not_found path=%s user_id=%s", request.url.path, payload.get("sub"))
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
@@ -71,9 +125,13 @@ def get_optional_current_user(
     return user
 
 
+@lru_cache(maxsize=32)
 def require_roles(*roles: str):
+    # Memoized so every route declaring the same role set shares one dependency callable.
+    allowed_roles = frozenset(roles)
+
     def dependency(user: User = Depends(get_current_user)) -> User:
-        if user.role.value not in roles:
+        if user.role.value not in allowed_roles:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
         return user
 
@@ -1,33 +1,85 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from fastapi import APIRouter, Depends, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import Boolean, func, or_, select
+from sqlalchemy.orm import Session, raiseload
 
 from app.api.deps import require_roles
 from app.core.cache import cache_key, get_or_set_json
 from app.core.config import get_settings
 from app.core.exceptions import AppException
-from app.db.models import Door, Estate, Home, Message, Notification, QRCode, Subscription, SubscriptionPlan, User, UserRole, VisitorSession
+from app.core.redis import delete_cached_keys
+from app.core.responses import stream_json_data
+from app.db.models import Door, Estate, Home, Message, Notification, QRCode, QRCodeDoor, Subscription, SubscriptionPlan, User, UserRole, VisitorSession
 from app.db.session import get_db
-from app.services.admin_service import create_door, create_qr_code, fund_wallet, get_admin_overview, list_wallet_balances, list_wallet_transactions
+from app.schemas.base import RequestPayload
+from app.services.admin_service import (
+    create_door,
+    create_qr_code,
+    fund_wallet,
+    get_admin_metrics,
+    get_admin_overview,
+    list_admin_estate_owners,
+    list_admin_homeowners,
+    list_admin_payment_history,
+    list_admin_visits,
+    list_wallet_balances,
+    list_wallet_transactions,
+)
 from app.services.payment_service import list_subscription_plans, upsert_plan
-from app.services.audit_service import list_audit_logs, write_audit_log
+from app.services.audit_service import flush_audit_logs, list_audit_logs, queue_audit_log
 
 router = APIRouter()
 settings = get_settings()
+_ROLE_ENUM_BY_STR = {role.value: role for role in UserRole}
 uploads_root = Path((settings.MEDIA_STORAGE_PATH or "").strip() or (Path(__file__).resolve().parents[2] / "uploads"))
 
+# Correlated count keeps the QR listing a single statement.
+_QR_DOOR_COUNT = (
+    select(func.count()).where(QRCodeDoor.qr_code_id == QRCode.id).correlate(QRCode).scalar_subquery().label("door_count")
+)
 
-class DoorCreate(BaseModel):
+# Response keys for the column-tuple listings, in SELECT order, so rows serialize via dict(zip(keys, row)).
+_DOOR_LIST_KEYS = ("id", "name", "state", "homeId", "homeName", "homeownerId", "homeownerEmail", "estateId", "estateName")
+_QR_LIST_KEYS = ("id", "qrId", "mode", "plan", "homeId", "estateId", "active", "doorCount", "createdAt")
+
+
+def _cached_admin_overview(db: Session) -> dict:
+    # /overview and /analytics share one snapshot so dashboard polling recomputes it at most once per TTL.
+    return get_or_set_json(
+        cache_key("admin-overview"),
+        lambda: get_admin_overview(db),
+        settings.CACHE_ADMIN_TTL_SECONDS,
+    )
+
+
+def _invalidate_admin_overview() -> None:
+    delete_cached_keys(cache_key("admin-overview"))
+
+
+@lru_cache(maxsize=1)
+def _admin_config_snapshot() -> dict:
+    # Settings are a process-wide singleton, so the config summary never changes after startup.
+    return {
+        "environment": settings.ENVIRONMENT,
+        "debug": bool(settings.DEBUG),
+        "paystackConfigured": bool(settings.PAYSTACK_SECRET_KEY and settings.PAYSTACK_PUBLIC_KEY),
+        "vapidConfigured": bool(settings.VAPID_PUBLIC_KEY and settings.VAPID_PRIVATE_KEY),
+        "adminSignupKeySet": bool(settings.ADMIN_SIGNUP_KEY),
+        "frontendBaseUrl": settings.FRONTEND_BASE_URL,
+    }
+
+
+class DoorCreate(RequestPayload):
     name: str
     homeId: str
 
 
-class QRCreate(BaseModel):
+class QRCreate(RequestPayload):
     qrId: str
     plan: str
     homeId: str
@@ -36,7 +88,7 @@ class QRCreate(BaseModel):
     estateId: Optional[str] = None
 
 
-class PlanUpsert(BaseModel):
+class PlanUpsert(RequestPayload):
     id: str
     name: str
     amount: int = 0
@@ -46,16 +98,16 @@ class PlanUpsert(BaseModel):
     active: bool = True
 
 
-class UserPatch(BaseModel):
+class UserPatch(RequestPayload):
     isActive: Optional[bool] = None
 
 
-class SubscriptionActivate(BaseModel):
+class SubscriptionActivate(RequestPayload):
     userId: str
     plan: str
 
 
-class WalletFundPayload(BaseModel):
+class WalletFundPayload(RequestPayload):
     userId: str
     amount: float
     note: Optional[str] = None
@@ -68,6 +120,7 @@ def admin_create_door(
     _: User = Depends(require_roles("admin")),
 ):
     door = create_door(db, payload.name, payload.homeId)
+    _invalidate_admin_overview()
     return {"data": {"id": door.id, "name": door.name, "homeId": door.home_id}}
 
 
@@ -86,6 +139,7 @@ def admin_create_qr(
         mode=payload.mode,
         estate_id=payload.estateId,
     )
+    _invalidate_admin_overview()
     return {"data": {"id": code.id, "qrId": code.qr_id}}
 
 
@@ -94,13 +148,65 @@ def admin_overview(
     db: Session = Depends(get_db),
     _: User = Depends(require_roles("admin")),
 ):
-    return {
-        "data": get_or_set_json(
-            cache_key("admin-overview"),
-            lambda: get_admin_overview(db),
-            settings.CACHE_ADMIN_TTL_SECONDS,
-        )
-    }
+    return {"data": _cached_admin_overview(db)}
+
+
+@router.get("/overview/metrics")
+def admin_overview_metrics(
+    db: Session = Depends(get_db),
+    _: User = Depends(require_roles("admin")),
+):
+    return {"data": get_admin_metrics(db)}
+
+
+@router.get("/overview/homeowners")
+def admin_overview_homeowners(
+    limit: int = Query(default=200, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
+    db: Session = Depends(get_db),
+    _: User = Depends(require_roles("admin")),
+):
+    return {"data": list_admin_homeowners(db, limit=limit, offset=offset)}
+
+
+@router.get("/overview/estates")
+def admin_overview_estates(
+    limit: int = Query(default=200, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
+    db: Session = Depends(get_db),
+    _: User = Depends(require_roles("admin")),
+):
+    return {"data": list_admin_estate_owners(db, limit=limit, offset=offset)}
+
+
+@router.get("/overview/payments/homeowners")
+def admin_overview_homeowner_payments(
+    limit: int = Query(default=200, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
+    db: Session = Depends(get_db),
+    _: User = Depends(require_roles("admin")),
+):
+    return {"data": list_admin_payment_history(db, UserRole.homeowner, limit=limit, offset=offset)}
+
+
+@router.get("/overview/payments/estates")
+def admin_overview_estate_payments(
+    limit: int = Query(default=200, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
+    db: Session = Depends(get_db),
+    _: User = Depends(require_roles("admin")),
+):
+    return {"data": list_admin_payment_history(db, UserRole.estate, limit=limit, offset=offset)}
+
+
+@router.get("/overview/visits")
+def admin_overview_visits(
+    limit: int = Query(default=300, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+    db: Session = Depends(get_db),
+    _: User = Depends(require_roles("admin")),
+):
+    return {"data": list_admin_visits(db, limit=limit, offset=offset)}
 
 
 @router.get("/uploads/debug")
@@ -162,6 +268,7 @@ def admin_update_plan(
         max_qr_codes=payload.maxQrCodes,
         active=payload.active,
     )
+    _invalidate_admin_overview()
     return {
         "data": {
             "id": row.id,
@@ -185,10 +292,14 @@ def admin_list_users(
 ):
     query = db.query(User).order_by(User.created_at.desc())
     if role:
-        query = query.filter(User.role == UserRole(role))
+        role_enum = _ROLE_ENUM_BY_STR.get(role)
+        if role_enum is None:
+            return {"data": []}
+        query = query.filter(User.role == role_enum)
     if q:
         term = f"%{q.strip().lower()}%"
-        query = query.filter((User.email.ilike(term)) | (User.full_name.ilike(term)))
+        # lower(...) LIKE matches the pg_trgm expression indexes on users.email/full_name.
+        query = query.filter(or_(func.lower(User.email).like(term), func.lower(User.full_name).like(term)))
     rows = query.limit(limit).all()
     return {
         "data": [
@@ -198,7 +309,7 @@ def admin_list_users(
                 "email": row.email,
                 "role": row.role.value,
                 "active": bool(row.is_active),
-                "createdAt": row.created_at.isoformat() if row.created_at else None,
+                "createdAt": row.created_at,
             }
             for row in rows
         ]
@@ -209,16 +320,19 @@ def admin_list_users(
 def admin_patch_user(
     user_id: str,
     payload: UserPatch,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     actor: User = Depends(require_roles("admin")),
 ):
-    row = db.query(User).filter(User.id == user_id).first()
+    row = db.get(User, user_id)
     if not row:
         return {"data": None}
     if payload.isActive is not None:
         row.is_active = bool(payload.isActive)
     db.commit()
-    write_audit_log(db, actor_user_id=actor.id, action="user.patch", resource_type="user", resource_id=row.id, meta={"isActive": payload.isActive})
+    _invalidate_admin_overview()
+    queue_audit_log(actor_user_id=actor.id, action="user.patch", resource_type="user", resource_id=row.id, meta={"isActive": payload.isActive})
+    background_tasks.add_task(flush_audit_logs, db.get_bind())
     return {
         "data": {
             "id": row.id,
@@ -236,19 +350,23 @@ def admin_list_estates(
     db: Session = Depends(get_db),
     _: User = Depends(require_roles("admin")),
 ):
-    estates = db.query(Estate).order_by(Estate.created_at.desc()).limit(limit).all()
-    owners = db.query(User).filter(User.id.in_([e.owner_id for e in estates])).all() if estates else []
-    owner_by_id = {o.id: o for o in owners}
+    rows = (
+        db.query(Estate, User.email)
+        .outerjoin(User, User.id == Estate.owner_id)
+        .order_by(Estate.created_at.desc())
+        .limit(limit)
+        .all()
+    )
     return {
         "data": [
             {
                 "id": row.id,
                 "name": row.name,
                 "ownerId": row.owner_id,
-                "ownerEmail": owner_by_id.get(row.owner_id).email if owner_by_id.get(row.owner_id) else "",
-                "createdAt": row.created_at.isoformat() if row.created_at else None,
+                "ownerEmail": owner_email or "",
+                "createdAt": row.created_at,
             }
-            for row in estates
+            for row, owner_email in rows
         ]
     }
 
@@ -259,33 +377,26 @@ def admin_list_doors(
     db: Session = Depends(get_db),
     _: User = Depends(require_roles("admin")),
 ):
-    doors = db.query(Door).limit(limit).all()
-    homes = db.query(Home).filter(Home.id.in_([d.home_id for d in doors])).all() if doors else []
-    home_by_id = {h.id: h for h in homes}
-    homeowners = db.query(User).filter(User.id.in_([h.homeowner_id for h in homes])).all() if homes else []
-    homeowner_by_id = {u.id: u for u in homeowners}
-    estates = db.query(Estate).filter(Estate.id.in_([h.estate_id for h in homes if h.estate_id])).all() if homes else []
-    estate_by_id = {e.id: e for e in estates}
-    return {
-        "data": [
-            {
-                "id": d.id,
-                "name": d.name,
-                "state": d.is_active,
-                "homeId": d.home_id,
-                "homeName": home_by_id.get(d.home_id).name if home_by_id.get(d.home_id) else "",
-                "homeownerId": home_by_id.get(d.home_id).homeowner_id if home_by_id.get(d.home_id) else "",
-                "homeownerEmail": homeowner_by_id.get(home_by_id.get(d.home_id).homeowner_id).email
-                if home_by_id.get(d.home_id) and homeowner_by_id.get(home_by_id.get(d.home_id).homeowner_id)
-                else "",
-                "estateId": home_by_id.get(d.home_id).estate_id if home_by_id.get(d.home_id) else None,
-                "estateName": estate_by_id.get(home_by_id.get(d.home_id).estate_id).name
-                if home_by_id.get(d.home_id) and home_by_id.get(d.home_id).estate_id and estate_by_id.get(home_by_id.get(d.home_id).estate_id)
-                else None,
-            }
-            for d in doors
-        ]
-    }
+    # Read-only listing: select flat columns so no ORM objects or relationships are built per row.
+    rows = (
+        db.query(
+            Door.id,
+            Door.name,
+            Door.is_active,
+            Door.home_id,
+            func.coalesce(Home.name, "").label("home_name"),
+            func.coalesce(Home.homeowner_id, "").label("homeowner_id"),
+            func.coalesce(User.email, "").label("homeowner_email"),
+            Home.estate_id,
+            Estate.name.label("estate_name"),
+        )
+        .outerjoin(Home, Home.id == Door.home_id)
+        .outerjoin(User, User.id == Home.homeowner_id)
+        .outerjoin(Estate, Estate.id == Home.estate_id)
+        .limit(limit)
+        .all()
+    )
+    return stream_json_data(rows, lambda row: dict(zip(_DOOR_LIST_KEYS, row)))
 
 
 @router.get("/qrs/all")
@@ -294,23 +405,23 @@ def admin_list_qrs(
     db: Session = Depends(get_db),
     _: User = Depends(require_roles("admin")),
 ):
-    rows = db.query(QRCode).order_by(QRCode.created_at.desc()).limit(limit).all()
-    return {
-        "data": [
-            {
-                "id": row.id,
-                "qrId": row.qr_id,
-                "mode": row.mode,
-                "plan": row.plan,
-                "homeId": row.home_id,
-                "estateId": row.estate_id,
-                "active": bool(row.active),
-                "doorCount": len([v for v in (row.doors_csv or "").split(",") if v.strip()]),
-                "createdAt": row.created_at.isoformat() if row.created_at else None,
-            }
-            for row in rows
-        ]
-    }
+    rows = (
+        db.query(
+            QRCode.id,
+            QRCode.qr_id,
+            QRCode.mode,
+            QRCode.plan,
+            QRCode.home_id,
+            QRCode.estate_id,
+            func.coalesce(QRCode.active, False, type_=Boolean).label("active"),
+            _QR_DOOR_COUNT,
+            QRCode.created_at,
+        )
+        .order_by(QRCode.created_at.desc())
+        .limit(limit)
+        .all()
+    )
+    return stream_json_data(rows, lambda row: dict(zip(_QR_LIST_KEYS, row)))
 
 
 @router.get("/subscriptions")
@@ -319,23 +430,27 @@ def admin_list_subscriptions(
     db: Session = Depends(get_db),
     _: User = Depends(require_roles("admin")),
 ):
-    rows = db.query(Subscription).order_by(Subscription.starts_at.desc(), Subscription.id.desc()).limit(limit).all()
-    user_ids = list({r.user_id for r in rows})
-    users = db.query(User).filter(User.id.in_(user_ids)).all() if user_ids else []
-    user_by_id = {u.id: u for u in users}
+    rows = (
+        db.query(Subscription, User.email, User.role)
+        .outerjoin(User, User.id == Subscription.user_id)
+        .options(raiseload("*"))
+        .order_by(Subscription.starts_at.desc(), Subscription.id.desc())
+        .limit(limit)
+        .all()
+    )
     return {
         "data": [
             {
                 "id": row.id,
                 "userId": row.user_id,
-                "userEmail": user_by_id.get(row.user_id).email if user_by_id.get(row.user_id) else "",
-                "userRole": user_by_id.get(row.user_id).role.value if user_by_id.get(row.user_id) else "",
+                "userEmail": user_email or "",
+                "userRole": user_role.value if user_role else "",
                 "plan": row.plan,
                 "status": row.status,
-                "startsAt": row.starts_at.isoformat() if row.starts_at else None,
-                "endsAt": row.ends_at.isoformat() if row.ends_at else None,
+                "startsAt": row.starts_at,
+                "endsAt": row.ends_at,
             }
-            for row in rows
+            for row, user_email, user_role in rows
         ]
     }
 
@@ -343,18 +458,21 @@ def admin_list_subscriptions(
 @router.post("/subscriptions/activate")
 def admin_activate_subscription(
     payload: SubscriptionActivate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     actor: User = Depends(require_roles("admin")),
 ):
     # Minimal activation: insert a subscription row. Limits are resolved by /payment/subscription/me.
-    plan_row = db.query(SubscriptionPlan).filter(SubscriptionPlan.id == payload.plan).first()
+    plan_row = db.get(SubscriptionPlan, payload.plan)
     if not plan_row:
         return {"data": None}
     row = Subscription(user_id=payload.userId, plan=payload.plan, status="active")
     db.add(row)
     db.commit()
     db.refresh(row)
-    write_audit_log(db, actor_user_id=actor.id, action="subscription.activate", resource_type="subscription", resource_id=row.id, meta={"userId": payload.userId, "plan": payload.plan})
+    _invalidate_admin_overview()
+    queue_audit_log(actor_user_id=actor.id, action="subscription.activate", resource_type="subscription", resource_id=row.id, meta={"userId": payload.userId, "plan": payload.plan})
+    background_tasks.add_task(flush_audit_logs, db.get_bind())
     return {"data": {"id": row.id, "userId": row.user_id, "plan": row.plan, "status": row.status}}
 
 
@@ -364,8 +482,8 @@ def admin_payments_summary(
     _: User = Depends(require_roles("admin")),
 ):
     # Payments are derived from subscription rows in this app.
-    subs = db.query(Subscription).all()
-    return {"data": {"count": len(subs)}}
+    count = db.query(func.count(Subscription.id)).scalar() or 0
+    return {"data": {"count": int(count)}}
 
 
 @router.get("/wallets")
@@ -388,6 +506,7 @@ def admin_list_wallet_transactions(
 @router.post("/wallets/fund")
 def admin_fund_wallet(
     payload: WalletFundPayload,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     actor: User = Depends(require_roles("admin")),
 ):
@@ -395,14 +514,14 @@ def admin_fund_wallet(
         data = fund_wallet(db, user_id=payload.userId, amount=payload.amount, note=payload.note)
     except ValueError as exc:
         raise AppException(str(exc), status_code=400)
-    write_audit_log(
-        db,
+    queue_audit_log(
         actor_user_id=actor.id,
         action="wallet.fund",
         resource_type="wallet",
         resource_id=payload.userId,
         meta={"amount": payload.amount, "note": payload.note},
     )
+    background_tasks.add_task(flush_audit_logs, db.get_bind())
     return {"data": data}
 
 
@@ -424,7 +543,7 @@ def admin_list_messages(
                 "sessionId": row.session_id,
                 "senderType": row.sender_type,
                 "body": row.body,
-                "createdAt": row.created_at.isoformat() if row.created_at else None,
+                "createdAt": row.created_at,
             }
             for row in rows
         ]
@@ -434,15 +553,17 @@ def admin_list_messages(
 @router.delete("/messages/{message_id}")
 def admin_delete_message(
     message_id: str,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     actor: User = Depends(require_roles("admin")),
 ):
-    row = db.query(Message).filter(Message.id == message_id).first()
+    row = db.get(Message, message_id)
     if not row:
         return {"data": {"deleted": False}}
     db.delete(row)
     db.commit()
-    write_audit_log(db, actor_user_id=actor.id, action="message.delete", resource_type="message", resource_id=message_id)
+    queue_audit_log(actor_user_id=actor.id, action="message.delete", resource_type="message", resource_id=message_id)
+    background_tasks.add_task(flush_audit_logs, db.get_bind())
     return {"data": {"deleted": True}}
 
 
@@ -452,20 +573,18 @@ def admin_list_notifications(
     db: Session = Depends(get_db),
     _: User = Depends(require_roles("admin")),
 ):
-    rows = db.query(Notification).order_by(Notification.created_at.desc()).limit(limit).all()
-    return {
-        "data": [
-            {
-                "id": row.id,
-                "userId": row.user_id,
-                "kind": row.kind,
-                "payload": row.payload,
-                "readAt": row.read_at.isoformat() if row.read_at else None,
-                "createdAt": row.created_at.isoformat() if row.created_at else None,
-            }
-            for row in rows
-        ]
-    }
+    rows = db.query(Notification).options(raiseload("*")).order_by(Notification.created_at.desc()).limit(limit).all()
+    return stream_json_data(
+        rows,
+        lambda row: {
+            "id": row.id,
+            "userId": row.user_id,
+            "kind": row.kind,
+            "payload": row.payload,
+            "readAt": row.read_at,
+            "createdAt": row.created_at,
+        },
+    )
 
 
 @router.get("/sessions")
@@ -475,7 +594,7 @@ def admin_list_sessions(
     db: Session = Depends(get_db),
     _: User = Depends(require_roles("admin")),
 ):
-    q = db.query(VisitorSession).order_by(VisitorSession.started_at.desc())
+    q = db.query(VisitorSession).options(raiseload("*")).order_by(VisitorSession.started_at.desc())
     if status:
         q = q.filter(VisitorSession.status == status)
     rows = q.limit(limit).all()
@@ -489,8 +608,8 @@ def admin_list_sessions(
                 "homeownerId": row.homeowner_id,
                 "visitor": row.visitor_label,
                 "status": row.status,
-                "startedAt": row.started_at.isoformat() if row.started_at else None,
-                "endedAt": row.ended_at.isoformat() if row.ended_at else None,
+                "startedAt": row.started_at,
+                "endedAt": row.ended_at,
             }
             for row in rows
         ]
@@ -502,23 +621,14 @@ def admin_analytics(
     db: Session = Depends(get_db),
     _: User = Depends(require_roles("admin")),
 ):
-    return {"data": get_admin_overview(db).get("metrics", {})}
+    return {"data": _cached_admin_overview(db).get("metrics", {})}
 
 
 @router.get("/config")
 def admin_config(
     _: User = Depends(require_roles("admin")),
 ):
-    return {
-        "data": {
-            "environment": settings.ENVIRONMENT,
-            "debug": bool(settings.DEBUG),
-            "paystackConfigured": bool(settings.PAYSTACK_SECRET_KEY and settings.PAYSTACK_PUBLIC_KEY),
-            "vapidConfigured": bool(settings.VAPID_PUBLIC_KEY and settings.VAPID_PRIVATE_KEY),
-            "adminSignupKeySet": bool(settings.ADMIN_SIGNUP_KEY),
-            "frontendBaseUrl": settings.FRONTEND_BASE_URL,
-        }
-    }
+    return {"data": _admin_config_snapshot()}
 
 
 @router.get("/audit")
@@ -537,7 +647,7 @@ def admin_audit(
                 "resourceType": row.resource_type,
                 "resourceId": row.resource_id,
                 "meta": row.meta_json,
-                "createdAt": row.created_at.isoformat() if row.created_at else None,
+                "createdAt": row.created_at,
             }
             for row in rows
         ]
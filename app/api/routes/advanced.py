@@ -387,7 +387,7 @@ def advanced_list_threat_alerts(
                 "category": row.category,
                 "message": row.message,
                 "snapshotAuditId": row.snapshot_audit_id,
-                "createdAt": row.created_at.isoformat() if row.created_at else None,
+                "createdAt": row.created_at,
             }
             for row in rows
         ]
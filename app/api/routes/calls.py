@@ -11,7 +11,7 @@ from app.api.deps import get_optional_current_user
 from app.core.config import get_settings
 from app.core.exceptions import AppException
 from app.db.models import Appointment, CallSession, User, VisitorSession
-from app.db.session import get_db
+from app.db.session import get_cached, get_db
 from app.services.call_service import (
     end_call_session,
     join_call_as_homeowner,
@@ -232,7 +232,7 @@ async def start_call(
     caller_origin = _caller_origin_label(caller_role)
     homeowner_name = ""
     if row.homeowner_id:
-        homeowner = db.query(User).filter(User.id == row.homeowner_id).first()
+        homeowner = get_cached(db, User, row.homeowner_id)
         homeowner_name = (homeowner.full_name if homeowner else "") or ""
 
     if linked_session:
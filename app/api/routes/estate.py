@@ -7,7 +7,6 @@ import json
 import uuid
 
 from fastapi import APIRouter, Depends, Query, Request
-from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.api.deps import require_roles
@@ -16,6 +15,7 @@ from app.core.config import get_settings
 from app.core.exceptions import AppException
 from app.db.models import Estate, User
 from app.db.session import get_db
+from app.schemas.base import RequestPayload
 from app.services.estate_alert_service import (
     create_estate_alert,
     list_estate_alert_payment_overview,
@@ -70,11 +70,11 @@ def _route_context(request: Request, user: User, **extra) -> dict[str, object]:
     }
 
 
-class EstateCreate(BaseModel):
+class EstateCreate(RequestPayload):
     name: str
 
 
-class ArtisanContactPayload(BaseModel):
+class ArtisanContactPayload(RequestPayload):
     id: Optional[str] = None
     name: str
     trade: str
@@ -82,7 +82,7 @@ class ArtisanContactPayload(BaseModel):
     note: str = ""
 
 
-class ArtisanContactsUpdate(BaseModel):
+class ArtisanContactsUpdate(RequestPayload):
     contacts: list[ArtisanContactPayload]
 
 
@@ -127,13 +127,13 @@ def estate_artisan_contacts_update(
     return {"data": contacts}
 
 
-class HomeCreate(BaseModel):
+class HomeCreate(RequestPayload):
     name: str
     estateId: Optional[str] = None
     homeownerId: str
 
 
-class EstateHomeownerCreate(BaseModel):
+class EstateHomeownerCreate(RequestPayload):
     estateId: str
     fullName: str
     email: str
@@ -142,7 +142,7 @@ class EstateHomeownerCreate(BaseModel):
     doorName: Optional[str] = None
 
 
-class EstateDoorCreate(BaseModel):
+class EstateDoorCreate(RequestPayload):
     estateId: str
     homeId: str
     name: str
@@ -151,7 +151,7 @@ class EstateDoorCreate(BaseModel):
     plan: str = "single"
 
 
-class EstateProvisionDoorCreate(BaseModel):
+class EstateProvisionDoorCreate(RequestPayload):
     estateId: str
     homeName: str
     doorName: str
@@ -160,22 +160,22 @@ class EstateProvisionDoorCreate(BaseModel):
     homeownerPassword: str
 
 
-class DoorAssignPayload(BaseModel):
+class DoorAssignPayload(RequestPayload):
     homeownerId: str
 
 
-class EstateSharedQrCreatePayload(BaseModel):
+class EstateSharedQrCreatePayload(RequestPayload):
     estateId: str
 
 
-class DoorAdminProfileUpdatePayload(BaseModel):
+class DoorAdminProfileUpdatePayload(RequestPayload):
     doorName: Optional[str] = None
     homeownerName: Optional[str] = None
     homeownerEmail: Optional[str] = None
     newPassword: Optional[str] = None
 
 
-class EstateAlertCreatePayload(BaseModel):
+class EstateAlertCreatePayload(RequestPayload):
     estateId: str
     title: str
     description: str = ""
@@ -186,15 +186,15 @@ class EstateAlertCreatePayload(BaseModel):
     targetHomeownerIds: Optional[list[str]] = None
 
 
-class MeetingResponsePayload(BaseModel):
+class MeetingResponsePayload(RequestPayload):
     response: str
 
 
-class PollVotePayload(BaseModel):
+class PollVotePayload(RequestPayload):
     optionIndex: int
 
 
-class EstateSettingsPayload(BaseModel):
+class EstateSettingsPayload(RequestPayload):
     reminderFrequencyDays: int
     canApproveWithoutHomeowner: bool = False
     mustNotifyHomeowner: bool = True
@@ -206,7 +206,7 @@ class EstateSettingsPayload(BaseModel):
     suspiciousRejectionThreshold: int = 2
 
 
-class EstateSecurityCreatePayload(BaseModel):
+class EstateSecurityCreatePayload(RequestPayload):
     estateId: str
     fullName: str
     email: str
@@ -215,7 +215,7 @@ class EstateSecurityCreatePayload(BaseModel):
     gateId: Optional[str] = None
 
 
-class EstateSecurityUpdatePayload(BaseModel):
+class EstateSecurityUpdatePayload(RequestPayload):
     fullName: str
     email: str
     phone: Optional[str] = None
@@ -223,19 +223,19 @@ class EstateSecurityUpdatePayload(BaseModel):
     password: Optional[str] = None
 
 
-class EstatePaymentVerifyPayload(BaseModel):
+class EstatePaymentVerifyPayload(RequestPayload):
     homeownerId: str
     paymentMethod: Optional[str] = None
     reference: Optional[str] = None
     receiptUrl: Optional[str] = None
 
 
-class EstateInvitePayload(BaseModel):
+class EstateInvitePayload(RequestPayload):
     temporaryPassword: Optional[str] = None
     unitName: Optional[str] = None
 
 
-class EstateAlertUpdatePayload(BaseModel):
+class EstateAlertUpdatePayload(RequestPayload):
     title: str
     description: str = ""
     targetHomeownerIds: Optional[list[str]] = None
@@ -6,7 +6,7 @@ from fastapi import APIRouter
 
 from app.core.config import get_settings
 from app.core.redis import get_async_redis_health
-from app.services.realtime_config_service import get_turn_diagnostics, webrtc_realtime_configured
+from app.services.realtime_config_service import get_turn_diagnostics
 from app.services.realtime_runtime_service import get_realtime_runtime_snapshot
 from app.socket.manager import socket_state
 
@@ -31,7 +31,8 @@ async def health():
     status = "degraded" if degraded_reasons else "ok"
     return {
         "status": status,
-        "realtimeConfigured": await webrtc_realtime_configured(),
+        # Same value webrtc_realtime_configured() returns, without fetching TURN diagnostics twice.
+        "realtimeConfigured": bool(turn.get("productionReady")),
         "turnConfigured": turn["configured"],
         "turnProductionReady": turn.get("productionReady"),
         "stunUrl": settings.WEBRTC_STUN_URL,
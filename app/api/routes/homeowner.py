@@ -7,10 +7,11 @@ import json
 from fastapi import APIRouter, Depends, File, Query, UploadFile
 from pydantic import BaseModel
 from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.api.deps import require_roles
-from app.db.models import Estate, Home, User
+from app.db.models import Appointment, Estate, Home, User, VisitorSession
 from app.db.session import get_db
 from app.services.homeowner_settings_service import (
     get_homeowner_settings_payload,
@@ -37,9 +38,10 @@ from app.services.appointment_service import (
     create_appointment_share,
     list_homeowner_appointments,
 )
-from app.services.session_service import mark_session_status
+from app.services.session_service import update_session_status_for_homeowner
 from app.core.exceptions import AppException
 from app.services.notification_service import mark_session_notifications_read
+from app.services.realtime_notification_service import dashboard_activity_rooms
 from app.services.security_service import serialize_security_session, update_security_session_status
 from app.socket.server import sio
 from app.core.config import get_settings
@@ -50,6 +52,8 @@ from app.core.time import utc_now
 router = APIRouter()
 settings = get_settings()
 logger = logging.getLogger(__name__)
+# Resolved once so every route shares the same dependency callable.
+_require_homeowner = require_roles("homeowner")
 
 
 class DoorQrCreate(BaseModel):
@@ -60,12 +64,12 @@ class DoorQrCreate(BaseModel):
 @router.get("/artisans")
 def homeowner_artisan_contacts(
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     home = db.query(Home).filter(Home.homeowner_id == user.id, Home.estate_id.is_not(None)).order_by(Home.created_at.desc()).first()
     if not home:
         return {"data": []}
-    estate = db.query(Estate).filter(Estate.id == home.estate_id).first()
+    estate = db.get(Estate, home.estate_id)
     try:
         contacts = json.loads(estate.artisan_contacts_json or "[]") if estate else []
     except Exception:
@@ -151,7 +155,7 @@ class AppointmentCreatePayload(BaseModel):
 @router.get("/visits")
 def homeowner_visits(
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     return {"data": list_homeowner_visits(db, homeowner_id=user.id)}
 
@@ -159,7 +163,7 @@ def homeowner_visits(
 @router.get("/appointments")
 def homeowner_appointments(
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     return {"data": list_homeowner_appointments(db, homeowner_id=user.id)}
 
@@ -168,7 +172,7 @@ def homeowner_appointments(
 def homeowner_create_appointment(
     payload: AppointmentCreatePayload,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     data = create_appointment(
         db,
@@ -191,7 +195,7 @@ def homeowner_create_appointment(
 def homeowner_share_appointment(
     appointment_id: str,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     return {"data": create_appointment_share(db, homeowner_id=user.id, appointment_id=appointment_id)}
 
@@ -199,7 +203,7 @@ def homeowner_share_appointment(
 @router.get("/context")
 def homeowner_context(
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     return {"data": get_homeowner_context(db, homeowner_id=user.id)}
 
@@ -207,7 +211,7 @@ def homeowner_context(
 @router.get("/messages")
 def homeowner_messages(
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     try:
         return {"data": list_homeowner_message_threads(db, homeowner_id=user.id)}
@@ -222,7 +226,7 @@ def homeowner_messages(
 def homeowner_session_messages(
     session_id: str,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     try:
         rows = list_homeowner_session_messages(db, homeowner_id=user.id, session_id=session_id)
@@ -239,7 +243,7 @@ async def homeowner_send_message(
     session_id: str,
     payload: HomeownerMessagePayload,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     data = create_homeowner_session_message(
         db,
@@ -288,7 +292,7 @@ async def homeowner_upload_payment_proof(
     alert_id: str,
     media: UploadFile = File(...),
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     data = await media.read()
     payload = attach_alert_payment_proof(
@@ -307,7 +311,7 @@ def homeowner_delete_message(
     session_id: str,
     message_id: str,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     deleted = delete_homeowner_session_message(
         db,
@@ -323,7 +327,7 @@ def homeowner_delete_message(
 @router.get("/doors")
 def homeowner_doors(
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     data = get_homeowner_doors_data(db, homeowner_id=user.id)
     if isinstance(data, dict):
@@ -337,7 +341,7 @@ def homeowner_doors(
 def homeowner_create_door(
     payload: HomeownerDoorCreate,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     data = create_homeowner_door(
         db=db,
@@ -355,7 +359,7 @@ def homeowner_generate_door_qr(
     door_id: str,
     payload: DoorQrCreate,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     data = generate_homeowner_door_qr(
         db=db,
@@ -371,7 +375,7 @@ def homeowner_generate_door_qr(
 def homeowner_maintenance_request(
     payload: MaintenanceRequestPayload,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     data = create_homeowner_maintenance_request(
         db=db,
@@ -385,7 +389,7 @@ def homeowner_maintenance_request(
 @router.get("/settings")
 def homeowner_settings(
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     return {"data": get_homeowner_settings_payload(db, user.id)}
 
@@ -394,7 +398,7 @@ def homeowner_settings(
 def homeowner_contact_user_search(
     email: str = Query(..., min_length=3),
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     normalized_email = str(email or "").strip().lower()
     if not normalized_email:
@@ -428,7 +432,7 @@ def homeowner_contact_user_search(
 def homeowner_join_estate(
     payload: JoinEstatePayload,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     data = join_estate_by_token(
         db=db,
@@ -443,7 +447,7 @@ def homeowner_join_estate(
 def homeowner_update_settings(
     payload: HomeownerSettingsUpdate,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     updated = update_homeowner_settings(
         db=db,
@@ -474,7 +478,7 @@ def homeowner_update_settings(
 def homeowner_update_profile(
     payload: HomeownerProfileUpdate,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     user.full_name = (payload.fullName or "").strip() or user.full_name
     user.phone = (payload.phone or "").strip() or None
@@ -494,7 +498,7 @@ def homeowner_update_profile(
 @router.get("/access-passes")
 def homeowner_access_passes(
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     return {"data": list_homeowner_access_passes(db, homeowner_id=user.id)}
 
@@ -503,7 +507,7 @@ def homeowner_access_passes(
 def homeowner_create_access_pass(
     payload: AccessPassCreatePayload,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     data = create_homeowner_access_pass(
         db,
@@ -522,7 +526,7 @@ def homeowner_create_access_pass(
 def homeowner_deactivate_access_pass(
     access_pass_id: str,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     return {"data": deactivate_access_pass(db, homeowner_id=user.id, access_pass_id=access_pass_id)}
 
@@ -532,7 +536,7 @@ async def homeowner_visit_decision(
     session_id: str,
     payload: VisitDecisionPayload,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     action = (payload.action or "").strip().lower()
     if action not in {"approve", "reject"}:
@@ -540,9 +544,8 @@ async def homeowner_visit_decision(
     if payload.communicationChannel and str(payload.communicationChannel).strip().lower() not in {"chat", "audio", "video"}:
         raise AppException("communicationChannel must be chat, audio, or video", status_code=400)
 
-    from app.db.models import VisitorSession
 
-    session = db.query(VisitorSession).filter(VisitorSession.id == session_id, VisitorSession.homeowner_id == user.id).first()
+    session = db.scalar(select(VisitorSession).where(VisitorSession.id == session_id, VisitorSession.homeowner_id == user.id))
     if not session:
         raise AppException("Visit not found", status_code=404)
     if session.status not in {"submitted", "pending", "forwarded", "handled_by_security", "received_by_security", "forwarded_to_homeowner"} and action in {"approve", "reject"}:
@@ -584,6 +587,7 @@ async def homeowner_visit_decision(
                 ]
             }
         },
+        room=dashboard_activity_rooms(session.homeowner_id, session.estate_id),
         namespace=settings.DASHBOARD_NAMESPACE,
     )
     await sio.emit(
@@ -639,27 +643,18 @@ async def homeowner_visit_decision(
 async def homeowner_end_visit(
     session_id: str,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner")),
+    user: User = Depends(_require_homeowner),
 ):
     from datetime import datetime
-    from app.db.models import Appointment, VisitorSession
 
-    session = (
-        db.query(VisitorSession)
-        .filter(VisitorSession.id == session_id, VisitorSession.homeowner_id == user.id)
-        .first()
-    )
-    if not session:
-        raise AppException("Visit not found", status_code=404)
-
-    updated = mark_session_status(db, session_id=session_id, status="closed")
+    updated = update_session_status_for_homeowner(db, session_id=session_id, homeowner_id=user.id, status="closed")
     if not updated:
         raise AppException("Visit not found", status_code=404)
 
-    if session.appointment_id:
+    if updated.appointment_id:
         appointment = (
             db.query(Appointment)
-            .filter(Appointment.id == session.appointment_id, Appointment.homeowner_id == user.id)
+            .filter(Appointment.id == updated.appointment_id, Appointment.homeowner_id == user.id)
             .first()
         )
         if appointment and appointment.status not in {"completed", "cancelled", "expired"}:
@@ -685,7 +680,7 @@ async def homeowner_end_visit(
         db,
         user_id=user.id,
         session_id=session_id,
-        appointment_id=session.appointment_id,
+        appointment_id=updated.appointment_id,
     )
 
     await sio.emit(
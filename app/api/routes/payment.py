@@ -8,6 +8,7 @@ from typing import Optional
 from app.api.deps import get_current_user, require_roles
 from app.core.config import get_settings
 from app.core.exceptions import AppException
+from app.core.responses import cacheable_json
 from app.db.models import Subscription, User
 from app.db.session import get_db
 from app.services.payment_service import (
@@ -17,6 +18,7 @@ from app.services.payment_service import (
     get_referral_summary,
     handle_paystack_webhook,
     initialize_paystack_transaction_db,
+    new_paystack_webhook_mac,
     list_subscription_plans,
     list_payment_purposes,
     get_plan_or_raise,
@@ -25,6 +27,10 @@ from app.services.payment_service import (
 
 router = APIRouter()
 settings = get_settings()
+# Resolved once so every route shares the same dependency callable.
+_require_admin = require_roles("admin")
+_require_account_owner = require_roles("homeowner", "estate")
+_CATALOG_MAX_AGE_SECONDS = 60
 
 
 class PaymentPurposeCreate(BaseModel):
@@ -52,7 +58,7 @@ class PaystackInitializePayload(BaseModel):
 def payment_create_purpose(
     payload: PaymentPurposeCreate,
     db: Session = Depends(get_db),
-    _: User = Depends(require_roles("admin")),
+    _: User = Depends(_require_admin),
 ):
     purpose = create_payment_purpose(db, payload.name, payload.description, payload.accountInfo)
     return {"data": {"id": purpose.id, "name": purpose.name}}
@@ -62,7 +68,7 @@ def payment_create_purpose(
 def payment_activate_subscription(
     payload: SubscriptionActivate,
     db: Session = Depends(get_db),
-    _: User = Depends(require_roles("admin")),
+    _: User = Depends(_require_admin),
 ):
     get_plan_or_raise(db, payload.plan, include_inactive=True)
     sub = activate_subscription(db, payload.userId, payload.plan)
@@ -71,21 +77,27 @@ def payment_activate_subscription(
 
 @router.get("/purposes")
 def payment_list_purposes(
+    request: Request,
     db: Session = Depends(get_db),
     _: User = Depends(get_current_user),
 ):
     rows = list_payment_purposes(db)
-    return {
-        "data": [
-            {
-                "id": row.id,
-                "name": row.name,
-                "description": row.description,
-                "accountInfo": row.account_info,
-            }
-            for row in rows
-        ]
-    }
+    return cacheable_json(
+        request,
+        {
+            "data": [
+                {
+                    "id": row.id,
+                    "name": row.name,
+                    "description": row.description,
+                    "accountInfo": row.account_info,
+                }
+                for row in rows
+            ]
+        },
+        max_age=_CATALOG_MAX_AGE_SECONDS,
+        private=True,
+    )
 
 
 @router.get("/subscription/me")
@@ -106,16 +118,17 @@ def payment_referral_me(
 
 @router.get("/plans")
 def payment_plans(
+    request: Request,
     db: Session = Depends(get_db),
 ):
-    return {"data": list_subscription_plans(db)}
+    return cacheable_json(request, {"data": list_subscription_plans(db)}, max_age=_CATALOG_MAX_AGE_SECONDS)
 
 
 @router.post("/paystack/initialize")
 def payment_paystack_initialize(
     payload: PaystackInitializePayload,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner", "estate")),
+    user: User = Depends(_require_account_owner),
 ):
     subscription = get_effective_subscription(db, user.id, user_role=user.role.value)
     if user.role.value == "homeowner" and subscription.get("managedByEstate"):
@@ -135,7 +148,7 @@ def payment_paystack_initialize(
 def payment_paystack_verify(
     reference: str,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner", "estate")),
+    user: User = Depends(_require_account_owner),
 ):
     data = verify_paystack_and_activate(db=db, reference=reference, user_id=user.id)
     return {"data": data}
@@ -145,7 +158,7 @@ def payment_paystack_verify(
 def payment_request_subscription(
     payload: SubscriptionRequest,
     db: Session = Depends(get_db),
-    user: User = Depends(require_roles("homeowner", "estate")),
+    user: User = Depends(_require_account_owner),
 ):
     subscription = get_effective_subscription(db, user.id, user_role=user.role.value)
     if user.role.value == "homeowner" and subscription.get("managedByEstate"):
@@ -181,10 +194,15 @@ async def payment_paystack_webhook(
     x_paystack_signature: Optional[str] = Header(default=None),
     db: Session = Depends(get_db),
 ):
-    raw = await request.body()
+    mac = new_paystack_webhook_mac(x_paystack_signature)
+    chunks: list[bytes] = []
+    async for chunk in request.stream():
+        mac.update(chunk)
+        chunks.append(chunk)
     data = handle_paystack_webhook(
         db=db,
-        raw_body=raw,
+        raw_body=b"".join(chunks),
         signature=x_paystack_signature,
+        computed_signature=mac.hexdigest(),
     )
     return {"data": data}
@@ -15,6 +15,7 @@ from typing import Optional
 from app.core.config import get_settings
 from app.core.exceptions import AppException
 from app.api.deps import get_optional_current_user
+from app.db.models import CallSession, Door, Estate, Home, Message, User, UserRole, VisitorSession
 from app.db.session import get_db
 from app.schemas.visitor import VisitorRequestCreate
 from app.services.appointment_service import (
@@ -34,6 +35,7 @@ from app.services.office_service import get_office_visitor_call_status, record_o
 from app.services.realtime_notification_service import (
     build_notification_envelope,
     build_notification_idempotency_key,
+    dashboard_activity_rooms,
     emit_dashboard_notification,
     emit_signaling_notification,
 )
@@ -46,6 +48,9 @@ settings = get_settings()
 logger = logging.getLogger(__name__)
 VISITOR_CONSENT_MAX_AGE_HOURS = max(1, int(getattr(settings, "VISITOR_CONSENT_MAX_AGE_HOURS", 24) or 24))
 MAX_VISITOR_SNAPSHOT_BYTES = max(1, int(getattr(settings, "MAX_VISITOR_SNAPSHOT_BYTES", 3 * 1024 * 1024) or 3 * 1024 * 1024))
+# Per-row lookups for message serialization; any other sender is presented as the visitor.
+_MESSAGE_SENDER_ROLE = {"homeowner": "homeowner"}
+_MESSAGE_SENDER_LABEL = {"homeowner": "Homeowner"}
 
 
 class VisitorAppointmentAcceptPayload(BaseModel):
@@ -100,7 +105,7 @@ def _serialize_call_session(call_session) -> dict[str, object]:
 
 
 def _serialize_message_row(message_row, *, visitor_label: str) -> dict[str, object]:
-    sender_role = "homeowner" if message_row.sender_type == "homeowner" else "visitor"
+    sender_role = _MESSAGE_SENDER_ROLE.get(message_row.sender_type, "visitor")
     return {
         "messageId": message_row.id,
         "id": message_row.id,
@@ -112,7 +117,7 @@ def _serialize_message_row(message_row, *, visitor_label: str) -> dict[str, obje
         "senderRole": sender_role,
         "senderType": sender_role,
         "senderId": message_row.sender_id,
-        "displayName": "Homeowner" if sender_role == "homeowner" else (visitor_label or "Visitor"),
+        "displayName": _MESSAGE_SENDER_LABEL.get(sender_role) or visitor_label or "Visitor",
         "visitorName": visitor_label or "Visitor",
         "timestamp": message_row.created_at.isoformat(),
         "at": message_row.created_at.isoformat(),
@@ -143,7 +148,6 @@ def _build_placeholder_snapshot_payload() -> tuple[str, str]:
 
 
 def _resolve_session_messages(db: Session, *, session) -> list[dict[str, object]]:
-    from app.db.models import Message
 
     rows = (
         db.query(Message)
@@ -189,7 +193,6 @@ def _resolve_session_snapshot_url(db: Session, session) -> str:
 
 
 def _resolve_active_call(db: Session, *, session_id: str):
-    from app.db.models import CallSession
 
     return (
         db.query(CallSession)
@@ -201,7 +204,6 @@ def _resolve_active_call(db: Session, *, session_id: str):
 
 
 def _resolve_latest_call(db: Session, *, session_id: str):
-    from app.db.models import CallSession
 
     return (
         db.query(CallSession)
@@ -275,7 +277,6 @@ async def visitor_request(payload: VisitorRequestCreate, db: Session = Depends(g
         _validate_visitor_consent(payload)
         request_id = str(payload.requestId or "").strip() or None
         if request_id:
-            from app.db.models import VisitorSession
 
             existing = (
                 db.query(VisitorSession)
@@ -293,9 +294,8 @@ async def visitor_request(payload: VisitorRequestCreate, db: Session = Depends(g
                 )
                 visitor_token = issue_visitor_session_token(db, session=existing)
                 snapshot_url = str(existing.snapshot_url or existing.photo_url or "").strip() or None
-                from app.db.models import Door
 
-                door = db.query(Door).filter(Door.id == existing.door_id).first()
+                door = db.get(Door, existing.door_id)
                 return {
                     "data": {
                         "sessionId": existing.id,
@@ -569,10 +569,11 @@ async def visitor_request(payload: VisitorRequestCreate, db: Session = Depends(g
 
         phase = "create_notification"
         from app.services.notification_service import create_notification
-        from app.db.models import Door
 
-        door = db.query(Door).filter(Door.id == session.door_id).first()
+        door = db.get(Door, session.door_id)
         door_name = door.name if door else ""
+        visitor_display_name = session.visitor_label or "Visitor"
+        session_snapshot_url = session.snapshot_url or session.photo_url
 
         create_notification(
             db=db,
@@ -583,46 +584,46 @@ async def visitor_request(payload: VisitorRequestCreate, db: Session = Depends(g
                 "visitorSessionId": session.id,
                 "doorId": session.door_id,
                 "doorName": door_name,
-                "visitorName": session.visitor_label or "Visitor",
+                "visitorName": visitor_display_name,
                 "phoneNumber": session.visitor_phone or "",
                 "purpose": session.purpose or "",
-                "photoUrl": session.snapshot_url or session.photo_url,
-                "snapshotUrl": session.snapshot_url or session.photo_url,
-                "imageUrl": session.snapshot_url or session.photo_url,
-                "fileUrl": session.snapshot_url or session.photo_url,
-                "snapshot_url": session.snapshot_url or session.photo_url,
-                "photo_url": session.snapshot_url or session.photo_url,
-                "image_url": session.snapshot_url or session.photo_url,
-                "file_url": session.snapshot_url or session.photo_url,
+                "photoUrl": session_snapshot_url,
+                "snapshotUrl": session_snapshot_url,
+                "imageUrl": session_snapshot_url,
+                "fileUrl": session_snapshot_url,
+                "snapshot_url": session_snapshot_url,
+                "photo_url": session_snapshot_url,
+                "image_url": session_snapshot_url,
+                "file_url": session_snapshot_url,
                 "snapshotAuditId": snapshot_audit.get("id") if isinstance(snapshot_audit, dict) else None,
                 "metadata": {
-                    "snapshotUrl": session.snapshot_url or session.photo_url,
-                    "photoUrl": session.snapshot_url or session.photo_url,
-                    "imageUrl": session.snapshot_url or session.photo_url,
-                    "fileUrl": session.snapshot_url or session.photo_url,
+                    "snapshotUrl": session_snapshot_url,
+                    "photoUrl": session_snapshot_url,
+                    "imageUrl": session_snapshot_url,
+                    "fileUrl": session_snapshot_url,
                     "snapshotAuditId": snapshot_audit.get("id") if isinstance(snapshot_audit, dict) else None,
                     "doorName": door_name,
                 },
                 "requestPayload": {
-                    "snapshotUrl": session.snapshot_url or session.photo_url,
-                    "photoUrl": session.snapshot_url or session.photo_url,
-                    "imageUrl": session.snapshot_url or session.photo_url,
-                    "fileUrl": session.snapshot_url or session.photo_url,
+                    "snapshotUrl": session_snapshot_url,
+                    "photoUrl": session_snapshot_url,
+                    "imageUrl": session_snapshot_url,
+                    "fileUrl": session_snapshot_url,
                     "snapshotAuditId": snapshot_audit.get("id") if isinstance(snapshot_audit, dict) else None,
                     "doorName": door_name,
                 },
                 "payload": {
-                    "snapshotUrl": session.snapshot_url or session.photo_url,
-                    "photoUrl": session.snapshot_url or session.photo_url,
-                    "imageUrl": session.snapshot_url or session.photo_url,
-                    "fileUrl": session.snapshot_url or session.photo_url,
+                    "snapshotUrl": session_snapshot_url,
+                    "photoUrl": session_snapshot_url,
+                    "imageUrl": session_snapshot_url,
+                    "fileUrl": session_snapshot_url,
                     "snapshotAuditId": snapshot_audit.get("id") if isinstance(snapshot_audit, dict) else None,
                     "doorName": door_name,
                 },
                 "estateId": session.estate_id,
                 "requestSource": session.request_source or "visitor_qr",
                 "creatorRole": session.creator_role or "visitor",
-                "message": f"New visitor request from {session.visitor_label or 'Visitor'}",
+                "message": f"New visitor request from {visitor_display_name}",
             },
             idempotency_key=build_notification_idempotency_key(
                 event_type="visitor.request",
@@ -650,6 +651,7 @@ async def visitor_request(payload: VisitorRequestCreate, db: Session = Depends(g
                     ]
                 }
             },
+            room=dashboard_activity_rooms(session.homeowner_id, session.estate_id),
             namespace=settings.DASHBOARD_NAMESPACE,
         )
         await sio.emit(
@@ -714,10 +716,10 @@ async def visitor_request(payload: VisitorRequestCreate, db: Session = Depends(g
                 "visitorName": session.visitor_label or effective_visitor_name,
                 "phoneNumber": session.visitor_phone or payload.phoneNumber or "",
                 "purpose": session.purpose or payload.purpose or "",
-                "snapshotUrl": session.snapshot_url or session.photo_url,
-                "photoUrl": session.snapshot_url or session.photo_url,
-                "imageUrl": session.snapshot_url or session.photo_url,
-                "fileUrl": session.snapshot_url or session.photo_url,
+                "snapshotUrl": session_snapshot_url,
+                "photoUrl": session_snapshot_url,
+                "imageUrl": session_snapshot_url,
+                "fileUrl": session_snapshot_url,
                 "doorName": door_name,
             }
         }
@@ -809,9 +811,8 @@ def visitor_accept_appointment(
         raise AppException("Appointment mismatch.", status_code=400)
     session_id = str(data.get("sessionId") or "").strip()
     if session_id:
-        from app.db.models import VisitorSession
 
-        session = db.query(VisitorSession).filter(VisitorSession.id == session_id).first()
+        session = db.get(VisitorSession, session_id)
         if session:
             data["visitorToken"] = rotate_visitor_session_token(db, session=session)
     return {"data": data}
@@ -846,6 +847,7 @@ async def visitor_appointment_arrival(
                 ]
             }
         },
+        room=dashboard_activity_rooms(data.get("homeownerId")),
         namespace=settings.DASHBOARD_NAMESPACE,
     )
     arrival_key = build_notification_idempotency_key(
@@ -899,9 +901,8 @@ def visitor_session_status(
     db: Session = Depends(get_db),
     user=Depends(get_optional_current_user),
 ):
-    from app.db.models import VisitorSession
     logger.info("visitor.session_status.request session_id=%s has_user=%s", session_id, bool(user))
-    row = db.query(VisitorSession).filter(VisitorSession.id == session_id).first()
+    row = db.get(VisitorSession, session_id)
     if not row:
         logger.warning("visitor.session_status.not_found session_id=%s", session_id)
         raise AppException("Session not found", status_code=404, code="VISITOR_SESSION_NOT_FOUND")
@@ -910,7 +911,6 @@ def visitor_session_status(
     if user is None:
         require_visitor_session_access(db, session=row, visitor_token=visitorToken or x_visitor_token)
     else:
-        from app.db.models import Estate, UserRole
 
         if user.role == UserRole.admin:
             pass
@@ -973,10 +973,9 @@ def visitor_session_messages(
     db: Session = Depends(get_db),
     user=Depends(get_optional_current_user),
 ):
-    from app.db.models import Message, VisitorSession
 
     logger.info("visitor.session_messages.request session_id=%s has_user=%s", session_id, bool(user))
-    session = db.query(VisitorSession).filter(VisitorSession.id == session_id).first()
+    session = db.get(VisitorSession, session_id)
     if not session:
         logger.warning("visitor.session_messages.not_found session_id=%s", session_id)
         raise AppException("Session not found", status_code=404, code="VISITOR_SESSION_NOT_FOUND")
@@ -984,7 +983,6 @@ def visitor_session_messages(
     if user is None:
         require_visitor_session_access(db, session=session, visitor_token=visitorToken or x_visitor_token)
     else:
-        from app.db.models import Estate, UserRole
 
         if user.role == UserRole.admin:
             pass
@@ -1003,8 +1001,9 @@ def visitor_session_messages(
         else:
             raise AppException("Not authorized to access this session.", status_code=403)
 
+    # Only the rendered columns: skips hydrating Message entities and the read-receipt fields.
     rows = (
-        db.query(Message)
+        db.query(Message.id, Message.session_id, Message.sender_type, Message.body, Message.created_at)
         .filter(Message.session_id == session_id)
         .order_by(Message.created_at.asc())
         .all()
@@ -1027,8 +1026,8 @@ def visitor_session_messages(
             "visitorPhone": session.visitor_phone or "",
             "purpose": session.purpose or "",
             "doorId": session.door_id,
-            "timestamp": session.started_at.isoformat() if session.started_at else None,
-            "at": session.started_at.isoformat() if session.started_at else None,
+            "timestamp": session.started_at,
+            "at": session.started_at,
             "persisted": True,
         }
     serialized_rows = [
@@ -1040,11 +1039,11 @@ def visitor_session_messages(
             "messageType": "text",
             "snapshotUrl": None,
             "photoUrl": None,
-            "senderRole": "homeowner" if message_row.sender_type == "homeowner" else "visitor",
+            "senderRole": _MESSAGE_SENDER_ROLE.get(message_row.sender_type, "visitor"),
             "senderType": message_row.sender_type,
-            "displayName": "Homeowner" if message_row.sender_type == "homeowner" else "Visitor",
-            "timestamp": message_row.created_at.isoformat(),
-            "at": message_row.created_at.isoformat(),
+            "displayName": _MESSAGE_SENDER_LABEL.get(message_row.sender_type, "Visitor"),
+            "timestamp": message_row.created_at,
+            "at": message_row.created_at,
         }
         for message_row in rows
     ]
@@ -1063,10 +1062,9 @@ async def visitor_send_session_message(
     x_visitor_token: Optional[str] = Header(default=None, alias="X-Visitor-Token"),
     db: Session = Depends(get_db),
 ):
-    from app.db.models import VisitorSession
 
     logger.info("visitor.session_message.send session_id=%s has_visitor_token=%s", session_id, bool(visitorToken or x_visitor_token))
-    session = db.query(VisitorSession).filter(VisitorSession.id == session_id).first()
+    session = db.get(VisitorSession, session_id)
     if not session:
         raise AppException("Session not found", status_code=404)
 
@@ -1099,7 +1097,6 @@ async def visitor_send_session_message(
 
 
 def _authorize_session_access(db: Session, *, session, user, visitor_token: Optional[str]) -> None:
-    from app.db.models import Estate, UserRole
 
     if user is None:
         require_visitor_session_access(db, session=session, visitor_token=visitor_token)
@@ -1133,18 +1130,17 @@ def get_visitor_session_contract(
     db: Session = Depends(get_db),
     user=Depends(get_optional_current_user),
 ):
-    from app.db.models import Door, Home, User, VisitorSession
 
-    session = db.query(VisitorSession).filter(VisitorSession.id == visitor_session_id).first()
+    session = db.get(VisitorSession, visitor_session_id)
     if not session:
         raise AppException("Session not found", status_code=404, code="VISITOR_SESSION_NOT_FOUND")
 
     _authorize_session_access(db, session=session, user=user, visitor_token=visitorToken or x_visitor_token)
     active_call = _resolve_active_call(db, session_id=session.id)
     messages = _resolve_session_messages(db, session=session)
-    homeowner = db.query(User).filter(User.id == session.homeowner_id).first()
-    home = db.query(Home).filter(Home.id == session.home_id).first()
-    door = db.query(Door).filter(Door.id == session.door_id).first()
+    homeowner = db.get(User, session.homeowner_id)
+    home = db.get(Home, session.home_id)
+    door = db.get(Door, session.door_id)
 
     return {
         "data": {
@@ -1185,7 +1181,6 @@ def get_visitor_request_thread_contract(
     db: Session = Depends(get_db),
     user=Depends(get_optional_current_user),
 ):
-    from app.db.models import CallSession, Door, Home, User, VisitorSession
 
     session = (
         db.query(VisitorSession)
@@ -1200,9 +1195,9 @@ def get_visitor_request_thread_contract(
     messages = _resolve_session_messages(db, session=session)
     active_call = _resolve_active_call(db, session_id=session.id)
     latest_call = _resolve_latest_call(db, session_id=session.id)
-    homeowner = db.query(User).filter(User.id == session.homeowner_id).first()
-    home = db.query(Home).filter(Home.id == session.home_id).first()
-    door = db.query(Door).filter(Door.id == session.door_id).first()
+    homeowner = db.get(User, session.homeowner_id)
+    home = db.get(Home, session.home_id)
+    door = db.get(Door, session.door_id)
 
     return {
         "data": {
@@ -1245,9 +1240,8 @@ def get_visitor_session_active_call(
     db: Session = Depends(get_db),
     user=Depends(get_optional_current_user),
 ):
-    from app.db.models import VisitorSession
 
-    session = db.query(VisitorSession).filter(VisitorSession.id == visitor_session_id).first()
+    session = db.get(VisitorSession, visitor_session_id)
     if not session:
         raise AppException("Session not found", status_code=404, code="VISITOR_SESSION_NOT_FOUND")
     _authorize_session_access(db, session=session, user=user, visitor_token=visitorToken or x_visitor_token)
@@ -1,16 +1,53 @@
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 router = APIRouter()
 
+# Frames buffered between the reader and writer before the reader stops pulling from the socket.
+_GATEWAY_QUEUE_MAX_FRAMES = 64
+
+
+async def _read_frames(websocket: WebSocket, queue: asyncio.Queue[dict | None]) -> None:
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            break
+        # Echo the frame as received (text or bytes) instead of round-tripping it through str.
+        if message.get("bytes") is not None:
+            await queue.put({"type": "websocket.send", "bytes": message["bytes"]})
+        elif message.get("text") is not None:
+            await queue.put({"type": "websocket.send", "text": message["text"]})
+    await queue.put(None)
+
+
+async def _write_frames(websocket: WebSocket, queue: asyncio.Queue[dict | None]) -> None:
+    while (frame := await queue.get()) is not None:
+        await websocket.send(frame)
+
 
 @router.websocket("/ws/gateway")
 async def websocket_gateway(websocket: WebSocket):
     await websocket.accept()
+    queue: asyncio.Queue[dict | None] = asyncio.Queue(maxsize=_GATEWAY_QUEUE_MAX_FRAMES)
+    tasks = {
+        asyncio.create_task(_read_frames(websocket, queue)),
+        asyncio.create_task(_write_frames(websocket, queue)),
+    }
     try:
-        while True:
-            data = await websocket.receive_text()
-            await websocket.send_text(data)
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        if any(not task.cancelled() and task.exception() is not None for task in done):
+            # One side failed (usually the peer went away); the other would block forever.
+            for task in pending:
+                task.cancel()
+        # A clean reader exit leaves the writer draining queued frames up to its sentinel.
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task in done:
+            task.result()
     except WebSocketDisconnect:
-        return
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -81,6 +81,26 @@ def _strip_wrapping_quotes(value: str) -> str:
     return text
 
 
+@lru_cache(maxsize=8)
+def _parse_cors_origins(raw_origins: str, mandatory: tuple[str, ...]) -> tuple[str, ...]:
+    origins: list[str] = []
+    for raw in raw_origins.split(","):
+        value = _strip_wrapping_quotes(raw)
+        if not value:
+            continue
+        if "://" not in value:
+            value = f"https://{value}"
+        parsed = urlparse(value)
+        if parsed.scheme and parsed.netloc:
+            value = f"{parsed.scheme}://{parsed.netloc}"
+        origins.append(value.rstrip("/"))
+    for required in mandatory:
+        canonical = required.rstrip("/")
+        if canonical not in origins:
+            origins.append(canonical)
+    return tuple(origins)
+
+
 def _coerce_value(default, value):
     if value is None:
         return default
@@ -110,6 +130,9 @@ class Settings(BaseSettings):
     DB_MAX_OVERFLOW: int = 40
     DB_POOL_TIMEOUT_SECONDS: int = 30
     DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # When a PgBouncer sits in front of Postgres, let it own pooling and open connections per checkout.
+    DB_USE_PGBOUNCER: bool = False
 
     REDIS_URL: str = ""
     REDIS_KEY_PREFIX: str = "qring"
@@ -123,8 +146,12 @@ class Settings(BaseSettings):
     CACHE_DASHBOARD_TTL_SECONDS: int = 15
     CACHE_ADMIN_TTL_SECONDS: int = 20
     CACHE_ESTATE_TTL_SECONDS: int = 20
+    # Per-process cache of authenticated users keyed by token subject; 0 disables it.
+    AUTH_USER_CACHE_TTL_SECONDS: int = 30
 
     APP_WORKERS: int = 4
+    # Sync route handlers run in AnyIO's threadpool (40 threads by default); 0 sizes it to the DB pool.
+    THREADPOOL_MAX_WORKERS: int = 0
     PROCESS_ROLE: str = "web"
     RUN_SCHEDULED_JOBS: bool = False
 
@@ -132,6 +159,10 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 20
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 14
+    # argon2id cost for new password hashes. Hashes made with other costs still verify and are re-hashed on login.
+    PASSWORD_HASH_TIME_COST: int = 2
+    PASSWORD_HASH_MEMORY_KIB: int = 65536
+    PASSWORD_HASH_PARALLELISM: int = 2
 
     # CORS_ORIGINS must include all local dev and production domains for frontend access
     CORS_ORIGINS: str = (
@@ -154,15 +185,15 @@ class Settings(BaseSettings):
     # In production, set CORS_ORIGINS / CORS_ALLOW_ORIGIN_REGEX explicitly to your real domain(s).
     CORS_ALLOW_ORIGIN_REGEX: str = (
         r"^(https?|capacitor|ionic)://("
-        r"localhost|127\\.0\\.0\\.1|"
-        r"192\\.168\\.\\d{1,3}\\.\\d{1,3}|"
-        r"10\\.\\d{1,3}\\.\\d{1,3}\\.\\d{1,3}|"
-        r"172\\.(1[6-9]|2\\d|3[0-1])\\.\\d{1,3}\\.\\d{1,3}|"
-        r"qring\\.io|www\\.qring\\.io|"
-        r"staging\\.qring\\.io|"
-        r"useqring\\.online|www\\.useqring\\.online"
-        r"|staging\\.useqring\\.online"
-        r")(\\:\\d+)?$"
+        r"localhost|127\.0\.0\.1|"
+        r"192\.168\.\d{1,3}\.\d{1,3}|"
+        r"10\.\d{1,3}\.\d{1,3}\.\d{1,3}|"
+        r"172\.(1[6-9]|2\d|3[0-1])\.\d{1,3}\.\d{1,3}|"
+        r"qring\.io|www\.qring\.io|"
+        r"staging\.qring\.io|"
+        r"useqring\.online|www\.useqring\.online"
+        r"|staging\.useqring\.online"
+        r")(\:\d+)?$"
     )
 
     SOCKET_PATH: str = "/socket.io"
@@ -235,22 +266,7 @@ class Settings(BaseSettings):
 
     @property
     def cors_origins(self) -> List[str]:
-        origins: list[str] = []
-        for raw in self.CORS_ORIGINS.split(","):
-            value = _strip_wrapping_quotes(raw)
-            if not value:
-                continue
-            if "://" not in value:
-                value = f"https://{value}"
-            parsed = urlparse(value)
-            if parsed.scheme and parsed.netloc:
-                value = f"{parsed.scheme}://{parsed.netloc}"
-            origins.append(value.rstrip("/"))
-        for required in self._MANDATORY_CORS_ORIGINS:
-            canonical = required.rstrip("/")
-            if canonical not in origins:
-                origins.append(canonical)
-        return origins
+        return list(_parse_cors_origins(self.CORS_ORIGINS, tuple(self._MANDATORY_CORS_ORIGINS)))
 
     @property
     def cors_allow_origin_regex(self) -> Optional[str]:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from typing import Any
 
 from app.core.config import Settings
@@ -16,13 +18,20 @@ _DEFAULT_ALLOWED_ORIGINS = (
 )
 
 
-def get_allowed_origins(settings: Settings) -> list[str]:
+@lru_cache(maxsize=8)
+def _allowed_origin_table(configured: tuple[str, ...]) -> tuple[tuple[str, ...], frozenset[str]]:
     origins: list[str] = []
-    for origin in [*settings.cors_origins, *_DEFAULT_ALLOWED_ORIGINS]:
+    for origin in [*configured, *_DEFAULT_ALLOWED_ORIGINS]:
         value = str(origin or "").rstrip("/")
         if value and value not in origins:
             origins.append(value)
-    return origins
+    return tuple(origins), frozenset(origins)
+
+
+def get_allowed_origins(settings: Settings) -> list[str]:
+    # Callers (e.g. the socket server) extend the returned list, so hand out a fresh copy.
+    ordered, _ = _allowed_origin_table(tuple(settings.cors_origins))
+    return list(ordered)
 
 
 def get_cors_settings(settings: Settings) -> dict[str, Any]:
@@ -35,8 +44,18 @@ def get_cors_settings(settings: Settings) -> dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=8)
+def _compiled_origin_regex(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
 def is_allowed_origin(settings: Settings, origin: str | None) -> bool:
     normalized = str(origin or "").rstrip("/")
     if not normalized:
         return False
-    return normalized in get_allowed_origins(settings)
+    _, allowed = _allowed_origin_table(tuple(settings.cors_origins))
+    if normalized in allowed:
+        return True
+    # Mirror CORSMiddleware, which also accepts origins matching allow_origin_regex.
+    pattern = settings.cors_allow_origin_regex
+    return bool(pattern and _compiled_origin_regex(pattern).fullmatch(normalized))
@@ -0,0 +1,102 @@
+"""Local verification of Firebase ID tokens against Google's published signing certificates.
+
+The certificates rotate every few hours and are served with a Cache-Control max-age, so they are
+fetched once, parsed into RSA keys keyed by ``kid`` and reused until that max-age runs out. Each
+verification is then a single RS256 check plus the claim rules Firebase documents for ID tokens.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from threading import Lock
+from typing import Any, Dict
+
+import httpx
+from jose import jwk, jwt
+from jose.backends.base import Key
+
+FIREBASE_CERTS_URL = "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+_DEFAULT_CERTS_MAX_AGE_SECONDS = 60 * 60
+# Minimum gap between certificate downloads that are not due to expiry of a good fetch: unknown kids
+# are attacker-controlled, and a failing endpoint must not be retried by every sign-in.
+_FORCED_REFRESH_COOLDOWN_SECONDS = 60.0
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+logger = logging.getLogger(__name__)
+
+_signing_keys: Dict[str, Key] = {}
+_signing_keys_expire_at = 0.0
+_signing_keys_attempted_at: float | None = None
+_signing_keys_lock = Lock()
+
+
+class SigningKeysUnavailable(RuntimeError):
+    """Google's signing certificates could not be fetched and no cached copy exists."""
+
+
+def _fetch_signing_keys() -> tuple[Dict[str, Key], float]:
+    with httpx.Client(timeout=httpx.Timeout(10.0, connect=5.0)) as client:
+        response = client.get(FIREBASE_CERTS_URL)
+    response.raise_for_status()
+    match = _MAX_AGE_RE.search(response.headers.get("cache-control", ""))
+    max_age = int(match.group(1)) if match else _DEFAULT_CERTS_MAX_AGE_SECONDS
+    keys = {kid: jwk.construct(cert, "RS256") for kid, cert in response.json().items()}
+    return keys, time.monotonic() + max_age
+
+
+def _refresh_due(force_refresh: bool) -> bool:
+    now = time.monotonic()
+    if _signing_keys_attempted_at is not None and now - _signing_keys_attempted_at < _FORCED_REFRESH_COOLDOWN_SECONDS:
+        return False
+    return force_refresh or not _signing_keys or now >= _signing_keys_expire_at
+
+
+def get_signing_keys(force_refresh: bool = False) -> Dict[str, Key]:
+    """Return cached keys, fetching at most once per cooldown; stale keys are served while Google is unreachable."""
+    global _signing_keys, _signing_keys_expire_at, _signing_keys_attempted_at
+    if _refresh_due(force_refresh):
+        with _signing_keys_lock:
+            if _refresh_due(force_refresh):
+                _signing_keys_attempted_at = time.monotonic()
+                try:
+                    _signing_keys, _signing_keys_expire_at = _fetch_signing_keys()
+                except Exception as exc:
+                    logger.warning("Unable to fetch Google signing certificates: %s", exc)
+                    if not _signing_keys:
+                        raise SigningKeysUnavailable("Google signing certificates are unavailable") from exc
+    if not _signing_keys:
+        raise SigningKeysUnavailable("Google signing certificates are unavailable")
+    return _signing_keys
+
+
+def verify_firebase_id_token(id_token: str, project_id: str) -> Dict[str, Any]:
+    """Return the claims of a valid Firebase ID token for ``project_id``; raise ValueError otherwise."""
+    if not project_id:
+        raise ValueError("Firebase project id is not configured")
+    kid = jwt.get_unverified_header(id_token).get("kid")
+    keys = get_signing_keys()
+    if kid not in keys:
+        # A kid we have not seen usually means Google rotated keys before our max-age ran out;
+        # within the cooldown this returns the cached keys and the token is rejected below.
+        keys = get_signing_keys(force_refresh=True)
+    key = keys.get(kid)
+    if key is None:
+        raise ValueError("ID token was signed with an unknown key")
+
+    claims = jwt.decode(
+        id_token,
+        key,
+        algorithms=["RS256"],
+        audience=project_id,
+        issuer=f"https://securetoken.google.com/{project_id}",
+    )
+    subject = claims.get("sub")
+    if not isinstance(subject, str) or not subject or len(subject) > 128:
+        raise ValueError("ID token has an invalid subject")
+    # python-jose only checks that iat is an integer; Firebase also requires it to be in the past.
+    if float(claims.get("iat") or 0) > time.time():
+        raise ValueError("ID token iat is in the future")
+    if float(claims.get("auth_time") or 0) > time.time():
+        raise ValueError("ID token auth_time is in the future")
+    return claims
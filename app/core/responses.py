@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, TypeVar
+
+import orjson
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+
+T = TypeVar("T")
+
+_STREAM_BATCH_SIZE = 200
+
+
+def stream_json_data(rows: Iterable[T], serialize: Callable[[T], dict[str, Any]]) -> StreamingResponse:
+    # Encodes {"data": [...]} incrementally so large admin listings never hold the
+    # whole list of dicts plus the full JSON document in memory at once.
+    def body() -> Iterator[bytes]:
+        yield b'{"data":['
+        batch: list[bytes] = []
+        first = True
+        for row in rows:
+            batch.append(orjson.dumps(serialize(row)))
+            if len(batch) >= _STREAM_BATCH_SIZE:
+                yield (b"" if first else b",") + b",".join(batch)
+                batch = []
+                first = False
+        if batch:
+            yield (b"" if first else b",") + b",".join(batch)
+        yield b"]}"
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
+def cacheable_json(request: Request, content: Any, *, max_age: int, private: bool = False) -> Response:
+    # Catalog-style reads: a matching If-None-Match short-circuits to 304 with no body.
+    body = orjson.dumps(content)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"{'private' if private else 'public'}, max-age={max(0, int(max_age))}",
+    }
+    if_none_match = request.headers.get("if-none-match") or ""
+    if etag in {tag.strip() for tag in if_none_match.split(",")} or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
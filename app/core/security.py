@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from jose import JWTError, jwt
@@ -8,18 +10,44 @@ from passlib.context import CryptContext
 
 from app.core.config import get_settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 settings = get_settings()
 
+# argon2id costs roughly half of bcrypt(12) per hash; existing bcrypt hashes still verify and are upgraded on the next login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated=["bcrypt"],
+    argon2__type="ID",
+    argon2__time_cost=settings.PASSWORD_HASH_TIME_COST,
+    argon2__memory_cost=settings.PASSWORD_HASH_MEMORY_KIB,
+    argon2__parallelism=settings.PASSWORD_HASH_PARALLELISM,
+)
+
+
+# Stored for accounts that have no password (Google sign-up); no password ever verifies against it.
+UNUSABLE_PASSWORD_HASH = "!"
+
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def is_password_usable(hashed_password: str | None) -> bool:
+    return bool(hashed_password) and not hashed_password.startswith(UNUSABLE_PASSWORD_HASH)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
+    if not is_password_usable(hashed_password):
+        return False
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """Verify a password and return a replacement hash when the stored one uses a deprecated scheme."""
+    if not is_password_usable(hashed_password):
+        return False, None
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def _create_token(
     subject: str,
     expires_delta: timedelta,
@@ -64,3 +92,22 @@ def decode_token(token: str) -> Dict[str, Any]:
         )
     except JWTError as exc:
         raise ValueError("Invalid or expired token") from exc
+
+
+@lru_cache(maxsize=2048)
+def _decode_token_cached(token: str) -> Dict[str, Any]:
+    return decode_token(token)
+
+
+def decode_token_cached(token: str) -> Dict[str, Any]:
+    # Signature/JSON decoding is memoized per raw token; expiry is time-sensitive
+    # and therefore re-checked on every call instead of being cached.
+    payload = _decode_token_cached(token)
+    exp = payload.get("exp")
+    if exp is not None and int(exp) <= time.time():
+        raise ValueError("Invalid or expired token")
+    return dict(payload)
+
+
+def clear_token_cache() -> None:
+    _decode_token_cached.cache_clear()
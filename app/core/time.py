@@ -1,3 +1,10 @@
+"""Timestamp convention: every DateTime column stores naive UTC.
+
+Columns are plain ``DateTime`` (``timestamp without time zone``), written from
+``utc_now()`` or the database-side ``app.db.types.UTCNow``, and compared against
+``utc_now()`` in Python. Values only gain tzinfo at the API edge via ``ensure_utc``.
+"""
+
 from __future__ import annotations
 
 from datetime import datetime, timezone
@@ -0,0 +1,22 @@
+"""Apply the runtime schema helpers and data repairs once per deploy.
+
+Usage: ``python -m app.db.migrate`` (after ``alembic upgrade head``). Workers
+started afterwards see the stamped version and skip schema probing; orphaned
+estate alerts are cleaned up here rather than on every worker start.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from app.core.config import get_settings
+from app.main import RUNTIME_SCHEMA_VERSION, bootstrap_database
+
+
+def main() -> None:
+    bootstrap_database(force=True, seed=get_settings().ENVIRONMENT.lower().strip() == "development")
+    logging.getLogger(__name__).info("Runtime schema stamped at version %s.", RUNTIME_SCHEMA_VERSION)
+
+
+if __name__ == "__main__":
+    main()
@@ -73,6 +73,7 @@ _EXPORT_MAP = {
     "PaymentAttempt": "app.db.models.subscription_policy",
     "ReferralReward": "app.db.models.referral_reward",
     "QRCode": "app.db.models.qr_code",
+    "QRCodeDoor": "app.db.models.qr_code",
     "CallSession": "app.db.models.session",
     "EmergencyAlert": "app.db.models.safety",
     "EmergencyAlertEvent": "app.db.models.safety",
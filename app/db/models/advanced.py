@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
 from typing import Optional
 
@@ -8,13 +7,14 @@ from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, Uni
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.db.uuid7 import uuid7_str
 from app.core.time import utc_now
 
 
 class VisitorSnapshotAudit(Base):
     __tablename__ = "visitor_snapshot_audits"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     homeowner_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), index=True)
     visitor_session_id: Mapped[Optional[str]] = mapped_column(
         String(36), ForeignKey("visitor_sessions.id"), nullable=True, index=True
@@ -35,7 +35,7 @@ class VisitorRecognitionProfile(Base):
         UniqueConstraint("homeowner_id", "visitor_key_hash", name="uq_recognition_homeowner_key"),
     )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     homeowner_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), index=True)
     display_name: Mapped[str] = mapped_column(String(120), default="Visitor")
     visitor_key_hash: Mapped[str] = mapped_column(String(128), index=True)
@@ -49,7 +49,7 @@ class VisitorRecognitionProfile(Base):
 class SplitBill(Base):
     __tablename__ = "split_bills"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     owner_user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), index=True)
     title: Mapped[str] = mapped_column(String(150), nullable=False)
     description: Mapped[str] = mapped_column(Text, default="")
@@ -67,7 +67,7 @@ class SplitContribution(Base):
         UniqueConstraint("split_bill_id", "contributor_user_id", name="uq_split_contributor"),
     )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     split_bill_id: Mapped[str] = mapped_column(String(36), ForeignKey("split_bills.id"), index=True)
     contributor_user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), index=True)
     pledged_amount_kobo: Mapped[int] = mapped_column(Integer, default=0)
@@ -80,7 +80,7 @@ class SplitContribution(Base):
 class DigitalReceipt(Base):
     __tablename__ = "digital_receipts"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     owner_user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), index=True)
     reference: Mapped[str] = mapped_column(String(120), index=True)
     amount_kobo: Mapped[int] = mapped_column(Integer, default=0)
@@ -93,7 +93,7 @@ class DigitalReceipt(Base):
 class ThreatAlertLog(Base):
     __tablename__ = "threat_alert_logs"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     homeowner_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), index=True)
     visitor_session_id: Mapped[Optional[str]] = mapped_column(
         String(36), ForeignKey("visitor_sessions.id"), nullable=True, index=True
@@ -110,7 +110,7 @@ class ThreatAlertLog(Base):
 class EmergencySignal(Base):
     __tablename__ = "emergency_signals"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     requester_user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), index=True)
     scope: Mapped[str] = mapped_column(String(40), default="estate")
     message: Mapped[str] = mapped_column(Text, default="")
@@ -122,7 +122,7 @@ class EmergencySignal(Base):
 class CommunityPost(Base):
     __tablename__ = "community_posts"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     author_user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), index=True)
     audience_scope: Mapped[str] = mapped_column(String(40), default="estate")
     title: Mapped[str] = mapped_column(String(160), nullable=False)
@@ -139,7 +139,7 @@ class CommunityPostRead(Base):
         UniqueConstraint("post_id", "reader_user_id", name="uq_community_post_read"),
     )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     post_id: Mapped[str] = mapped_column(String(36), ForeignKey("community_posts.id"), index=True)
     reader_user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), index=True)
     read_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now, index=True)
@@ -151,7 +151,7 @@ class WeeklySummaryLog(Base):
         UniqueConstraint("user_id", "week_start_iso", name="uq_weekly_summary_user_week"),
     )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), index=True)
     week_start_iso: Mapped[str] = mapped_column(String(30), index=True)
     summary_json: Mapped[str] = mapped_column(Text, default="{}")
@@ -164,7 +164,7 @@ class PushSubscription(Base):
         UniqueConstraint("user_id", "provider", "endpoint", name="uq_push_subscription_endpoint"),
     )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), index=True)
     provider: Mapped[str] = mapped_column(String(20), default="fcm", index=True)
     endpoint: Mapped[str] = mapped_column(Text, default="")
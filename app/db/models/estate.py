@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
 from typing import Optional
 
@@ -8,13 +7,14 @@ from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
-from app.core.time import utc_now
+from app.db.types import UTCNow
+from app.db.uuid7 import uuid7_str
 
 
 class Estate(Base):
     __tablename__ = "estates"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     name: Mapped[str] = mapped_column(String(120), nullable=False)
     join_code: Mapped[Optional[str]] = mapped_column(String(24), unique=True, nullable=True, index=True)
     owner_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
@@ -28,22 +28,25 @@ class Estate(Base):
     suspicious_house_threshold: Mapped[int] = mapped_column(Integer, default=3)
     suspicious_rejection_threshold: Mapped[int] = mapped_column(Integer, default=2)
     artisan_contacts_json: Mapped[str] = mapped_column(Text, default="[]")
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTCNow())
 
+    # Collections stay lazy: services batch-load homes/doors with IN queries and list queries apply
+    # raiseload("*"), so eager defaults here would only add a query to every Estate/Home fetch.
     homes = relationship("Home", back_populates="estate", cascade="all, delete-orphan")
 
 
 class Home(Base):
     __tablename__ = "homes"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     name: Mapped[str] = mapped_column(String(120), nullable=False)
     estate_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("estates.id"), nullable=True)
     office_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("offices.id"), nullable=True, index=True)
     homeowner_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTCNow())
 
     estate = relationship("Estate", back_populates="homes")
+    homeowner = relationship("User", foreign_keys=[homeowner_id])
     office = relationship("Office", back_populates="homes", foreign_keys=[office_id])
     doors = relationship("Door", back_populates="home", cascade="all, delete-orphan")
 
@@ -51,7 +54,7 @@ class Home(Base):
 class Door(Base):
     __tablename__ = "doors"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     name: Mapped[str] = mapped_column(String(120), nullable=False)
     home_id: Mapped[str] = mapped_column(String(36), ForeignKey("homes.id"), nullable=False, index=True)
     is_active: Mapped[str] = mapped_column(String(10), default="online")
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
 from enum import Enum
 from typing import Optional
@@ -9,6 +8,7 @@ from sqlalchemy import DateTime, Enum as SqlEnum, ForeignKey, Numeric, String, T
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.db.uuid7 import uuid7_str
 from app.core.time import utc_now
 
 
@@ -29,7 +29,7 @@ class HomeownerPaymentStatus(str, Enum):
 class EstateAlert(Base):
     __tablename__ = "estate_alerts"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     estate_id: Mapped[str] = mapped_column(String(36), ForeignKey("estates.id"), nullable=False, index=True)
     title: Mapped[str] = mapped_column(String(180), nullable=False)
     description: Mapped[str] = mapped_column(Text, default="")
@@ -50,7 +50,7 @@ class EstateAlert(Base):
 class HomeownerPayment(Base):
     __tablename__ = "homeowner_payments"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     estate_alert_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("estate_alerts.id"),
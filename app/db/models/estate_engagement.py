@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
 from enum import Enum
 
@@ -9,6 +8,7 @@ from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.time import utc_now
 from app.db.base import Base
+from app.db.uuid7 import uuid7_str
 
 
 class MeetingResponseType(str, Enum):
@@ -23,7 +23,7 @@ class EstateMeetingResponse(Base):
         UniqueConstraint("estate_alert_id", "resident_id", name="uq_estate_meeting_response"),
     )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     estate_alert_id: Mapped[str] = mapped_column(String(36), ForeignKey("estate_alerts.id"), nullable=False, index=True)
     resident_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
     response: Mapped[MeetingResponseType] = mapped_column(SqlEnum(MeetingResponseType), nullable=False)
@@ -37,7 +37,7 @@ class EstatePollVote(Base):
         UniqueConstraint("estate_alert_id", "resident_id", name="uq_estate_poll_vote"),
     )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     estate_alert_id: Mapped[str] = mapped_column(String(36), ForeignKey("estate_alerts.id"), nullable=False, index=True)
     resident_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
     option_index: Mapped[int] = mapped_column(Integer, nullable=False)
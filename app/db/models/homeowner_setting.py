@@ -1,20 +1,21 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.time import utc_now
 from app.db.base import Base
+from app.db.types import UTCNow
+from app.db.uuid7 import uuid7_str
 
 
 class ResidentSetting(Base):
     __tablename__ = "resident_settings"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, unique=True, index=True)
     push_alerts: Mapped[bool] = mapped_column(Boolean, default=True)
     sound_alerts: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -34,8 +35,8 @@ class ResidentSetting(Base):
     panic_identity_visibility: Mapped[str] = mapped_column(String(24), default="masked")
     safety_home_lat: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     safety_home_lng: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTCNow())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTCNow(), onupdate=UTCNow())
 
 
 # Alias for backward compatibility
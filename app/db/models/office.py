@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
 from typing import Optional
 
@@ -9,12 +8,13 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.time import utc_now
 from app.db.base import Base
+from app.db.uuid7 import uuid7_str
 
 
 class Office(Base):
     __tablename__ = "offices"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     company_name: Mapped[str] = mapped_column(String(160), nullable=False)
     business_email: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     phone_number: Mapped[Optional[str]] = mapped_column(String(40), nullable=True)
@@ -38,7 +38,7 @@ class Office(Base):
 class OfficeMember(Base):
     __tablename__ = "office_members"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     office_id: Mapped[str] = mapped_column(String(36), ForeignKey("offices.id"), nullable=False, index=True)
     user_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("users.id"), nullable=True, index=True)
     full_name: Mapped[str] = mapped_column(String(160), nullable=False)
@@ -58,7 +58,7 @@ class OfficeMember(Base):
 class OfficeAttendanceLog(Base):
     __tablename__ = "office_attendance_logs"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     office_id: Mapped[str] = mapped_column(String(36), ForeignKey("offices.id"), nullable=False, index=True)
     office_member_id: Mapped[str] = mapped_column(String(36), ForeignKey("office_members.id"), nullable=False, index=True)
     user_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("users.id"), nullable=True, index=True)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
 from typing import Optional
 
@@ -8,11 +7,13 @@ from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Numeric, String,
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
-from app.core.time import utc_now
+from app.db.types import UTCNow
+from app.db.uuid7 import uuid7_str
 
 
 class SubscriptionPlan(Base):
     __tablename__ = "subscription_plans"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(String(50), primary_key=True)
     name: Mapped[str] = mapped_column(String(120), nullable=False)
@@ -30,28 +31,28 @@ class SubscriptionPlan(Base):
     enabled_features: Mapped[str] = mapped_column(Text, default="[]")
     restrictions: Mapped[str] = mapped_column(Text, default="[]")
     active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTCNow())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=utc_now,
-        onupdate=utc_now,
+        server_default=UTCNow(),
+        onupdate=UTCNow(),
     )
 
 
 class PaymentPurpose(Base):
     __tablename__ = "payment_purposes"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     name: Mapped[str] = mapped_column(String(120), nullable=False, unique=True)
     description: Mapped[str] = mapped_column(Text, default="")
     account_info: Mapped[str] = mapped_column(Text, default="")
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTCNow())
 
 
 class Subscription(Base):
     __tablename__ = "subscriptions"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
     plan: Mapped[str] = mapped_column(String(50), nullable=False)
     status: Mapped[str] = mapped_column(String(30), default="inactive")
@@ -79,27 +80,28 @@ class Subscription(Base):
 
 class HomeownerWallet(Base):
     __tablename__ = "resident_wallets"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, unique=True, index=True)
     balance: Mapped[float] = mapped_column(Numeric(12, 2), default=0)
     currency: Mapped[str] = mapped_column(String(10), default="NGN")
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTCNow())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=utc_now,
-        onupdate=utc_now,
+        server_default=UTCNow(),
+        onupdate=UTCNow(),
     )
 
 
 class HomeownerWalletTransaction(Base):
     __tablename__ = "resident_wallet_transactions"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
     amount: Mapped[float] = mapped_column(Numeric(12, 2), default=0)
     balance_after: Mapped[float] = mapped_column(Numeric(12, 2), default=0)
     currency: Mapped[str] = mapped_column(String(10), default="NGN")
     type: Mapped[str] = mapped_column(String(40), default="fund")
     note: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTCNow())
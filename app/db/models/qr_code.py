@@ -1,26 +1,63 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.time import utc_now
 from app.db.base import Base
+from app.db.types import UTCNow, ascii_key
+from app.db.uuid7 import uuid7_str
+
+
+class QRCodeDoor(Base):
+    __tablename__ = "qr_code_doors"
+
+    qr_code_id: Mapped[str] = mapped_column(String(36), ForeignKey("qr_codes.id", ondelete="CASCADE"), primary_key=True)
+    door_id: Mapped[str] = mapped_column(String(36), ForeignKey("doors.id", ondelete="CASCADE"), primary_key=True, index=True)
+    # Preserves the order doors were assigned in, which the visitor door picker displays.
+    position: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
 
 class QRCode(Base):
     __tablename__ = "qr_codes"
     __table_args__ = (UniqueConstraint("estate_id", "mode", name="uq_qr_estate_mode"),)
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    qr_id: Mapped[str] = mapped_column(String(64), unique=True, index=True, nullable=False)
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
+    qr_id: Mapped[str] = mapped_column(ascii_key(64), unique=True, index=True, nullable=False)
     plan: Mapped[str] = mapped_column(String(20), default="single")
     home_id: Mapped[str] = mapped_column(String(36), ForeignKey("homes.id"), nullable=False)
-    doors_csv: Mapped[str] = mapped_column(Text, default="")
     mode: Mapped[str] = mapped_column(String(20), default="direct")
     estate_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("estates.id"), nullable=True)
     active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTCNow())
+
+    door_links: Mapped[list[QRCodeDoor]] = relationship(
+        order_by=QRCodeDoor.position,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
+    )
+
+    @property
+    def door_ids(self) -> list[str]:
+        return [link.door_id for link in self.door_links]
+
+    @door_ids.setter
+    def door_ids(self, values: Iterable[str]) -> None:
+        ordered: list[str] = []
+        for value in values:
+            door_id = str(value or "").strip()
+            if door_id and door_id not in ordered:
+                ordered.append(door_id)
+        self.door_links = [QRCodeDoor(door_id=door_id, position=index) for index, door_id in enumerate(ordered)]
+
+    @property
+    def doors_csv(self) -> str:
+        # Comma-joined view kept for callers written against the former doors_csv column.
+        return ",".join(self.door_ids)
+
+    @doors_csv.setter
+    def doors_csv(self, value: str) -> None:
+        self.door_ids = (value or "").split(",")
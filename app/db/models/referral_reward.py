@@ -1,22 +1,22 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
 
 from sqlalchemy import DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.time import utc_now
 from app.db.base import Base
+from app.db.types import UTCNow
+from app.db.uuid7 import uuid7_str
 
 
 class ReferralReward(Base):
     __tablename__ = "referral_rewards"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     referrer_user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
     referred_user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, unique=True, index=True)
     plan_id: Mapped[str] = mapped_column(String(50), nullable=False)
     reward_amount: Mapped[int] = mapped_column(Integer, nullable=False, default=2000)
     currency: Mapped[str] = mapped_column(String(10), nullable=False, default="NGN")
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTCNow())
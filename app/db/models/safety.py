@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
 from enum import Enum
 from typing import Optional
@@ -10,6 +9,7 @@ from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.time import utc_now
 from app.db.base import Base
+from app.db.uuid7 import uuid7_str
 
 
 class EmergencyAlertType(str, Enum):
@@ -72,7 +72,7 @@ class PanicEventStatus(str, Enum):
 class EmergencyAlert(Base):
     __tablename__ = "emergency_alerts"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     estate_id: Mapped[str] = mapped_column(String(36), ForeignKey("estates.id"), nullable=False, index=True)
     home_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("homes.id"), nullable=True, index=True)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
@@ -107,7 +107,7 @@ class EmergencyAlert(Base):
 class PanicEvent(Base):
     __tablename__ = "panic_events"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
     estate_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("estates.id"), nullable=True, index=True)
     home_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("homes.id"), nullable=True, index=True)
@@ -146,7 +146,7 @@ class PanicEvent(Base):
 class PanicAudioSegment(Base):
     __tablename__ = "panic_audio_segments"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     panic_id: Mapped[str] = mapped_column(String(36), ForeignKey("panic_events.id"), nullable=False, index=True)
     uploader_user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
     segment_index: Mapped[int] = mapped_column(Integer, nullable=False, default=0, index=True)
@@ -159,7 +159,7 @@ class PanicAudioSegment(Base):
 class EmergencyAlertEvent(Base):
     __tablename__ = "emergency_alert_events"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     alert_id: Mapped[str] = mapped_column(String(36), ForeignKey("emergency_alerts.id"), nullable=False, index=True)
     actor_user_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("users.id"), nullable=True, index=True)
     event_type: Mapped[str] = mapped_column(String(40), nullable=False, index=True)
@@ -179,7 +179,7 @@ class EmergencyAlertEvent(Base):
 class VisitorReport(Base):
     __tablename__ = "visitor_reports"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     estate_id: Mapped[str] = mapped_column(String(36), ForeignKey("estates.id"), nullable=False, index=True)
     visitor_session_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("visitor_sessions.id"), nullable=True, index=True)
     reporter_user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
@@ -210,7 +210,7 @@ class VisitorReport(Base):
 class WatchlistEntry(Base):
     __tablename__ = "watchlist_entries"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     estate_id: Mapped[str] = mapped_column(String(36), ForeignKey("estates.id"), nullable=False, index=True)
     latest_report_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("visitor_reports.id"), nullable=True, index=True)
     display_name: Mapped[str] = mapped_column(String(120), nullable=False)
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
-from app.core.time import utc_now
+from app.db.types import UTCNow, UUIDKey, ascii_key
+from app.db.uuid7 import uuid7_str
 
 
 class VisitorSession(Base):
@@ -17,14 +17,15 @@ class VisitorSession(Base):
         Index("ix_visitor_sessions_homeowner_started_at", "homeowner_id", "started_at"),
         Index("ix_visitor_sessions_estate_started_at", "estate_id", "started_at"),
         Index("ix_visitor_sessions_status_started_at", "status", "started_at"),
+        Index("ix_visitor_sessions_homeowner_status_started_at", "homeowner_id", "status", "started_at"),
     )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     request_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True)
-    qr_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    qr_id: Mapped[str] = mapped_column(ascii_key(64), nullable=False, index=True)
     home_id: Mapped[str] = mapped_column(String(36), ForeignKey("homes.id"), nullable=False, index=True)
     door_id: Mapped[str] = mapped_column(String(36), ForeignKey("doors.id"), nullable=False, index=True)
-    homeowner_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    homeowner_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
     appointment_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("appointments.id"), nullable=True, index=True)
     visitor_label: Mapped[str] = mapped_column(String(120), default="Visitor")
     status: Mapped[str] = mapped_column(String(40), default="pending")
@@ -66,7 +67,7 @@ class VisitorSession(Base):
     homeowner_decision_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     gate_action_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     state_updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    started_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    started_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTCNow())
     ended_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Visitor-side session authentication (prevents anyone with a leaked UUID from reading messages/joining rooms).
@@ -78,31 +79,45 @@ class Message(Base):
     __tablename__ = "messages"
     __table_args__ = (
         Index("ix_messages_session_created_at", "session_id", "created_at"),
+        # Partial: only still-unread rows are indexed, which is what mark-as-read scans for.
+        Index(
+            "ix_messages_session_unread_by_homeowner",
+            "session_id",
+            postgresql_where=text("read_by_homeowner_at IS NULL"),
+            sqlite_where=text("read_by_homeowner_at IS NULL"),
+        ),
+        Index(
+            "ix_messages_session_unread_by_security",
+            "session_id",
+            postgresql_where=text("read_by_security_at IS NULL"),
+            sqlite_where=text("read_by_security_at IS NULL"),
+        ),
     )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    session_id: Mapped[str] = mapped_column(String(36), ForeignKey("visitor_sessions.id"), nullable=False, index=True)
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True, default=uuid7_str)
+    session_id: Mapped[str] = mapped_column(String(36), ForeignKey("visitor_sessions.id"), nullable=False)
     sender_type: Mapped[str] = mapped_column(String(20), nullable=False)
     sender_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("users.id"), nullable=True, index=True)
     receiver_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("users.id"), nullable=True, index=True)
     body: Mapped[str] = mapped_column(Text, nullable=False)
-    read_by_homeowner_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, index=True)
-    read_by_security_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, index=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    read_by_homeowner_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    read_by_security_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTCNow())
 
 
 class Notification(Base):
     __tablename__ = "notifications"
     __table_args__ = (
         Index("ix_notifications_user_created_at", "user_id", "created_at"),
+        Index("ix_notifications_user_read_created_at", "user_id", "read_at", "created_at"),
     )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(UUIDKey, primary_key=True, default=uuid7_str)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
     kind: Mapped[str] = mapped_column(String(50), nullable=False)
     payload: Mapped[str] = mapped_column(Text, nullable=False)
     read_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTCNow())
 
 
 class CallSession(Base):
@@ -112,7 +127,7 @@ class CallSession(Base):
         Index("ix_call_sessions_status_created_at", "status", "created_at"),
     )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     appointment_id: Mapped[Optional[str]] = mapped_column(
         String(36), ForeignKey("appointments.id"), nullable=True, index=True
     )
@@ -131,5 +146,5 @@ class CallSession(Base):
     initiated_by_role: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, index=True)
     answered_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, index=True)
     ended_reason: Mapped[Optional[str]] = mapped_column(String(40), nullable=True, index=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTCNow(), index=True)
     ended_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, index=True)
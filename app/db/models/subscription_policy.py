@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
@@ -9,13 +8,14 @@ from sqlalchemy import DateTime, ForeignKey, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.db.uuid7 import uuid7_str
 from app.core.time import utc_now
 
 
 class SubscriptionInvoice(Base):
     __tablename__ = "subscription_invoices"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     subscription_id: Mapped[str] = mapped_column(String(36), ForeignKey("subscriptions.id"), index=True, nullable=False)
     provider: Mapped[str] = mapped_column(String(20), default="paystack")
     provider_reference: Mapped[Optional[str]] = mapped_column(String(120), index=True, nullable=True)
@@ -33,7 +33,7 @@ class SubscriptionInvoice(Base):
 class PaymentAttempt(Base):
     __tablename__ = "payment_attempts"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     subscription_id: Mapped[str] = mapped_column(String(36), ForeignKey("subscriptions.id"), index=True, nullable=False)
     invoice_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("subscription_invoices.id"), nullable=True)
     provider: Mapped[str] = mapped_column(String(20), default="paystack")
@@ -49,7 +49,7 @@ class PaymentAttempt(Base):
 class SubscriptionEvent(Base):
     __tablename__ = "subscription_events"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     subscription_id: Mapped[str] = mapped_column(String(36), ForeignKey("subscriptions.id"), index=True, nullable=False)
     event_type: Mapped[str] = mapped_column(String(50), index=True, nullable=False)
     old_status: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
@@ -61,7 +61,7 @@ class SubscriptionEvent(Base):
 class SubscriptionNotification(Base):
     __tablename__ = "subscription_notifications"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     subscription_id: Mapped[str] = mapped_column(String(36), ForeignKey("subscriptions.id"), index=True, nullable=False)
     channel: Mapped[str] = mapped_column(String(20), nullable=False)
     template_key: Mapped[str] = mapped_column(String(80), nullable=False)
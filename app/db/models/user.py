@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import uuid
+import secrets
 from datetime import datetime
 from enum import Enum
 from typing import Optional
@@ -9,7 +9,8 @@ from sqlalchemy import Boolean, DateTime, Enum as SqlEnum, ForeignKey, Integer,
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
-from app.core.time import utc_now
+from app.db.types import UTCNow
+from app.db.uuid7 import uuid7_str
 
 
 class UserRole(str, Enum):
@@ -23,21 +24,29 @@ class UserRole(str, Enum):
 
 class User(Base):
     __tablename__ = "users"
+    # Fetch the server-generated updated_at back with RETURNING instead of expiring it.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7_str)
     full_name: Mapped[str] = mapped_column(String(120), nullable=False)
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
-    role: Mapped[UserRole] = mapped_column(SqlEnum(UserRole), nullable=False, default=UserRole.homeowner)
+    # VARCHAR + CHECK rather than a PostgreSQL enum type, so adding a role is a constraint swap
+    # instead of ALTER TYPE ... ADD VALUE; rows still load as UserRole members.
+    role: Mapped[UserRole] = mapped_column(
+        SqlEnum(UserRole, native_enum=False, create_constraint=True, length=16, name="role"),
+        nullable=False,
+        default=UserRole.homeowner,
+    )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     email_verified: Mapped[bool] = mapped_column(Boolean, default=False)
     phone: Mapped[Optional[str]] = mapped_column(String(40), nullable=True)
     estate_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("estates.id"), nullable=True, index=True)
     gate_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True, index=True)
-    referral_code: Mapped[str] = mapped_column(String(24), unique=True, nullable=False, index=True, default=lambda: f"QR{uuid.uuid4().hex[:8].upper()}")
+    referral_code: Mapped[str] = mapped_column(String(24), unique=True, nullable=False, index=True, default=lambda: f"QR{secrets.token_hex(4).upper()}")
     referred_by_user_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("users.id"), nullable=True, index=True)
     referral_earnings: Mapped[int] = mapped_column(Integer, default=0)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now, onupdate=utc_now)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTCNow(), index=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTCNow(), onupdate=UTCNow())
 
     device_sessions = relationship("DeviceSession", back_populates="user", cascade="all, delete-orphan")
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from sqlalchemy import Column, Integer, String, Table, inspect, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError, IntegrityError
+
+from app.db.base import Base
+
+RUNTIME_SCHEMA_KEY = "runtime_schema"
+
+schema_meta = Table(
+    "schema_meta",
+    Base.metadata,
+    Column("key", String(64), primary_key=True),
+    Column("value", Integer, nullable=False),
+)
+
+
+def get_schema_version(bind: Engine, key: str = RUNTIME_SCHEMA_KEY) -> int:
+    """Return the stored version for ``key``; 0 when the table or row does not exist yet."""
+    try:
+        with bind.connect() as conn:
+            value = conn.execute(select(schema_meta.c.value).where(schema_meta.c.key == key)).scalar_one_or_none()
+    except DBAPIError:
+        # Only a fresh database lacks the table; set_schema_version creates it on first stamp.
+        if inspect(bind).has_table(schema_meta.name):
+            raise
+        return 0
+    return int(value or 0)
+
+
+def set_schema_version(bind: Engine, version: int, key: str = RUNTIME_SCHEMA_KEY) -> None:
+    schema_meta.create(bind=bind, checkfirst=True)
+    try:
+        with bind.begin() as conn:
+            updated = conn.execute(schema_meta.update().where(schema_meta.c.key == key).values(value=version)).rowcount
+            if not updated:
+                conn.execute(schema_meta.insert().values(key=key, value=version))
+    except IntegrityError:
+        # Another worker stamped the row first; it ran the same helpers.
+        pass
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+from typing import Any, TypeVar
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
+ModelT = TypeVar("ModelT")
+
 engine_kwargs = {
-    "pool_pre_ping": True,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
     "future": True,
 }
 
 if settings.database_backend == "sqlite":
     engine_kwargs["connect_args"] = {"check_same_thread": False}
+elif settings.DB_USE_PGBOUNCER:
+    # Connections are fresh per checkout, so a liveness ping would only add a round trip.
+    engine_kwargs.update({"poolclass": NullPool, "pool_pre_ping": False})
 else:
     engine_kwargs.update(
         {
@@ -24,6 +32,10 @@ else:
         }
     )
 
+if settings.DEBUG:
+    # Log checkouts/returns so pool exhaustion is visible while developing.
+    engine_kwargs["echo_pool"] = "debug"
+
 engine = create_engine(settings.database_url, **engine_kwargs)
 
 SessionLocal = sessionmaker(bind=engine, class_=Session, autoflush=False, autocommit=False)
@@ -35,3 +47,16 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_cached(db: Session, model: type[ModelT], pk: Any) -> ModelT | None:
+    """Primary-key lookup that reuses rows already loaded in this session.
+
+    Sessions live for one request, so the identity map doubles as a request-scoped
+    ``(model, pk)`` cache: the current user resolved by auth is returned again here
+    without another SELECT.
+    """
+    if not pk:
+        return None
+    return db.get(model, pk)
+
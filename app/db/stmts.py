@@ -0,0 +1,17 @@
+"""Prebuilt INSERT statements for the highest-volume write paths.
+
+Chat messages, notifications and refresh-token device sessions are written once and never
+touched again in the same request, so callers execute these with explicit values instead of
+going through ``db.add()``: no unit-of-work bookkeeping on flush and no refresh SELECT after
+commit.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import insert
+
+from app.db.models import DeviceSession, Message, Notification
+
+INSERT_DEVICE_SESSION = insert(DeviceSession)
+INSERT_MESSAGE = insert(Message)
+INSERT_NOTIFICATION = insert(Notification)
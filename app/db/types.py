@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import uuid
+from typing import Any, Optional
+
+from sqlalchemy import DateTime, LargeBinary, String
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+
+class UUIDKey(TypeDecorator):
+    """16-byte UUID column that reads and writes canonical ``str`` ids.
+
+    Stored as native ``uuid`` on PostgreSQL and a 16-byte blob elsewhere, so
+    callers keep passing the same string ids they use for ``String(36)`` keys.
+    """
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=False))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if value is None:
+            return None
+        try:
+            parsed = value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+        except ValueError:
+            # A malformed id can never match a stored key; bind NULL so lookups miss instead of erroring.
+            return None
+        if dialect.name == "postgresql":
+            return str(parsed)
+        return parsed.bytes
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Optional[str]:
+        if value is None:
+            return None
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return str(uuid.UUID(bytes=bytes(value)))
+        return str(value)
+
+
+def ascii_key(length: int) -> TypeEngine[str]:
+    """``String(length)`` compared byte-wise: ``COLLATE "C"`` on PostgreSQL, SQLite's default BINARY elsewhere.
+
+    For machine-generated ASCII tokens that are only matched for equality, where
+    locale-aware collation just slows every B-tree comparison.
+    """
+    return String(length).with_variant(String(length, collation="C"), "postgresql")
+
+
+class UTCNow(FunctionElement):
+    """Database-side counterpart of ``app.core.time.utc_now``: a naive UTC timestamp.
+
+    Used as ``server_default``/``onupdate`` so the timestamp is produced by the INSERT or
+    UPDATE itself and comes back through RETURNING instead of being bound from Python.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(UTCNow, "postgresql")
+def _utc_now_postgresql(element: UTCNow, compiler: Any, **kw: Any) -> str:
+    # statement_timestamp() rather than now(): rows written later in one transaction still sort later.
+    return "TIMEZONE('utc', STATEMENT_TIMESTAMP())"
+
+
+@compiles(UTCNow, "sqlite")
+def _utc_now_sqlite(element: UTCNow, compiler: Any, **kw: Any) -> str:
+    # %f is seconds with milliseconds; pad to the six fractional digits SQLAlchemy stores and parses.
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+@compiles(UTCNow)
+def _utc_now_default(element: UTCNow, compiler: Any, **kw: Any) -> str:
+    return "CURRENT_TIMESTAMP"
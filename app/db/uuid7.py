@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """Return an RFC 9562 version 7 UUID: 48-bit Unix ms timestamp followed by 74 random bits.
+
+    Keys generated later sort later, so inserts append to the right edge of the
+    primary-key index instead of landing on random pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    rand_a = rand >> 68  # 12 bits
+    rand_b = rand & ((1 << 62) - 1)  # 62 bits
+    value = (
+        (timestamp_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
+
+def uuid7_str() -> str:
+    return str(uuid7())
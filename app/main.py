@@ -2,16 +2,18 @@
 from __future__ import annotations
 
 import logging
-import uuid
+import secrets
 import asyncio
 import os
 from pathlib import Path
 
+import anyio
 import socketio
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from sqlalchemy import DateTime, inspect, text
+from fastapi.responses import FileResponse, ORJSONResponse
+from sqlalchemy import DateTime, bindparam, insert, inspect, select, text, update
+from sqlalchemy.engine import Connection
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -19,12 +21,15 @@ from app.api.routes import api_router
 from app.core.config import get_settings
 from app.core.cors import get_cors_settings, is_allowed_origin
 from app.core.exceptions import register_exception_handlers
+from app.core.firebase_tokens import get_signing_keys
 from app.core.logging import setup_logging
 from app.core.redis import describe_redis_configuration, get_async_redis_health
 from app.core.security import hash_password
 from app.db.base import Base
-from app.db.models import Door, Home, Notification, QRCode, User, UserRole
+from app.db.models import Door, Estate, Home, Notification, QRCode, QRCodeDoor, User, UserRole
+from app.db.schema_version import get_schema_version, set_schema_version
 from app.db.session import SessionLocal, engine
+from app.db.uuid7 import uuid7_str
 from app.middleware.request_context import RequestContextMiddleware
 from app.middleware.access_control import AccessControlMiddleware
 from app.middleware.input_sanitization import InputSanitizationMiddleware
@@ -35,6 +40,7 @@ from app.services.estate_alert_service import (
     repair_estate_alert_schema,
     run_scheduled_payment_reminders,
 )
+from app.services.provider_integrations import _get_firebase_app
 from app.services.safety_service import create_safety_tables
 from app.services.realtime_config_service import get_turn_diagnostics
 from app.services.realtime_runtime_service import append_startup_diagnostic, mark_realtime_state
@@ -87,7 +93,7 @@ class NormalizeCorsHeadersMiddleware:
 
         await self.app(scope, receive, send_wrapper)
 
-fastapi_app = FastAPI(title=settings.APP_NAME, debug=settings.DEBUG)
+fastapi_app = FastAPI(title=settings.APP_NAME, debug=settings.DEBUG, default_response_class=ORJSONResponse)
 uploads_dir = Path((settings.MEDIA_STORAGE_PATH or "").strip() or default_uploads_dir)
 
 
@@ -260,95 +266,86 @@ async def enforce_visitor_request_size(request: Request, call_next):
 
 
 def _seed_dev_data(db: Session):
-    if db.query(User).count() > 0:
+    # Existence probe: stops at the first row instead of counting the whole table.
+    if db.execute(select(User.id).limit(1)).first() is not None:
         return
 
-    homeowner = User(
-        id=str(uuid.uuid4()),
-        full_name="Demo Homeowner",
-        email="homeowner@useqring.online",
-        password_hash=hash_password("Password123!"),
-        role=UserRole.homeowner,
-        email_verified=True,
-    )
-    admin = User(
-        id=str(uuid.uuid4()),
-        full_name="Demo Admin",
-        email="admin@useqring.online",
-        password_hash=hash_password("Password123!"),
-        role=UserRole.admin,
-        email_verified=True,
-    )
-    estate_user = User(
-        id=str(uuid.uuid4()),
-        full_name="Demo Estate",
-        email="estate@useqring.online",
-        password_hash=hash_password("Password123!"),
-        role=UserRole.estate,
-        email_verified=True,
-    )
-    security_user = User(
-        id=str(uuid.uuid4()),
-        full_name="Demo Gateman",
-        email="security@useqring.online",
-        password_hash=hash_password("Password123!"),
-        role=UserRole.security,
-        email_verified=True,
-        phone="+2347000000000",
-    )
+    # Ids are generated up front so each table is a single bulk INSERT with no intermediate flushes.
+    homeowner_id, admin_id, estate_user_id, security_id = (uuid7_str() for _ in range(4))
+    estate_id, home_id, door_id, qr_code_id = (uuid7_str() for _ in range(4))
+    password_hash = hash_password("Password123!")
+    users = [
+        {"id": homeowner_id, "full_name": "Demo Homeowner", "email": "homeowner@useqring.online", "role": UserRole.homeowner},
+        {"id": admin_id, "full_name": "Demo Admin", "email": "admin@useqring.online", "role": UserRole.admin},
+        {"id": estate_user_id, "full_name": "Demo Estate", "email": "estate@useqring.online", "role": UserRole.estate},
+        {"id": security_id, "full_name": "Demo Gateman", "email": "security@useqring.online", "role": UserRole.security},
+    ]
 
     try:
-        db.add_all([homeowner, admin, estate_user, security_user])
-        db.flush()
-
-        from app.db.models import Estate
-
-        estate = Estate(
-            name="Demo Estate",
-            owner_id=estate_user.id,
-            security_can_approve_without_homeowner=False,
-            security_must_notify_homeowner=True,
-            security_require_photo_verification=True,
-            security_require_call_before_approval=False,
+        db.execute(insert(User), [{**user, "password_hash": password_hash, "email_verified": True} for user in users])
+        db.execute(
+            insert(Estate),
+            [
+                {
+                    "id": estate_id,
+                    "name": "Demo Estate",
+                    "owner_id": estate_user_id,
+                    "security_can_approve_without_homeowner": False,
+                    "security_must_notify_homeowner": True,
+                    "security_require_photo_verification": True,
+                    "security_require_call_before_approval": False,
+                }
+            ],
         )
-        db.add(estate)
-        db.flush()
-
-        security_user.estate_id = estate.id
-        security_user.gate_id = "main-gate"
-
-        home = Home(name="Unit A1", homeowner_id=homeowner.id, estate_id=estate.id)
-        db.add(home)
-        db.flush()
-
-        door = Door(name="Front Door", home_id=home.id, gate_label="Main Gate")
-        db.add(door)
-        db.flush()
-
-        qr = QRCode(
-            qr_id="demo-qr-001",
-            plan="single",
-            home_id=home.id,
-            doors_csv=door.id,
-            mode="direct",
-            active=True,
+        db.execute(
+            update(User)
+            .where(User.id == security_id)
+            .values(estate_id=estate_id, gate_id="main-gate", phone="+2347000000000")
         )
-        db.add(qr)
-
-        notification = Notification(
-            user_id=homeowner.id,
-            kind="system",
-            payload='{"message":"Welcome to Qring. Your first door is ready for QR generation."}',
+        db.execute(insert(Home), [{"id": home_id, "name": "Unit A1", "homeowner_id": homeowner_id, "estate_id": estate_id}])
+        db.execute(insert(Door), [{"id": door_id, "name": "Front Door", "home_id": home_id, "gate_label": "Main Gate"}])
+        db.execute(
+            insert(QRCode),
+            [{"id": qr_code_id, "qr_id": "demo-qr-001", "plan": "single", "home_id": home_id, "mode": "direct", "active": True}],
+        )
+        db.execute(insert(QRCodeDoor), [{"qr_code_id": qr_code_id, "door_id": door_id, "position": 0}])
+        db.execute(
+            insert(Notification),
+            [
+                {
+                    "user_id": homeowner_id,
+                    "kind": "system",
+                    "payload": '{"message":"Welcome to Qring. Your first door is ready for QR generation."}',
+                }
+            ],
         )
-        db.add(notification)
         db.commit()
     except IntegrityError:
         # Another worker/process already inserted seed rows.
         db.rollback()
 
 
+_REFERRAL_BACKFILL_BATCH_SIZE = 1000
+
+
 def _next_referral_code() -> str:
-    return f"QR{uuid.uuid4().hex[:8].upper()}"
+    return f"QR{secrets.token_hex(4).upper()}"
+
+
+def _unused_referral_codes(conn: Connection, count: int) -> list[str]:
+    codes: set[str] = set()
+    while len(codes) < count:
+        candidates = {_next_referral_code() for _ in range(count - len(codes))} - codes
+        taken = set(
+            conn.execute(
+                text("SELECT referral_code FROM users WHERE referral_code IN :codes").bindparams(
+                    bindparam("codes", expanding=True)
+                ),
+                {"codes": sorted(candidates)},
+            ).scalars()
+        )
+        codes |= candidates - taken
+    return list(codes)
 
 
 def _ensure_referral_schema() -> None:
@@ -369,25 +366,22 @@ def _ensure_referral_schema() -> None:
     # Create referral reward table for existing installs.
     Base.metadata.tables["referral_rewards"].create(bind=engine, checkfirst=True)
 
-    db = SessionLocal()
-    try:
-        used_codes = {row[0] for row in db.query(User.referral_code).filter(User.referral_code.is_not(None)).all()}
-        changed = False
-        for user in db.query(User).all():
-            if not user.referral_code:
-                code = _next_referral_code()
-                while code in used_codes:
-                    code = _next_referral_code()
-                user.referral_code = code
-                used_codes.add(code)
-                changed = True
-            if user.referral_earnings is None:
-                user.referral_earnings = 0
-                changed = True
-        if changed:
-            db.commit()
-    finally:
-        db.close()
+    with engine.begin() as conn:
+        pending = conn.execute(
+            text("SELECT 1 FROM users "
+                "WHERE referral_code IS NULL OR referral_code = '' OR referral_earnings IS NULL LIMIT 1")
+        ).first()
+        if pending is None:
+            return
+        conn.execute(text("UPDATE users SET referral_earnings = 0 WHERE referral_earnings IS NULL"))
+        # Each pass fills the rows it selected, so re-querying pages through the rest with O(batch) memory.
+        missing_ids_page = text("SELECT id FROM users WHERE referral_code IS NULL OR referral_code = '' LIMIT :limit")
+        while batch := conn.execute(missing_ids_page, {"limit": _REFERRAL_BACKFILL_BATCH_SIZE}).scalars().all():
+            codes = _unused_referral_codes(conn, len(batch))
+            conn.execute(
+                text("UPDATE users SET referral_code = :code WHERE id = :id"),
+                [{"code": code, "id": user_id} for user_id, code in zip(batch, codes)],
+            )
 
 
 def _ensure_message_read_schema() -> None:
@@ -401,8 +395,8 @@ def _ensure_message_read_schema() -> None:
             conn.execute(text(f"ALTER TABLE messages ADD COLUMN read_by_homeowner_at {datetime_sql}"))
         conn.execute(
             text(
-                "CREATE INDEX IF NOT EXISTS ix_messages_read_by_homeowner_at "
-                "ON messages (read_by_homeowner_at)"
+                "CREATE INDEX IF NOT EXISTS ix_messages_session_unread_by_homeowner "
+                "ON messages (session_id) WHERE read_by_homeowner_at IS NULL"
             )
         )
 
@@ -619,31 +613,6 @@ def _ensure_runtime_compatibility_schema() -> None:
             _add_column_if_missing(conn, columns, "users", "phone", "VARCHAR(40)")
             _add_column_if_missing(conn, columns, "users", "estate_id", "VARCHAR(36)")
             _add_column_if_missing(conn, columns, "users", "gate_id", "VARCHAR(36)")
-            if conn.dialect.name == "postgresql":
-                try:
-                    conn.execute(
-                        text(
-                            "DO $$ BEGIN "
-                            "ALTER TYPE userrole ADD VALUE IF NOT EXISTS 'security'; "
-                            "EXCEPTION WHEN undefined_object THEN NULL; END $$;"
-                        )
-                    )
-                    conn.execute(
-                        text(
-                            "DO $$ BEGIN "
-                            "ALTER TYPE userrole ADD VALUE IF NOT EXISTS 'office'; "
-                            "EXCEPTION WHEN undefined_object THEN NULL; END $$;"
-                        )
-                    )
-                    conn.execute(
-                        text(
-                            "DO $$ BEGIN "
-                            "ALTER TYPE userrole ADD VALUE IF NOT EXISTS 'office_staff'; "
-                            "EXCEPTION WHEN undefined_object THEN NULL; END $$;"
-                        )
-                    )
-                except Exception:
-                    pass
 
         if "homes" in table_names:
             columns = {col["name"] for col in inspector.get_columns("homes")}
@@ -931,6 +900,48 @@ def _ensure_subscription_schema() -> None:
             _add_column_if_missing(conn, columns, "subscriptions", "trial_ends_at", datetime_sql)
 
 
+# Bump whenever an _ensure_*_schema helper changes so warm workers re-run them once.
+RUNTIME_SCHEMA_VERSION = 1
+
+
+def ensure_runtime_schema(*, force: bool = False) -> bool:
+    """Run the runtime schema helpers unless this database is already stamped at RUNTIME_SCHEMA_VERSION."""
+    if not force and get_schema_version(engine) >= RUNTIME_SCHEMA_VERSION:
+        return False
+    _ensure_subscription_schema()
+    _ensure_call_sessions_schema()
+    _ensure_advanced_features_schema()
+    _ensure_estate_alert_schema()
+    _ensure_homeowner_payment_schema()
+    _ensure_homeowner_settings_schema()
+    _ensure_wallet_schema()
+    _ensure_runtime_compatibility_schema()
+    create_safety_tables(engine)
+    set_schema_version(engine, RUNTIME_SCHEMA_VERSION)
+    return True
+
+
+def bootstrap_database(*, force: bool = False, seed: bool = False) -> bool:
+    """One-shot database work for a deploy: runtime schema helpers, alert repair/cleanup and optional dev seed.
+
+    Run once per deploy via ``python -m app.db.migrate`` rather than from every worker's
+    startup hook, where N workers would race the same DDL and table-wide DELETEs.
+    """
+    applied = ensure_runtime_schema(force=force)
+    db = SessionLocal()
+    try:
+        if seed:
+            _seed_dev_data(db)
+        try:
+            repair_estate_alert_schema(db)
+            cleanup_broken_alerts(db)
+        except Exception:
+            logging.exception("Alert repair/cleanup failed.")
+    finally:
+        db.close()
+    return applied
+
+
 async def _payment_reminder_loop() -> None:
     while True:
         try:
@@ -957,6 +968,14 @@ async def _subscription_lifecycle_loop() -> None:
         await asyncio.sleep(60 * 60)
 
 
+def _configure_threadpool() -> None:
+    # Sync handlers (and every sync DB call inside them) are dispatched to AnyIO's
+    # default threadpool; keep its capacity in step with the DB connection pool so
+    # concurrency is bounded by connections rather than by the 40-thread default.
+    capacity = settings.THREADPOOL_MAX_WORKERS or (settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = max(1, capacity)
+
+
 def _should_run_scheduled_jobs() -> bool:
     role = (settings.PROCESS_ROLE or "").strip().lower()
     if settings.RUN_SCHEDULED_JOBS:
@@ -1000,6 +1019,7 @@ async def _validate_redis_runtime() -> dict[str, object]:
 
 @fastapi_app.on_event("startup")
 async def on_startup():
+    _configure_threadpool()
     _log_upload_storage_status()
     env = settings.ENVIRONMENT.lower().strip()
     redis_config = describe_redis_configuration()
@@ -1074,30 +1094,33 @@ async def on_startup():
         append_startup_diagnostic(warning, level="warning", code="turn.warning")
         logging.warning("%s", warning)
 
-    # Runtime schema mutations are intentionally disabled in favor of Alembic migrations.
-    # Keep automatic table creation only for local development convenience.
-    if settings.ENVIRONMENT.lower() == "development":
-        Base.metadata.create_all(bind=engine)
-    _ensure_subscription_schema()
-    _ensure_call_sessions_schema()
-    _ensure_advanced_features_schema()
-    _ensure_estate_alert_schema()
-    _ensure_homeowner_payment_schema()
-    _ensure_homeowner_settings_schema()
-    _ensure_wallet_schema()
-    _ensure_runtime_compatibility_schema()
-    create_safety_tables(engine)
-    db = SessionLocal()
-    try:
-        if settings.ENVIRONMENT.lower() == "development":
-            _seed_dev_data(db)
+    if settings.FIREBASE_PROJECT_ID:
         try:
-            repair_estate_alert_schema(db)
-            cleanup_broken_alerts(db)
-        except Exception:
-            logging.exception("Startup alert repair/cleanup failed.")
-    finally:
-        db.close()
+            # Warm the Admin app push delivery uses; it retries the lazy init per send if this fails.
+            _get_firebase_app()
+        except Exception as exc:
+            append_startup_diagnostic(f"Firebase Admin init failed: {exc}", level="warning", code="firebase.unavailable")
+            logging.warning("Firebase Admin init failed: %s", exc)
+        try:
+            # Warm Google's ID-token signing keys so the first sign-in does not pay for the download.
+            await anyio.to_thread.run_sync(get_signing_keys)
+        except Exception as exc:
+            append_startup_diagnostic(f"Google signing keys prefetch failed: {exc}", level="warning", code="firebase.certs")
+            logging.warning("Google signing keys prefetch failed: %s", exc)
+
+    # Schema, repair and seed work belongs to the one-shot `python -m app.db.migrate` step.
+    # Local development keeps doing it inline so a fresh checkout runs without that step.
+    if env == "development":
+        Base.metadata.create_all(bind=engine)
+        schema_applied = bootstrap_database(seed=True)
+    else:
+        # Only a version-stamp read when the deploy step already ran.
+        schema_applied = ensure_runtime_schema()
+    if schema_applied:
+        append_startup_diagnostic(
+            f"Runtime schema helpers applied (version={RUNTIME_SCHEMA_VERSION}).",
+            code="schema.applied",
+        )
     if _should_run_scheduled_jobs():
         asyncio.create_task(_payment_reminder_loop())
         asyncio.create_task(_subscription_lifecycle_loop())
@@ -5,7 +5,7 @@ import logging
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 
-from app.core.security import decode_token
+from app.core.security import decode_token_cached
 
 PROTECTED_PREFIXES = (
     "/api/v1/dashboard",
@@ -39,7 +39,7 @@ class AccessControlMiddleware(BaseHTTPMiddleware):
 
         token = auth_header.split(" ", 1)[1].strip()
         try:
-            payload = decode_token(token)
+            payload = decode_token_cached(token)
         except ValueError:
             logger.warning("access_control.denied reason=invalid_or_expired_token path=%s", path)
             return JSONResponse(status_code=401, content={"detail": "Invalid or expired token"})
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RequestPayload(BaseModel):
+    # Request bodies are read-only once parsed: skip assignment validation and drop unknown keys.
+    model_config = ConfigDict(extra="ignore", frozen=True, validate_assignment=False)
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
 import json
+from collections import defaultdict
 
-from sqlalchemy.orm import Session
+from sqlalchemy import case, distinct, func
+from sqlalchemy.orm import Session, raiseload
 
 from app.db.models import Door, Estate, Home, HomeownerWallet, HomeownerWalletTransaction, Notification, QRCode, Subscription, User, UserRole, VisitorSession
-from app.services.payment_service import list_subscription_plans
+from app.db.session import get_cached
+from app.services.payment_service import get_plan_amount_map
+
+_VISIT_STATUS_BUCKETS = {
+    "pending": ("pending",),
+    "approved": ("approved",),
+    "rejected": ("rejected",),
+    "closed": ("closed", "completed"),
+}
+_EMPTY_VISITS = {"total": 0, **{bucket: 0 for bucket in _VISIT_STATUS_BUCKETS}}
 
 
 def create_door(db: Session, name: str, home_id: str) -> Door:
@@ -29,7 +40,7 @@ def create_qr_code(
         qr_id=qr_id,
         plan=plan,
         home_id=home_id,
-        doors_csv=",".join(doors),
+        door_ids=doors,
         mode=mode,
         estate_id=estate_id,
         active=True,
@@ -40,80 +51,106 @@ def create_qr_code(
     return code
 
 
-def get_admin_overview(db: Session) -> dict:
-    users = db.query(User).order_by(User.created_at.desc()).all()
-    homeowners = [row for row in users if row.role == UserRole.homeowner]
-    estates = [row for row in users if row.role == UserRole.estate]
-
-    homes = db.query(Home).all()
-    doors = db.query(Door).all()
-    qr_codes = db.query(QRCode).all()
-    sessions = db.query(VisitorSession).order_by(VisitorSession.started_at.desc()).all()
-    subscriptions = db.query(Subscription).order_by(Subscription.starts_at.desc(), Subscription.id.desc()).all()
-
-    plan_amount_by_id = {plan["id"]: int(plan["amount"]) for plan in list_subscription_plans(db, include_inactive=True)}
-    total_payment_amount = sum(plan_amount_by_id.get(row.plan, 0) for row in subscriptions)
-
-    homes_by_homeowner: dict[str, int] = {}
-    homes_by_estate: dict[str, int] = {}
-    for row in homes:
-        homes_by_homeowner[row.homeowner_id] = homes_by_homeowner.get(row.homeowner_id, 0) + 1
-        if row.estate_id:
-            homes_by_estate[row.estate_id] = homes_by_estate.get(row.estate_id, 0) + 1
-
-    home_ids_by_homeowner: dict[str, set[str]] = {}
-    home_ids_by_estate: dict[str, set[str]] = {}
-    for row in homes:
-        home_ids_by_homeowner.setdefault(row.homeowner_id, set()).add(row.id)
-        if row.estate_id:
-            home_ids_by_estate.setdefault(row.estate_id, set()).add(row.id)
-
-    doors_by_homeowner: dict[str, int] = {}
-    doors_by_estate: dict[str, int] = {}
-    home_by_id = {row.id: row for row in homes}
-    for row in doors:
-        home = home_by_id.get(row.home_id)
-        if not home:
-            continue
-        doors_by_homeowner[home.homeowner_id] = doors_by_homeowner.get(home.homeowner_id, 0) + 1
-        if home.estate_id:
-            doors_by_estate[home.estate_id] = doors_by_estate.get(home.estate_id, 0) + 1
-
-    qr_by_homeowner: dict[str, int] = {}
-    qr_by_estate: dict[str, int] = {}
-    for row in qr_codes:
-        home = home_by_id.get(row.home_id)
-        if not home:
-            continue
-        qr_by_homeowner[home.homeowner_id] = qr_by_homeowner.get(home.homeowner_id, 0) + 1
-        if row.estate_id:
-            qr_by_estate[row.estate_id] = qr_by_estate.get(row.estate_id, 0) + 1
-
-    visits_by_homeowner: dict[str, dict] = {}
-    for row in sessions:
-        stats = visits_by_homeowner.setdefault(
-            row.homeowner_id,
-            {"total": 0, "pending": 0, "approved": 0, "rejected": 0, "closed": 0},
+def _sub_block(sub: Subscription | None, plan_amount_by_id: dict[str, int]) -> dict:
+    if not sub:
+        return {"plan": "free", "status": "active", "startsAt": None, "amount": 0}
+    return {
+        "plan": sub.plan,
+        "status": sub.status,
+        "startsAt": sub.starts_at.isoformat() if sub.starts_at else None,
+        "amount": plan_amount_by_id.get(sub.plan, 0),
+    }
+
+
+def _scoped(query, column, ids: list[str] | None):
+    return query if ids is None else query.filter(column.in_(ids))
+
+
+def _paged(query, limit: int | None, offset: int):
+    return query if limit is None else query.limit(limit).offset(offset)
+
+
+def _user_page(db: Session, role: UserRole, limit: int | None, offset: int) -> list[User]:
+    query = db.query(User).options(raiseload("*")).filter(User.role == role).order_by(User.created_at.desc(), User.id.desc())
+    return _paged(query, limit, offset).all()
+
+
+def _latest_subscription_by_user(db: Session, user_ids: list[str] | None) -> dict[str, Subscription]:
+    # ROW_NUMBER keeps only each user's newest subscription instead of loading the whole history.
+    ranked = _scoped(
+        db.query(
+            Subscription.id,
+            func.row_number()
+            .over(partition_by=Subscription.user_id, order_by=(Subscription.starts_at.desc(), Subscription.id.desc()))
+            .label("rank"),
+        ),
+        Subscription.user_id,
+        user_ids,
+    ).subquery()
+    rows = (
+        db.query(Subscription)
+        .options(raiseload("*"))
+        .join(ranked, ranked.c.id == Subscription.id)
+        .filter(ranked.c.rank == 1)
+        .all()
+    )
+    return {row.user_id: row for row in rows}
+
+
+def get_admin_metrics(db: Session) -> dict:
+    plan_amount_by_id = get_plan_amount_map(db)
+    users_by_role = dict(db.query(User.role, func.count(User.id)).group_by(User.role).all())
+    subscriptions_by_plan = db.query(Subscription.plan, func.count(Subscription.id)).group_by(Subscription.plan).all()
+    return {
+        "totalHomeowners": users_by_role.get(UserRole.homeowner, 0),
+        "totalEstates": users_by_role.get(UserRole.estate, 0),
+        "totalUsers": sum(users_by_role.values()),
+        "totalHomes": db.query(func.count(Home.id)).scalar() or 0,
+        "totalDoors": db.query(func.count(Door.id)).scalar() or 0,
+        "totalQrCodes": db.query(func.count(QRCode.id)).scalar() or 0,
+        "totalVisits": db.query(func.count(VisitorSession.id)).scalar() or 0,
+        "totalPaymentAmount": sum(plan_amount_by_id.get(plan, 0) * count for plan, count in subscriptions_by_plan),
+    }
+
+
+def list_admin_homeowners(db: Session, *, limit: int | None = None, offset: int = 0) -> list[dict]:
+    homeowners = _user_page(db, UserRole.homeowner, limit, offset)
+    if not homeowners:
+        return []
+    # A full listing aggregates every row; a page restricts each GROUP BY to its own users.
+    ids = None if limit is None else [row.id for row in homeowners]
+    plan_amount_by_id = get_plan_amount_map(db)
+
+    homes_by_homeowner = dict(
+        _scoped(db.query(Home.homeowner_id, func.count(Home.id)), Home.homeowner_id, ids).group_by(Home.homeowner_id).all()
+    )
+    doors_by_homeowner = dict(
+        _scoped(db.query(Home.homeowner_id, func.count(Door.id)).join(Home, Home.id == Door.home_id), Home.homeowner_id, ids)
+        .group_by(Home.homeowner_id)
+        .all()
+    )
+    qr_by_homeowner = dict(
+        _scoped(db.query(Home.homeowner_id, func.count(QRCode.id)).join(Home, Home.id == QRCode.home_id), Home.homeowner_id, ids)
+        .group_by(Home.homeowner_id)
+        .all()
+    )
+    visits_by_homeowner = {
+        homeowner_id: dict(zip(_EMPTY_VISITS, counts))
+        for homeowner_id, *counts in _scoped(
+            db.query(
+                VisitorSession.homeowner_id,
+                func.count(VisitorSession.id),
+                *(func.sum(case((VisitorSession.status.in_(statuses), 1), else_=0)) for statuses in _VISIT_STATUS_BUCKETS.values()),
+            ),
+            VisitorSession.homeowner_id,
+            ids,
         )
-        stats["total"] += 1
-        if row.status == "pending":
-            stats["pending"] += 1
-        elif row.status == "approved":
-            stats["approved"] += 1
-        elif row.status == "rejected":
-            stats["rejected"] += 1
-        elif row.status in {"closed", "completed"}:
-            stats["closed"] += 1
-
-    subscription_by_user: dict[str, Subscription] = {}
-    for row in subscriptions:
-        if row.user_id not in subscription_by_user:
-            subscription_by_user[row.user_id] = row
-
-    estate_rows = db.query(Estate).order_by(Estate.created_at.desc()).all()
-    estate_by_id = {row.id: row for row in estate_rows}
-
-    homeowner_details = [
+        .group_by(VisitorSession.homeowner_id)
+        .all()
+    }
+    subscription_by_user = _latest_subscription_by_user(db, ids)
+
+    return [
         {
             "id": row.id,
             "fullName": row.full_name,
@@ -123,46 +160,73 @@ def get_admin_overview(db: Session) -> dict:
             "homeCount": homes_by_homeowner.get(row.id, 0),
             "doorCount": doors_by_homeowner.get(row.id, 0),
             "qrCount": qr_by_homeowner.get(row.id, 0),
-            "subscription": {
-                "plan": subscription_by_user.get(row.id).plan if subscription_by_user.get(row.id) else "free",
-                "status": subscription_by_user.get(row.id).status if subscription_by_user.get(row.id) else "active",
-                "startsAt": (
-                    subscription_by_user.get(row.id).starts_at.isoformat()
-                    if subscription_by_user.get(row.id) and subscription_by_user.get(row.id).starts_at
-                    else None
-                ),
-                "amount": plan_amount_by_id.get(subscription_by_user.get(row.id).plan, 0)
-                if subscription_by_user.get(row.id)
-                else 0,
-            },
-            "visits": visits_by_homeowner.get(
-                row.id, {"total": 0, "pending": 0, "approved": 0, "rejected": 0, "closed": 0}
-            ),
+            "subscription": _sub_block(subscription_by_user.get(row.id), plan_amount_by_id),
+            "visits": visits_by_homeowner.get(row.id) or dict(_EMPTY_VISITS),
         }
         for row in homeowners
     ]
 
-    estate_details = []
-    visits_by_estate_owner: dict[str, int] = {}
-    for session in sessions:
-        home = home_by_id.get(session.home_id)
-        if not home or not home.estate_id:
-            continue
-        estate = estate_by_id.get(home.estate_id)
-        if not estate:
-            continue
-        visits_by_estate_owner[estate.owner_id] = visits_by_estate_owner.get(estate.owner_id, 0) + 1
-
-    for row in estates:
-        owned_estates = [estate for estate in estate_rows if estate.owner_id == row.id]
-        owned_estate_ids = {estate.id for estate in owned_estates}
-        homeowner_count = len(
-            {
-                home.homeowner_id
-                for home in homes
-                if home.estate_id in owned_estate_ids and home.homeowner_id
-            }
+
+def list_admin_estate_owners(db: Session, *, limit: int | None = None, offset: int = 0) -> list[dict]:
+    owners = _user_page(db, UserRole.estate, limit, offset)
+    if not owners:
+        return []
+    ids = None if limit is None else [row.id for row in owners]
+    plan_amount_by_id = get_plan_amount_map(db)
+
+    estate_ids_by_owner: dict[str, list[str]] = defaultdict(list)
+    for estate_id, owner_id in _scoped(db.query(Estate.id, Estate.owner_id), Estate.owner_id, ids).order_by(Estate.created_at.desc()):
+        estate_ids_by_owner[owner_id].append(estate_id)
+    estate_ids = None if ids is None else [estate_id for owned in estate_ids_by_owner.values() for estate_id in owned]
+
+    homes_by_estate = dict(
+        _scoped(db.query(Home.estate_id, func.count(Home.id)).filter(Home.estate_id.isnot(None)), Home.estate_id, estate_ids)
+        .group_by(Home.estate_id)
+        .all()
+    )
+    doors_by_estate = dict(
+        _scoped(
+            db.query(Home.estate_id, func.count(Door.id)).join(Home, Home.id == Door.home_id).filter(Home.estate_id.isnot(None)),
+            Home.estate_id,
+            estate_ids,
+        )
+        .group_by(Home.estate_id)
+        .all()
+    )
+    qr_by_estate = dict(
+        _scoped(
+            db.query(QRCode.estate_id, func.count(QRCode.id)).join(Home, Home.id == QRCode.home_id).filter(QRCode.estate_id.isnot(None)),
+            QRCode.estate_id,
+            estate_ids,
+        )
+        .group_by(QRCode.estate_id)
+        .all()
+    )
+    visits_by_estate_owner = dict(
+        _scoped(
+            db.query(Estate.owner_id, func.count(VisitorSession.id))
+            .join(Home, Home.id == VisitorSession.home_id)
+            .join(Estate, Estate.id == Home.estate_id),
+            Estate.owner_id,
+            ids,
         )
+        .group_by(Estate.owner_id)
+        .all()
+    )
+    homeowners_by_estate_owner = dict(
+        _scoped(
+            db.query(Estate.owner_id, func.count(distinct(Home.homeowner_id))).join(Home, Home.estate_id == Estate.id),
+            Estate.owner_id,
+            ids,
+        )
+        .group_by(Estate.owner_id)
+        .all()
+    )
+    subscription_by_user = _latest_subscription_by_user(db, ids)
+
+    estate_details = []
+    for row in owners:
+        owned_estate_ids = estate_ids_by_owner.get(row.id, [])
         estate_details.append(
             {
                 "id": row.id,
@@ -170,107 +234,106 @@ def get_admin_overview(db: Session) -> dict:
                 "email": row.email,
                 "active": row.is_active,
                 "createdAt": row.created_at.isoformat() if row.created_at else None,
-                "estateCount": len(owned_estates),
+                "estateCount": len(owned_estate_ids),
                 "homeCount": sum(homes_by_estate.get(estate_id, 0) for estate_id in owned_estate_ids),
                 "doorCount": sum(doors_by_estate.get(estate_id, 0) for estate_id in owned_estate_ids),
                 "qrCount": sum(qr_by_estate.get(estate_id, 0) for estate_id in owned_estate_ids),
-                "homeownerCount": homeowner_count,
+                "homeownerCount": homeowners_by_estate_owner.get(row.id, 0),
                 "visits": visits_by_estate_owner.get(row.id, 0),
-                "subscription": {
-                    "plan": subscription_by_user.get(row.id).plan if subscription_by_user.get(row.id) else "free",
-                    "status": subscription_by_user.get(row.id).status if subscription_by_user.get(row.id) else "active",
-                    "startsAt": (
-                        subscription_by_user.get(row.id).starts_at.isoformat()
-                        if subscription_by_user.get(row.id) and subscription_by_user.get(row.id).starts_at
-                        else None
-                    ),
-                    "amount": plan_amount_by_id.get(subscription_by_user.get(row.id).plan, 0)
-                    if subscription_by_user.get(row.id)
-                    else 0,
-                },
+                "subscription": _sub_block(subscription_by_user.get(row.id), plan_amount_by_id),
             }
         )
+    return estate_details
+
 
-    homeowner_payment_history = [
+def list_admin_payment_history(db: Session, role: UserRole, *, limit: int | None = None, offset: int = 0) -> list[dict]:
+    plan_amount_by_id = get_plan_amount_map(db)
+    query = (
+        db.query(
+            Subscription.id,
+            Subscription.user_id,
+            Subscription.plan,
+            Subscription.status,
+            Subscription.starts_at,
+            Subscription.ends_at,
+            User.email,
+            User.full_name,
+        )
+        .join(User, User.id == Subscription.user_id)
+        .filter(User.role == role)
+        .order_by(Subscription.starts_at.desc(), Subscription.id.desc())
+    )
+    return [
         {
             "id": row.id,
             "userId": row.user_id,
-            "userEmail": user.email if user else "",
-            "userName": user.full_name if user else "",
+            "userEmail": row.email,
+            "userName": row.full_name,
             "plan": row.plan,
             "status": row.status,
             "amount": plan_amount_by_id.get(row.plan, 0),
             "startsAt": row.starts_at.isoformat() if row.starts_at else None,
             "endsAt": row.ends_at.isoformat() if row.ends_at else None,
         }
-        for row in subscriptions
-        for user in [next((u for u in homeowners if u.id == row.user_id), None)]
-        if user
+        for row in _paged(query, limit, offset).all()
     ]
 
-    estate_payment_history = [
+
+def list_admin_visits(db: Session, *, limit: int = 300, offset: int = 0) -> list[dict]:
+    query = (
+        db.query(
+            VisitorSession.id,
+            VisitorSession.visitor_label,
+            VisitorSession.status,
+            VisitorSession.homeowner_id,
+            VisitorSession.door_id,
+            VisitorSession.started_at,
+            VisitorSession.ended_at,
+            User.full_name,
+            User.email,
+            Estate.id.label("estate_id"),
+            Estate.name.label("estate_name"),
+            Door.name.label("door_name"),
+        )
+        .outerjoin(User, User.id == VisitorSession.homeowner_id)
+        .outerjoin(Door, Door.id == VisitorSession.door_id)
+        .outerjoin(Home, Home.id == VisitorSession.home_id)
+        .outerjoin(Estate, Estate.id == Home.estate_id)
+        .order_by(VisitorSession.started_at.desc(), VisitorSession.id.desc())
+    )
+    return [
         {
             "id": row.id,
-            "userId": row.user_id,
-            "userEmail": user.email if user else "",
-            "userName": user.full_name if user else "",
-            "plan": row.plan,
+            "visitor": row.visitor_label,
             "status": row.status,
-            "amount": plan_amount_by_id.get(row.plan, 0),
-            "startsAt": row.starts_at.isoformat() if row.starts_at else None,
-            "endsAt": row.ends_at.isoformat() if row.ends_at else None,
+            "homeownerId": row.homeowner_id,
+            "homeownerName": row.full_name or "",
+            "homeownerEmail": row.email or "",
+            "estateId": row.estate_id,
+            "estateName": row.estate_name,
+            "doorId": row.door_id,
+            "doorName": row.door_name or "",
+            "startedAt": row.started_at.isoformat() if row.started_at else None,
+            "endedAt": row.ended_at.isoformat() if row.ended_at else None,
         }
-        for row in subscriptions
-        for user in [next((u for u in estates if u.id == row.user_id), None)]
-        if user
+        for row in _paged(query, limit, offset).all()
     ]
 
-    visit_rows = []
-    door_by_id = {row.id: row for row in doors}
-    user_by_id = {row.id: row for row in users}
-    for session in sessions[:300]:
-        homeowner = user_by_id.get(session.homeowner_id)
-        door = door_by_id.get(session.door_id)
-        home = home_by_id.get(session.home_id)
-        estate = estate_by_id.get(home.estate_id) if home and home.estate_id else None
-        visit_rows.append(
-            {
-                "id": session.id,
-                "visitor": session.visitor_label,
-                "status": session.status,
-                "homeownerId": session.homeowner_id,
-                "homeownerName": homeowner.full_name if homeowner else "",
-                "homeownerEmail": homeowner.email if homeowner else "",
-                "estateId": estate.id if estate else None,
-                "estateName": estate.name if estate else None,
-                "doorId": session.door_id,
-                "doorName": door.name if door else "",
-                "startedAt": session.started_at.isoformat() if session.started_at else None,
-                "endedAt": session.ended_at.isoformat() if session.ended_at else None,
-            }
-        )
 
+def get_admin_overview(db: Session) -> dict:
+    metrics = get_admin_metrics(db)
     return {
-        "metrics": {
-            "totalHomeowners": len(homeowners),
-            "totalEstates": len(estates),
-            "totalUsers": len(users),
-            "totalHomes": len(homes),
-            "totalDoors": len(doors),
-            "totalQrCodes": len(qr_codes),
-            "totalVisits": len(sessions),
-            "totalPaymentAmount": total_payment_amount,
-        },
-        "homeowners": homeowner_details,
-        "estates": estate_details,
+        "metrics": metrics,
+        "homeowners": list_admin_homeowners(db),
+        "estates": list_admin_estate_owners(db),
         "payments": {
-            "totalAmount": total_payment_amount,
-            "homeownerHistory": homeowner_payment_history,
-            "estateHistory": estate_payment_history,
+            "totalAmount": metrics["totalPaymentAmount"],
+            "homeownerHistory": list_admin_payment_history(db, UserRole.homeowner),
+            "estateHistory": list_admin_payment_history(db, UserRole.estate),
         },
         "visits": {
-            "total": len(sessions),
-            "rows": visit_rows,
+            "total": metrics["totalVisits"],
+            "rows": list_admin_visits(db),
         },
     }
 
@@ -322,7 +385,7 @@ def list_wallet_transactions(db: Session, *, limit: int = 200) -> list[dict]:
 def fund_wallet(db: Session, *, user_id: str, amount: float, note: str | None = None) -> dict:
     if amount <= 0:
         raise ValueError("amount must be greater than 0")
-    user = db.query(User).filter(User.id == user_id).first()
+    user = get_cached(db, User, user_id)
     if not user:
         raise ValueError("User not found")
     wallet = db.query(HomeownerWallet).filter(HomeownerWallet.user_id == user_id).first()
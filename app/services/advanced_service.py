@@ -34,6 +34,7 @@ from app.db.models import (
     VisitorSnapshotAudit,
     WeeklySummaryLog,
 )
+from app.db.session import get_cached
 from app.services.notification_service import create_notification
 from app.services.provider_integrations import (
     get_user_contact,
@@ -866,7 +867,7 @@ def trigger_emergency_signal(
     db.commit()
     db.refresh(row)
 
-    requester = db.query(User).filter(User.id == requester_user_id).first()
+    requester = get_cached(db, User, requester_user_id)
     if requester:
         # Scope notifications to the requester's tenant context to avoid cross-estate leakage.
         recipient_ids: set[str] = {requester.id}
@@ -12,6 +12,7 @@ from app.core.config import get_settings
 from app.core.exceptions import AppException
 from app.core.time import utc_now
 from app.db.models import Appointment, Door, Home, User, VisitorSession
+from app.db.session import get_cached
 from app.services.payment_service import require_subscription_feature
 from app.services.notification_service import create_notification
 from app.services.provider_integrations import send_transactional_email
@@ -277,7 +278,7 @@ def create_appointment(
     )
 
     if appt.visitor_email:
-        homeowner = db.query(User).filter(User.id == homeowner_id).first()
+        homeowner = get_cached(db, User, homeowner_id)
         homeowner_name = (homeowner.full_name if homeowner else "Homeowner").strip() or "Homeowner"
         entry_point = (door.gate_label or door.name or "your entry point").strip()
         start_label = starts_at.strftime("%b %d, %Y %I:%M %p")
@@ -596,7 +597,7 @@ def report_appointment_arrival(
 
     door = db.query(Door).filter(Door.id == appt.door_id).first()
     home = db.query(Home).filter(Home.id == appt.home_id).first()
-    homeowner = db.query(User).filter(User.id == appt.homeowner_id).first()
+    homeowner = get_cached(db, User, appt.homeowner_id)
     homeowner_email = str(homeowner.email or "").strip().lower() if homeowner else ""
     if homeowner_email:
         entry_point = ((door.gate_label or door.name) if door else "your property").strip()
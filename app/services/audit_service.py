@@ -1,11 +1,32 @@
 from __future__ import annotations
 
-import json
+import logging
+from collections import deque
+from threading import Lock
 from typing import Any
 
+import orjson
+from sqlalchemy import insert
+from sqlalchemy.exc import DataError, DBAPIError, IntegrityError, OperationalError
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import Session
 
+from app.core.time import utc_now
 from app.db.models import AuditLog
+from app.db.uuid7 import uuid7_str
+
+logger = logging.getLogger(__name__)
+
+_AUDIT_FLUSH_BATCH_SIZE = 100
+_AUDIT_QUEUE_MAX_ROWS = 10_000
+_pending_audit_rows: deque[dict[str, Any]] = deque()
+_pending_audit_lock = Lock()
+# Rows evicted because the queue stayed full (the database kept rejecting flushes); each is logged in full.
+_dropped_audit_rows = 0
+
+
+def _encode_meta(meta: dict[str, Any] | None) -> str:
+    return orjson.dumps(meta or {}, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
 
 
 def write_audit_log(
@@ -21,7 +42,7 @@ def write_audit_log(
         action=action,
         resource_type=resource_type,
         resource_id=resource_id,
-        meta_json=json.dumps(meta or {}, ensure_ascii=True),
+        meta_json=_encode_meta(meta),
     )
     db.add(row)
     db.commit()
@@ -29,6 +50,100 @@ def write_audit_log(
     return row
 
 
+def queue_audit_log(
+    actor_user_id: str | None,
+    action: str,
+    resource_type: str,
+    resource_id: str | None = None,
+    meta: dict[str, Any] | None = None,
+) -> None:
+    # Audit rows are buffered and written by flush_audit_logs() after the response
+    # is sent, so mutation endpoints do not pay for a second INSERT + COMMIT.
+    row = {
+        "id": uuid7_str(),
+        "actor_user_id": actor_user_id,
+        "action": action,
+        "resource_type": resource_type,
+        "resource_id": resource_id,
+        "meta_json": _encode_meta(meta),
+        "created_at": utc_now(),
+    }
+    with _pending_audit_lock:
+        _pending_audit_rows.append(row)
+        _trim_pending_audit_rows()
+
+
+def _trim_pending_audit_rows() -> None:
+    # Caller holds _pending_audit_lock. The oldest rows go first, and the log line keeps their content.
+    global _dropped_audit_rows
+    while len(_pending_audit_rows) > _AUDIT_QUEUE_MAX_ROWS:
+        dropped = _pending_audit_rows.popleft()
+        _dropped_audit_rows += 1
+        logger.error("audit.queue_full dropped_total=%s row=%s", _dropped_audit_rows, dropped)
+
+
+def _requeue_audit_rows(rows: list[dict[str, Any]]) -> None:
+    # Put rows back ahead of anything queued meanwhile so the next flush retries them first.
+    with _pending_audit_lock:
+        _pending_audit_rows.extendleft(reversed(rows))
+        _trim_pending_audit_rows()
+
+
+def _is_transient(exc: DBAPIError) -> bool:
+    return isinstance(exc, OperationalError) or exc.connection_invalidated
+
+
+def _insert_audit_rows(bind: Engine | Connection, rows: list[dict[str, Any]]) -> None:
+    db = Session(bind=bind)
+    try:
+        for start in range(0, len(rows), _AUDIT_FLUSH_BATCH_SIZE):
+            db.execute(insert(AuditLog), rows[start : start + _AUDIT_FLUSH_BATCH_SIZE])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def flush_audit_logs(bind: Engine | Connection) -> int:
+    with _pending_audit_lock:
+        rows = list(_pending_audit_rows)
+        _pending_audit_rows.clear()
+    if not rows:
+        return 0
+    try:
+        _insert_audit_rows(bind, rows)
+        return len(rows)
+    except DBAPIError as exc:
+        if _is_transient(exc):
+            logger.warning("audit.flush_deferred rows=%s error=%s", len(rows), exc.__class__.__name__)
+            _requeue_audit_rows(rows)
+            return 0
+        if not isinstance(exc, (IntegrityError, DataError)):
+            logger.exception("audit.flush_failed rows=%s", rows)
+            return 0
+        logger.warning("audit.flush_retrying_rows rows=%s error=%s", len(rows), exc.__class__.__name__)
+    except Exception:
+        logger.exception("audit.flush_failed rows=%s", rows)
+        return 0
+
+    # One bad row (over-long column, dangling actor FK) fails the whole batch; write the rest one by one.
+    written = 0
+    for index, row in enumerate(rows):
+        try:
+            _insert_audit_rows(bind, [row])
+            written += 1
+        except (IntegrityError, DataError) as exc:
+            logger.error("audit.row_rejected error=%s row=%s", exc.orig, row)
+        except DBAPIError as exc:
+            if not _is_transient(exc):
+                logger.exception("audit.row_rejected row=%s", row)
+                continue
+            _requeue_audit_rows(rows[index:])
+            break
+    return written
+
+
 def list_audit_logs(db: Session, limit: int = 200) -> list[AuditLog]:
     return db.query(AuditLog).order_by(AuditLog.created_at.desc()).limit(limit).all()
-
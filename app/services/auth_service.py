@@ -3,37 +3,49 @@ from __future__ import annotations
 import uuid
 import json
 import base64
+import hashlib
 import logging
 import re
 import secrets
+import time
+from functools import lru_cache
 from threading import Thread, Lock
 from urllib.parse import quote
 from datetime import datetime, timedelta
 
+import orjson
 from redis.exceptions import RedisError
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.core.config import get_settings
 from app.core.exceptions import AppException
+from app.core.firebase_tokens import SigningKeysUnavailable, verify_firebase_id_token
 from app.core.time import utc_now
 from app.core.redis import get_redis_client, prefixed_key
 from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
+    UNUSABLE_PASSWORD_HASH,
     hash_password,
+    is_password_usable,
+    verify_and_update_password,
     verify_password,
 )
-from app.db.models import DeviceSession, Door, Home, Notification, Office, OfficeMember, QRCode, User, UserRole
-from app.db.session import SessionLocal
+from app.db.models import DeviceSession, Door, Home, Office, OfficeMember, QRCode, User, UserRole
+from app.db.session import SessionLocal, get_cached
+from app.db.stmts import INSERT_DEVICE_SESSION
 from app.schemas.auth import AuthResponse
 from app.services.provider_integrations import send_transactional_email
 from app.db.models.user_token import UserToken, UserTokenType, generate_user_token, hash_user_token
 from app.services.payment_service import ensure_signup_trial_subscription
 
 settings = get_settings()
-_firebase_init_lock = Lock()
+# Verified Google ID tokens, keyed by SHA-256 of the raw token: digest -> (monotonic expiry, (email, name)).
+_GOOGLE_TOKEN_CACHE_TTL_SECONDS = 30.0
+_GOOGLE_TOKEN_CACHE_MAX_ENTRIES = 10_000
+_google_token_cache: dict[bytes, tuple[float, tuple[str, str]]] = {}
+_google_token_cache_lock = Lock()
 logger = logging.getLogger(__name__)
 _auth_lock = Lock()
 _failed_login_hits: dict[str, list[float]] = {}
@@ -49,6 +61,9 @@ _TOKEN_ISSUE_WINDOW_SECONDS = 60 * 60
 _TOKEN_ISSUE_MAX = 5
 _token_issue_hits: dict[str, list[float]] = {}
 _email_verify_attempt_hits: dict[str, list[float]] = {}
+# Per-process cap on distinct keys in each in-memory hit store above.
+_AUTH_HIT_STORE_MAX_KEYS = 10_000
+_hit_store_swept_at: dict[int, float] = {}
 _LOGIN_REDIS_WINDOW_LUA = """
 local hits_key = KEYS[1]
 local blocked_key = KEYS[2]
@@ -76,51 +91,25 @@ end
 return {1, 0}
 """
 
-try:
-    import firebase_admin
-    from firebase_admin import credentials as firebase_credentials
-    from firebase_admin import auth as firebase_auth
-except ImportError:
-    firebase_admin = None
-    firebase_credentials = None
-    firebase_auth = None
-
-
-def _ensure_firebase_app():
-    if firebase_admin is None or firebase_auth is None or firebase_credentials is None:
-        raise AppException(
-            "Firebase Admin SDK is not installed. Add firebase-admin to dependencies.",
-            status_code=500,
-        )
-
-    if firebase_admin._apps:
-        return firebase_admin.get_app()
-
-    with _firebase_init_lock:
-        if firebase_admin._apps:
-            return firebase_admin.get_app()
-        if not settings.FIREBASE_PROJECT_ID:
-            raise AppException("FIREBASE_PROJECT_ID is not configured", status_code=500)
-        service_account = _load_firebase_service_account()
-        if service_account:
-            cred = firebase_credentials.Certificate(service_account)
-            return firebase_admin.initialize_app(
-                credential=cred,
-                options={"projectId": settings.FIREBASE_PROJECT_ID},
-            )
-        logger.warning(
-            "Firebase service account credentials not configured. Falling back to default credentials lookup."
-        )
-        return firebase_admin.initialize_app(options={"projectId": settings.FIREBASE_PROJECT_ID})
-
-
 def _verify_google_id_token(id_token: str, expected_email: str | None = None) -> tuple[str, str]:
     if not id_token:
         raise AppException("idToken is required", status_code=400)
 
-    app = _ensure_firebase_app()
+    cache_key = hashlib.sha256(id_token.encode("utf-8")).digest()
+    now = time.monotonic()
+    with _google_token_cache_lock:
+        cached = _google_token_cache.pop(cache_key, None)
+        if cached is not None and cached[0] > now:
+            # Re-insert so dict order tracks recency and eviction drops the least recently used token.
+            _google_token_cache[cache_key] = cached
+            return cached[1]
+
+    if not settings.FIREBASE_PROJECT_ID:
+        raise AppException("FIREBASE_PROJECT_ID is not configured", status_code=500)
     try:
-        decoded = firebase_auth.verify_id_token(id_token, app=app)
+        decoded = verify_firebase_id_token(id_token, settings.FIREBASE_PROJECT_ID)
+    except SigningKeysUnavailable as exc:
+        raise AppException("Google sign-in is temporarily unavailable", status_code=503) from exc
     except Exception as exc:
         token_preview = _peek_token_claims(id_token)
         logger.warning(
@@ -138,77 +127,52 @@ def _verify_google_id_token(id_token: str, expected_email: str | None = None) ->
         raise AppException("Google email is not verified", status_code=401)
 
     name = (decoded.get("name") or "").strip()
+    # Retries and double-submits replay the same token; never keep it past its own exp claim.
+    ttl_seconds = min(float(decoded.get("exp") or 0) - time.time(), _GOOGLE_TOKEN_CACHE_TTL_SECONDS)
+    if ttl_seconds > 0:
+        with _google_token_cache_lock:
+            if len(_google_token_cache) >= _GOOGLE_TOKEN_CACHE_MAX_ENTRIES:
+                _google_token_cache.pop(next(iter(_google_token_cache)))
+            _google_token_cache[cache_key] = (now + ttl_seconds, (email, name))
     return email, name
 
 
+_PEEK_CLAIM_KEYS = ("aud", "iss", "sub", "email", "email_verified", "auth_time", "exp", "iat")
+
+
 def _peek_token_claims(id_token: str) -> dict:
     """Best-effort JWT payload preview for debugging verification mismatches."""
     try:
-        parts = id_token.split(".")
+        parts = id_token.split(".", 2)
         if len(parts) < 2:
             return {"error": "malformed_jwt"}
-        payload = parts[1]
-        padding = "=" * (-len(payload) % 4)
-        decoded = base64.urlsafe_b64decode(payload + padding).decode("utf-8")
-        claims = json.loads(decoded)
-        return {
-            "aud": claims.get("aud"),
-            "iss": claims.get("iss"),
-            "sub": claims.get("sub"),
-            "email": claims.get("email"),
-            "email_verified": claims.get("email_verified"),
-            "auth_time": claims.get("auth_time"),
-            "exp": claims.get("exp"),
-            "iat": claims.get("iat"),
-        }
+        # The decoder tolerates surplus padding, so always appending "==" covers every payload length.
+        claims = orjson.loads(base64.urlsafe_b64decode(parts[1].encode("ascii") + b"=="))
+        return {key: claims.get(key) for key in _PEEK_CLAIM_KEYS}
     except Exception as exc:
         return {"error": f"peek_failed:{exc.__class__.__name__}"}
 
 
-def _load_firebase_service_account() -> dict | None:
-    raw_json = (settings.FIREBASE_SERVICE_ACCOUNT_JSON or "").strip()
-    if raw_json:
-        try:
-            return json.loads(raw_json)
-        except json.JSONDecodeError as exc:
-            raise AppException("FIREBASE_SERVICE_ACCOUNT_JSON is not valid JSON", status_code=500) from exc
-
-    raw_base64 = (settings.FIREBASE_SERVICE_ACCOUNT_BASE64 or "").strip()
-    if raw_base64:
-        try:
-            decoded = base64.b64decode(raw_base64).decode("utf-8")
-            return json.loads(decoded)
-        except Exception as exc:
-            raise AppException("FIREBASE_SERVICE_ACCOUNT_BASE64 is invalid", status_code=500) from exc
-
-    return None
-
-
 def _issue_auth_tokens(db: Session, user: User, user_agent: str = "", ip_address: str = "") -> AuthResponse:
     access_token = create_access_token(user.id, user.role.value)
     refresh_token = create_refresh_token(user.id)
 
-    device_session = DeviceSession(
-        user_id=user.id,
-        refresh_token=refresh_token,
-        user_agent=user_agent,
-        ip_address=ip_address,
+    db.execute(
+        INSERT_DEVICE_SESSION,
+        {"user_id": user.id, "refresh_token": refresh_token, "user_agent": user_agent, "ip_address": ip_address},
     )
-    db.add(device_session)
+    # Read the profile before committing; afterwards the expired user would be reloaded with a SELECT.
+    profile = {
+        "id": user.id,
+        "fullName": user.full_name,
+        "email": user.email,
+        "role": user.role.value,
+        "referralCode": user.referral_code,
+        "referralEarnings": int(user.referral_earnings or 0),
+    }
     db.commit()
 
-    return AuthResponse(
-        accessToken=access_token,
-        refreshToken=refresh_token,
-        user={
-            "id": user.id,
-            "fullName": user.full_name,
-            "email": user.email,
-            "role": user.role.value,
-            "referralCode": user.referral_code,
-            "referralEarnings": int(user.referral_earnings or 0),
-        },
-    )
+    return AuthResponse(accessToken=access_token, refreshToken=refresh_token, user=profile)
 
 
 def _normalize_referral_code(referral_code: str | None) -> str | None:
@@ -241,6 +205,17 @@ def _queue_email_verification(email: str) -> None:
     Thread(target=_runner, daemon=True).start()
 
 
+def _queue_transactional_email(to_email: str, subject: str, body: str) -> None:
+    # Provider round-trips only happen for real accounts, so sending inline would make their responses measurably slower.
+    def _runner() -> None:
+        try:
+            send_transactional_email(to_email=to_email, subject=subject, body=body)
+        except Exception:
+            logger.exception("Unable to send transactional email subject=%s", subject)
+
+    Thread(target=_runner, daemon=True).start()
+
+
 def _create_office_onboarding(
     db: Session,
     *,
@@ -295,7 +270,7 @@ def _create_office_onboarding(
         qr_id=qr_id,
         plan="office",
         home_id=reception_home.id,
-        doors_csv=reception_door.id,
+        door_ids=[reception_door.id],
         mode="direct",
         estate_id=None,
         active=True,
@@ -345,6 +320,7 @@ def signup(
     role: str,
     referral_code: str | None = None,
 ):
+    email = (email or "").strip().lower()
     existing = db.query(User).filter(User.email == email).first()
     if existing:
         if not existing.email_verified:
@@ -408,6 +384,7 @@ def admin_signup(
         if not provided or provided != configured_key:
             raise AppException("Invalid admin signup key", status_code=403)
 
+    email = (email or "").strip().lower()
     existing = db.query(User).filter(User.email == email).first()
     if existing:
         raise AppException("Email already exists", status_code=409)
@@ -429,28 +406,36 @@ def admin_signup(
     return {"id": user.id, "email": user.email}
 
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    return hash_password(secrets.token_urlsafe(16))
+
+
 def login(db: Session, email: str, password: str, user_agent: str = "", ip_address: str = "") -> AuthResponse:
     login_key = (email or "").strip().lower()
     _enforce_login_rate_limit(login_key=login_key, ip_address=ip_address)
-    user = (
-        db.query(User)
-        .filter(
-            or_(
-                User.email == login_key,
-                User.email.like(f"{login_key}@%"),
-            )
-        )
-        .first()
-    )
+    user = db.query(User).filter(User.email == login_key).first()
+    if user is None and login_key and "@" not in login_key:
+        # Bare usernames sign in as their address's local part; only this fallback pays for a prefix scan.
+        user = db.query(User).filter(User.email.startswith(f"{login_key}@", autoescape=True)).first()
     if not user or not user.is_active:
+        # Pay the same hashing cost as a real check so response time does not reveal unknown accounts.
+        verify_password(password, _dummy_password_hash())
         _record_login_failure(login_key=login_key, ip_address=ip_address)
         raise AppException("Invalid credentials", status_code=401)
     if not user.email_verified:
         # Do not issue sessions to unverified users. Allow them to request verification.
         raise AppException("Email is not verified", status_code=403)
-    if not verify_password(password, user.password_hash):
+    if not is_password_usable(user.password_hash):
+        # Google-only accounts have no password; still hash so timing matches a wrong password.
+        verify_password(password, _dummy_password_hash())
+    verified, upgraded_hash = verify_and_update_password(password, user.password_hash)
+    if not verified:
         _record_login_failure(login_key=login_key, ip_address=ip_address)
         raise AppException("Invalid credentials", status_code=401)
+    if upgraded_hash:
+        # Persisted by the commit in _issue_auth_tokens.
+        user.password_hash = upgraded_hash
     _clear_login_failures(login_key=login_key, ip_address=ip_address)
     return _issue_auth_tokens(db=db, user=user, user_agent=user_agent, ip_address=ip_address)
 
@@ -468,8 +453,8 @@ def google_signin(
     if not user:
         raise AppException("Account not found. Please sign up first.", status_code=404)
     if not user.email_verified:
+        # Persisted by the commit in _issue_auth_tokens.
         user.email_verified = True
-        db.commit()
     return _issue_auth_tokens(db=db, user=user, user_agent=user_agent, ip_address=ip_address)
 
 
@@ -505,7 +490,7 @@ def google_signup(
     user = User(
         full_name=resolved_name,
         email=token_email,
-        password_hash=hash_password(str(uuid.uuid4())),
+        password_hash=UNUSABLE_PASSWORD_HASH,
         role=user_role,
         email_verified=True,
         is_active=True,
@@ -538,6 +523,7 @@ def rotate_refresh_token(db: Session, refresh_token: str):
 
     session = (
         db.query(DeviceSession)
+        .options(joinedload(DeviceSession.user))
         .filter(DeviceSession.refresh_token == token_value, DeviceSession.revoked_at.is_(None))
         .first()
     )
@@ -555,19 +541,16 @@ def rotate_refresh_token(db: Session, refresh_token: str):
         logger.warning("auth.refresh_token user_inactive user_id=%s", session.user_id)
         raise AppException("User not found", status_code=401)
 
-    access_token = create_access_token(session.user_id, session.user.role.value)
-    new_refresh = create_refresh_token(session.user_id)
+    user_id = session.user_id
+    access_token = create_access_token(user_id, session.user.role.value)
+    new_refresh = create_refresh_token(user_id)
     session.revoked_at = utc_now()
-    db.add(
-        DeviceSession(
-            user_id=session.user_id,
-            refresh_token=new_refresh,
-            user_agent=session.user_agent,
-            ip_address=session.ip_address,
-        )
+    db.execute(
+        INSERT_DEVICE_SESSION,
+        {"user_id": user_id, "refresh_token": new_refresh, "user_agent": session.user_agent, "ip_address": session.ip_address},
     )
     db.commit()
-    logger.info("auth.refresh_token rotated user_id=%s", session.user_id)
+    logger.info("auth.refresh_token rotated user_id=%s", user_id)
     return {"accessToken": access_token, "refreshToken": new_refresh}
 
 
@@ -605,7 +588,7 @@ def request_password_reset(db: Session, email: str, user_agent: str = "", ip_add
         f"Reset link (expires in 30 minutes):\n{reset_link}\n\n"
         "If you did not request this, you can ignore this email."
     )
-    send_transactional_email(to_email=user.email, subject="QRing password reset", body=body)
+    _queue_transactional_email(user.email, "QRing password reset", body)
 
     # Token is never returned in normal responses.
     return {"status": "ok", **({"debugToken": token} if settings.DEBUG else {})}
@@ -613,17 +596,17 @@ def request_password_reset(db: Session, email: str, user_agent: str = "", ip_add
 
 def reset_password(db: Session, email: str, token: str, new_password: str):
     login_key = (email or "").strip().lower()
-    user = db.query(User).filter(User.email == login_key).first()
-    if not user or not user.is_active:
-        # Avoid enumeration.
-        return {"status": "ok"}
-
     _validate_password_strength(new_password)
 
     token_value = (token or "").strip()
     if not token_value:
         raise AppException("Reset token is required", status_code=400)
 
+    user = db.query(User).filter(User.email == login_key).first()
+    if not user or not user.is_active:
+        # Same answer as a wrong token so the response does not reveal whether the account exists.
+        raise AppException("Invalid or expired reset token", status_code=401)
+
     token_hash = hash_user_token(token_value)
     now = utc_now()
     row = (
@@ -653,7 +636,7 @@ def reset_password(db: Session, email: str, token: str, new_password: str):
 
 
 def change_password(db: Session, user_id: str, current_password: str, new_password: str):
-    user = db.query(User).filter(User.id == user_id).first()
+    user = get_cached(db, User, user_id)
     if not user:
         raise AppException("User not found", status_code=404)
     if not verify_password(current_password, user.password_hash):
@@ -768,6 +751,28 @@ def verify_email(db: Session, email: str, token: str):
     return {"status": "verified"}
 
 
+def _hit_store_has_room(store: dict[str, list[float]], key: str, now: float, window_seconds: float) -> bool:
+    # Caller holds _auth_lock. Keys embed caller-supplied emails, so the store is capped; sweeping
+    # scans every key, so it runs at most once per window rather than on each new key.
+    if key in store or len(store) < _AUTH_HIT_STORE_MAX_KEYS:
+        return True
+    if now - _hit_store_swept_at.get(id(store), float("-inf")) >= window_seconds:
+        _hit_store_swept_at[id(store)] = now
+        threshold = now - window_seconds
+        for stale_key in [k for k, v in store.items() if not v or v[-1] <= threshold]:
+            del store[stale_key]
+    return len(store) < _AUTH_HIT_STORE_MAX_KEYS
+
+
+def _recent_hits(store: dict[str, list[float]], key: str, now: float, window_seconds: float) -> list[float] | None:
+    """Return the key's hits inside the window, or None when the store is full and the key must be rate-limited."""
+    if not _hit_store_has_room(store, key, now, window_seconds):
+        return None
+    hits = store.setdefault(key, [])
+    hits[:] = [ts for ts in hits if ts > now - window_seconds]
+    return hits
+
+
 def _enforce_email_verify_rate_limit(login_key: str, ip_address: str) -> None:
     # Best-effort brute-force mitigation for OTP verification attempts.
     now = utc_now().timestamp()
@@ -775,11 +780,10 @@ def _enforce_email_verify_rate_limit(login_key: str, ip_address: str) -> None:
     window_seconds = 15 * 60
     max_hits = 12
     with _auth_lock:
-        hits = _email_verify_attempt_hits.setdefault(key, [])
-        threshold = now - window_seconds
-        hits[:] = [ts for ts in hits if ts > threshold]
-        hits.append(now)
-        if len(hits) > max_hits:
+        hits = _recent_hits(_email_verify_attempt_hits, key, now, window_seconds)
+        if hits is not None:
+            hits.append(now)
+        if hits is None or len(hits) > max_hits:
             raise AppException("Too many verification attempts. Please try again later.", status_code=429)
 
 
@@ -832,6 +836,8 @@ def _enforce_login_rate_limit(login_key: str, ip_address: str) -> None:
             blocked_until = _failed_login_blocked_until.get(key, 0.0)
             if blocked_until and now < blocked_until:
                 raise AppException("Too many login attempts. Please retry later.", status_code=429)
+            if not _hit_store_has_room(_failed_login_hits, key, now, _LOGIN_FAILURE_WINDOW_SECONDS):
+                raise AppException("Too many login attempts. Please retry later.", status_code=429)
 
 
 def _record_login_failure(login_key: str, ip_address: str) -> None:
@@ -861,9 +867,9 @@ def _record_login_failure(login_key: str, ip_address: str) -> None:
     ]
     with _auth_lock:
         for key in keys:
-            hits = _failed_login_hits.setdefault(key, [])
-            threshold = now - _LOGIN_FAILURE_WINDOW_SECONDS
-            hits[:] = [ts for ts in hits if ts > threshold]
+            hits = _recent_hits(_failed_login_hits, key, now, _LOGIN_FAILURE_WINDOW_SECONDS)
+            if hits is None:
+                continue
             hits.append(now)
             if len(hits) >= _LOGIN_MAX_FAILURES:
                 _failed_login_blocked_until[key] = now + _LOGIN_LOCK_SECONDS
@@ -898,9 +904,7 @@ def _enforce_token_issue_rate_limit(login_key: str, ip_address: str, purpose: st
     now = utc_now().timestamp()
     key = _token_issue_rate_key(login_key, ip_address, purpose)
     with _auth_lock:
-        hits = _token_issue_hits.setdefault(key, [])
-        threshold = now - _TOKEN_ISSUE_WINDOW_SECONDS
-        hits[:] = [ts for ts in hits if ts > threshold]
-        if len(hits) >= _TOKEN_ISSUE_MAX:
+        hits = _recent_hits(_token_issue_hits, key, now, _TOKEN_ISSUE_WINDOW_SECONDS)
+        if hits is None or len(hits) >= _TOKEN_ISSUE_MAX:
             raise AppException("Too many requests. Please retry later.", status_code=429)
         hits.append(now)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
 import logging
 
@@ -10,6 +9,8 @@ from sqlalchemy.orm import Session
 from app.core.exceptions import AppException
 from app.core.time import ensure_utc, utc_now
 from app.db.models import Appointment, CallSession, User, VisitorSession
+from app.db.uuid7 import uuid7_str
+from app.db.session import get_cached
 try:
     from app.services.payment_service import require_subscription_feature
 except Exception:  # pragma: no cover - local test dependency fallback
@@ -81,7 +82,7 @@ def _resolve_user_display_name(db: Session, user_id: str | None, fallback: str)
     clean_user_id = str(user_id or "").strip()
     if not clean_user_id:
         return fallback
-    user = db.query(User).filter(User.id == clean_user_id).first()
+    user = get_cached(db, User, clean_user_id)
     if not user:
         return fallback
     return (user.full_name or "").strip() or fallback
@@ -187,7 +188,7 @@ async def start_call_session(
         )
         return existing
 
-    call_session_id = str(uuid.uuid4())
+    call_session_id = uuid7_str()
     visitor_request_id = (
         str(visitor_session.request_id or "").strip()
         if visitor_session and visitor_session.request_id
@@ -309,7 +310,7 @@ async def start_call_session(
 
 
 def _get_homeowner_display_name(db: Session, homeowner_id: str) -> str:
-    user = db.query(User).filter(User.id == homeowner_id).first()
+    user = get_cached(db, User, homeowner_id)
     return (user.full_name if user else "") or "Homeowner"
 
 
@@ -429,7 +430,7 @@ def join_call_as_security(db: Session, *, call_session_id: str, security_user_id
         raise AppException("You are not allowed to join this call.", status_code=403)
     if row.status in CALL_TERMINAL_STATUSES:
         raise AppException("Call has ended.", status_code=409)
-    security_user = db.query(User).filter(User.id == security_user_id).first()
+    security_user = get_cached(db, User, security_user_id)
     logger.info(
         "call.join.security call_session_id=%s security_user_id=%s room_name=%s status=%s",
         row.id,
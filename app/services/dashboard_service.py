@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import json
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, raiseload
 
 from app.db.models import Door, Home, Message, Notification, User, VisitorSession
+from app.db.session import get_cached
 
 
 def _status_label(status: str) -> str:
@@ -21,13 +23,23 @@ def _status_label(status: str) -> str:
 
 
 def get_dashboard_overview(db: Session, homeowner_id: str) -> dict:
-    user = db.query(User).filter(User.id == homeowner_id).first()
-    sessions = (
+    user = get_cached(db, User, homeowner_id)
+    # Counts come from one GROUP BY; only the slices the dashboard renders are loaded as rows.
+    status_counts = dict(
+        db.query(VisitorSession.status, func.count(VisitorSession.id))
+        .filter(VisitorSession.homeowner_id == homeowner_id)
+        .group_by(VisitorSession.status)
+        .all()
+    )
+    homeowner_sessions = (
         db.query(VisitorSession)
+        .options(raiseload("*"))
         .filter(VisitorSession.homeowner_id == homeowner_id)
         .order_by(VisitorSession.started_at.desc())
-        .all()
     )
+    recent_sessions = homeowner_sessions.limit(6).all()
+    pending = homeowner_sessions.filter(VisitorSession.status == "pending").limit(10).all()
+    active = homeowner_sessions.filter(VisitorSession.status == "active").limit(1).all()
     doors = (
         db.query(Door, Home)
         .join(Home, Home.id == Door.home_id)
@@ -42,13 +54,10 @@ def get_dashboard_overview(db: Session, homeowner_id: str) -> dict:
         }
         for door, home in doors
     }
-    pending = [s for s in sessions if s.status == "pending"]
-    active = [s for s in sessions if s.status == "active"]
-
+    # Only the serialised columns; full Message rows would be hydrated into the identity map for nothing.
     latest_messages = (
-        db.query(Message)
-        .join(VisitorSession, Message.session_id == VisitorSession.id)
-        .filter(VisitorSession.homeowner_id == homeowner_id)
+        db.query(Message.id, Message.sender_type, Message.body, Message.created_at, Message.read_by_homeowner_at)
+        .filter(Message.session_id.in_(select(VisitorSession.id).where(VisitorSession.homeowner_id == homeowner_id)))
         .order_by(Message.created_at.desc())
         .limit(5)
         .all()
@@ -63,7 +72,7 @@ def get_dashboard_overview(db: Session, homeowner_id: str) -> dict:
     unread_messages = len([m for m in latest_messages if m.sender_type != "homeowner" and m.read_by_homeowner_at is None])
 
     activity_items = []
-    for session in sessions[:6]:
+    for session in recent_sessions:
         door_info = door_map.get(session.door_id, {})
         detail_bits = []
         if session.visitor_label:
@@ -101,9 +110,9 @@ def get_dashboard_overview(db: Session, homeowner_id: str) -> dict:
 
     return {
         "metrics": {
-            "activeVisitors": len(active),
-            "pendingApprovals": len(pending),
-            "callsToday": len([s for s in sessions if s.status in {"active", "approved"}]),
+            "activeVisitors": status_counts.get("active", 0),
+            "pendingApprovals": status_counts.get("pending", 0),
+            "callsToday": status_counts.get("active", 0) + status_counts.get("approved", 0),
             "unreadMessages": unread_messages,
         },
         "activity": activity_items[:8],
@@ -117,7 +126,7 @@ def get_dashboard_overview(db: Session, homeowner_id: str) -> dict:
                 "status": _status_label(s.status),
                 "purpose": s.purpose or "",
             }
-            for s in pending[:10]
+            for s in pending
         ],
         "session": (
             {
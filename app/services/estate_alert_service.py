@@ -31,6 +31,7 @@ from app.db.models import (
     User,
     UserRole,
 )
+from app.db.session import get_cached
 from app.socket.server import sio
 from app.services.provider_integrations import send_push_fcm, send_transactional_email
 from app.services.payment_proof_service import save_payment_proof
@@ -1098,7 +1099,7 @@ def initialize_alert_payment(
     if not alert.amount_due or _to_money(alert.amount_due) <= 0:
         raise AppException("Invalid payment amount", status_code=400)
 
-    homeowner = db.query(User).filter(User.id == homeowner_id).first()
+    homeowner = get_cached(db, User, homeowner_id)
     if not homeowner:
         raise AppException("Homeowner not found", status_code=404)
 
@@ -5,7 +5,7 @@ import json
 from datetime import datetime, timedelta
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 from sqlalchemy.exc import IntegrityError
 
 from app.core.exceptions import AppException
@@ -202,9 +202,13 @@ def list_estate_overview(db: Session, owner_id: str) -> dict[str, Any]:
             db.commit()
 
     estates = db.query(Estate).filter(Estate.owner_id == owner_id).order_by(Estate.created_at.desc()).all()
-    homes = _estate_scope_homes_query(db, owner_id).order_by(Home.created_at.desc()).all()
+    homes = _estate_scope_homes_query(db, owner_id).options(raiseload("*")).order_by(Home.created_at.desc()).all()
     home_ids = [home.id for home in homes]
-    doors = db.query(Door).filter(Door.home_id.in_(home_ids)).order_by(Door.name.asc()).all() if home_ids else []
+    doors = (
+        db.query(Door).options(raiseload("*")).filter(Door.home_id.in_(home_ids)).order_by(Door.name.asc()).all()
+        if home_ids
+        else []
+    )
 
     homeowner_ids = sorted({home.homeowner_id for home in homes if home.homeowner_id})
     homeowners = (
@@ -225,7 +229,7 @@ def list_estate_overview(db: Session, owner_id: str) -> dict[str, Any]:
     qr_rows = db.query(QRCode).filter(QRCode.home_id.in_(home_ids), QRCode.active.is_(True)).all() if home_ids else []
     qr_by_door: dict[str, list[str]] = {}
     for qr in qr_rows:
-        for door_id in [item.strip() for item in (qr.doors_csv or "").split(",") if item.strip()]:
+        for door_id in qr.door_ids:
             qr_by_door.setdefault(door_id, []).append(qr.qr_id)
 
     usage = _usage_for_owner(db, owner_id)
@@ -606,7 +610,7 @@ def create_estate_homeowner(
         qr_id=f"qr-{uuid.uuid4().hex[:12]}",
         plan="single",
         home_id=home.id,
-        doors_csv=door.id,
+        door_ids=[door.id],
         mode="direct",
         estate_id=estate_id,
         active=True,
@@ -844,7 +848,7 @@ def add_estate_door(
             qr_id=f"qr-{uuid.uuid4().hex[:12]}",
             plan=plan,
             home_id=home.id,
-            doors_csv=door.id,
+            door_ids=[door.id],
             mode=mode,
             estate_id=estate_id,
             active=True,
@@ -1018,18 +1022,18 @@ def invite_homeowner(
 
 
 def list_estate_mappings(db: Session, owner_id: str) -> list[dict[str, Any]]:
-    homes = _estate_scope_homes_query(db, owner_id).order_by(Home.created_at.desc()).all()
+    homes = _estate_scope_homes_query(db, owner_id).options(raiseload("*")).order_by(Home.created_at.desc()).all()
     if not homes:
         return []
     home_ids = [home.id for home in homes]
-    doors = db.query(Door).filter(Door.home_id.in_(home_ids)).all()
+    doors = db.query(Door).options(raiseload("*")).filter(Door.home_id.in_(home_ids)).all()
     homeowners = db.query(User).filter(User.id.in_({home.homeowner_id for home in homes})).all()
     homeowner_by_id = {user.id: user for user in homeowners}
 
     qr_rows = db.query(QRCode).filter(QRCode.home_id.in_(home_ids), QRCode.active.is_(True)).all()
     qr_by_door: dict[str, list[str]] = {}
     for qr in qr_rows:
-        for door_id in [item.strip() for item in (qr.doors_csv or "").split(",") if item.strip()]:
+        for door_id in qr.door_ids:
             qr_by_door.setdefault(door_id, []).append(qr.qr_id)
 
     door_by_home: dict[str, list[Door]] = {}
@@ -1174,14 +1178,14 @@ def create_estate_shared_selector_qr(db: Session, owner_id: str, estate_id: str)
             "qrId": existing.qr_id,
             "scanUrl": f"/scan/{existing.qr_id}",
             "mode": existing.mode,
-            "doorCount": len([d for d in (existing.doors_csv or "").split(",") if d.strip()]),
+            "doorCount": len(existing.door_ids),
         }
 
     qr = QRCode(
         qr_id=f"qr-{uuid.uuid4().hex[:12]}",
         plan="multi",
         home_id=doors[0].home_id,
-        doors_csv=",".join([door.id for door in doors]),
+        door_ids=[door.id for door in doors],
         mode="selector",
         estate_id=estate_id,
         active=True,
@@ -1204,7 +1208,7 @@ def create_estate_shared_selector_qr(db: Session, owner_id: str, estate_id: str)
                 "qrId": existing_after.qr_id,
                 "scanUrl": f"/scan/{existing_after.qr_id}",
                 "mode": existing_after.mode,
-                "doorCount": len([d for d in (existing_after.doors_csv or "").split(",") if d.strip()]),
+                "doorCount": len(existing_after.door_ids),
             }
         raise
     db.refresh(qr)
@@ -1234,7 +1238,7 @@ def list_estate_shared_selector_qrs(db: Session, owner_id: str, estate_id: str)
             "plan": row.plan,
             "active": bool(row.active),
             "createdAt": row.created_at.isoformat() if row.created_at else None,
-            "doorCount": len([v for v in (row.doors_csv or "").split(",") if v.strip()]),
+            "doorCount": len(row.door_ids),
         }
         for row in rows
     ]
@@ -7,10 +7,13 @@ import logging
 import uuid
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from app.core.time import utc_now
 from app.db.models import Appointment, Door, Estate, Home, Message, Notification, QRCode, User, UserRole, VisitorSession
+from app.db.session import get_cached
+from app.db.stmts import INSERT_MESSAGE
+from app.db.uuid7 import uuid7_str
 from app.core.exceptions import AppException
 from app.services.advanced_service import resolve_session_snapshot_public_url, resolve_snapshot_public_url
 from app.services.notification_service import create_notification
@@ -124,7 +127,7 @@ def _resolve_session_snapshot_payload(
     snapshot_audit_id = str(source.get("snapshotAuditId") or "").strip()
     door = db.query(Door).filter(Door.id == session.door_id).first()
     security_user = (
-        db.query(User).filter(User.id == session.handled_by_security_id).first()
+        get_cached(db, User, session.handled_by_security_id)
         if session.handled_by_security_id
         else None
     )
@@ -580,20 +583,25 @@ def create_homeowner_session_message(
     if not body:
         return None
 
-    homeowner = db.query(User).filter(User.id == homeowner_id).first()
+    homeowner = get_cached(db, User, homeowner_id)
     recipients = _security_recipients_for_session(db, session)
     primary_recipient = recipients[0] if recipients else None
-    message = Message(
-        session_id=session_id,
-        sender_type="homeowner",
-        sender_id=homeowner_id,
-        receiver_id=primary_recipient.id if primary_recipient else None,
-        body=body,
-        created_at=utc_now(),
+    message_id = uuid7_str()
+    created_at = utc_now()
+    receiver_id = primary_recipient.id if primary_recipient else None
+    db.execute(
+        INSERT_MESSAGE,
+        {
+            "id": message_id,
+            "session_id": session_id,
+            "sender_type": "homeowner",
+            "sender_id": homeowner_id,
+            "receiver_id": receiver_id,
+            "body": body,
+            "created_at": created_at,
+        },
     )
-    db.add(message)
     db.commit()
-    db.refresh(message)
     recipient_ids = [row.id for row in recipients]
     for recipient in recipients:
         create_notification(
@@ -603,7 +611,7 @@ def create_homeowner_session_message(
             payload={
                 "type": "homeowner.message",
                 "sessionId": session.id,
-                "messageId": message.id,
+                "messageId": message_id,
                 "visitorName": session.visitor_label or "Visitor",
                 "visitorPhone": session.visitor_phone,
                 "purpose": session.purpose,
@@ -612,23 +620,23 @@ def create_homeowner_session_message(
                 "message": body,
                 "route": f"/dashboard/security/messages?sessionId={session.id}",
             },
-            idempotency_key=f"homeowner-message:{message.id}:{recipient.id}",
+            idempotency_key=f"homeowner-message:{message_id}:{recipient.id}",
             source="homeowner_service.create_homeowner_session_message",
         )
     return {
-        "messageId": message.id,
-        "id": message.id,
-        "sessionId": message.session_id,
-        "text": message.body,
+        "messageId": message_id,
+        "id": message_id,
+        "sessionId": session_id,
+        "text": body,
         "messageType": "text",
         "snapshotUrl": None,
         "photoUrl": None,
         "senderRole": "homeowner",
-        "senderType": message.sender_type,
+        "senderType": "homeowner",
         "displayName": "Homeowner",
-        "timestamp": message.created_at.isoformat(),
-        "at": message.created_at.isoformat(),
-        "receiverId": message.receiver_id,
+        "timestamp": created_at.isoformat(),
+        "at": created_at.isoformat(),
+        "receiverId": receiver_id,
         "recipientIds": recipient_ids,
     }
 
@@ -644,29 +652,33 @@ def create_visitor_session_message(
     if not body:
         return None
 
-    message = Message(
-        session_id=session_id,
-        sender_type="visitor",
-        receiver_id=session.homeowner_id,
-        body=body,
-        created_at=utc_now(),
+    message_id = uuid7_str()
+    created_at = utc_now()
+    db.execute(
+        INSERT_MESSAGE,
+        {
+            "id": message_id,
+            "session_id": session_id,
+            "sender_type": "visitor",
+            "receiver_id": session.homeowner_id,
+            "body": body,
+            "created_at": created_at,
+        },
     )
-    db.add(message)
     db.commit()
-    db.refresh(message)
     return {
-        "messageId": message.id,
-        "id": message.id,
-        "sessionId": message.session_id,
-        "text": message.body,
+        "messageId": message_id,
+        "id": message_id,
+        "sessionId": session_id,
+        "text": body,
         "messageType": "text",
         "snapshotUrl": None,
         "photoUrl": None,
         "senderRole": "visitor",
-        "senderType": message.sender_type,
+        "senderType": "visitor",
         "displayName": session.visitor_label or "Visitor",
-        "timestamp": message.created_at.isoformat(),
-        "at": message.created_at.isoformat(),
+        "timestamp": created_at.isoformat(),
+        "at": created_at.isoformat(),
     }
 
 
@@ -695,20 +707,19 @@ def delete_homeowner_session_message(
 
 
 def list_homeowner_doors(db: Session, homeowner_id: str) -> list[dict[str, Any]]:
-    homes = db.query(Home).filter(Home.homeowner_id == homeowner_id).all()
+    homes = db.query(Home).options(raiseload("*")).filter(Home.homeowner_id == homeowner_id).all()
     if not homes:
         return []
 
     home_ids = [home.id for home in homes]
     home_name_by_id = {home.id: home.name for home in homes}
 
-    doors = db.query(Door).filter(Door.home_id.in_(home_ids)).order_by(Door.name.asc()).all()
+    doors = db.query(Door).options(raiseload("*")).filter(Door.home_id.in_(home_ids)).order_by(Door.name.asc()).all()
     qr_codes = db.query(QRCode).filter(QRCode.home_id.in_(home_ids), QRCode.active.is_(True)).all()
 
     qr_by_door: dict[str, list[str]] = defaultdict(list)
     for qr in qr_codes:
-        door_ids = [door_id.strip() for door_id in (qr.doors_csv or "").split(",") if door_id.strip()]
-        for door_id in door_ids:
+        for door_id in qr.door_ids:
             qr_by_door[door_id].append(qr.qr_id)
 
     return [
@@ -830,7 +841,7 @@ def create_homeowner_door(
             qr_id=f"qr-{uuid.uuid4().hex[:12]}",
             plan=qr_plan,
             home_id=home.id,
-            doors_csv=door.id,
+            door_ids=[door.id],
             mode=mode,
             estate_id=home.estate_id,
             active=True,
@@ -916,7 +927,7 @@ def generate_homeowner_door_qr(
         qr_id=qr_id,
         plan=plan,
         home_id=home.id,
-        doors_csv=door.id,
+        door_ids=[door.id],
         mode=mode,
         estate_id=home.estate_id,
         active=True,
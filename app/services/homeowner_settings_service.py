@@ -10,6 +10,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from app.db.models import Door, Estate, Home, User
 from app.db.models import HomeownerSetting
 from app.db.base import Base
+from app.db.session import get_cached
 from app.services.payment_service import get_effective_subscription
 
 logger = logging.getLogger(__name__)
@@ -38,7 +39,7 @@ def get_or_create_homeowner_settings(db: Session, user_id: str) -> HomeownerSett
 
 def get_homeowner_settings_payload(db: Session, user_id: str) -> dict:
     row = get_or_create_homeowner_settings(db, user_id)
-    user = db.query(User).filter(User.id == user_id).first()
+    user = get_cached(db, User, user_id)
     homes = db.query(Home).filter(Home.homeowner_id == user_id).order_by(Home.created_at.asc()).all()
     home_ids = [home.id for home in homes]
     doors = db.query(Door).filter(Door.home_id.in_(home_ids)).all() if home_ids else []
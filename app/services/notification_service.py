@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-import json
 import asyncio
 import logging
 
+import orjson
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.core.time import utc_now
 from app.core.redis import get_redis_client, prefixed_key
 from app.db.models import Appointment, Notification, VisitorSession
+from app.db.stmts import INSERT_NOTIFICATION
+from app.db.uuid7 import uuid7_str
 from app.services.provider_integrations import send_push_fcm
 from app.services.realtime_notification_service import (
     build_notification_envelope,
@@ -52,9 +55,9 @@ def _safe_json_payload(value) -> dict:
     if isinstance(value, dict):
         return value
     try:
-        parsed = json.loads(value or "{}")
+        parsed = orjson.loads(value or "{}")
         return parsed if isinstance(parsed, dict) else {}
-    except Exception:
+    except orjson.JSONDecodeError:
         return {}
 
 
@@ -66,7 +69,7 @@ def create_notification(
     *,
     idempotency_key: str | None = None,
     source: str = "notification_service",
-) -> Notification | None:
+) -> str | None:
     event_type = str(kind or payload.get("type") or "notification").strip() or "notification"
     session_id = str(payload.get("sessionId") or payload.get("session_id") or "").strip() or None
     effective_key = str(
@@ -89,8 +92,11 @@ def create_notification(
             source,
         )
         return None
+    # Id and timestamp are assigned up front so the row is written once, with its final payload, in one commit.
+    notification_id = uuid7_str()
+    created_at = utc_now()
     envelope = build_notification_envelope(
-        notification_id=None,
+        notification_id=notification_id,
         event_type=event_type,
         idempotency_key=effective_key,
         session_id=session_id,
@@ -98,15 +104,12 @@ def create_notification(
         source=source,
         payload=payload,
     )
-    notification = Notification(
-        user_id=user_id,
-        kind=kind,
-        payload=json.dumps(envelope),
+    notification_payload = orjson.dumps(envelope, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    db.execute(
+        INSERT_NOTIFICATION,
+        {"id": notification_id, "user_id": user_id, "kind": kind, "payload": notification_payload, "created_at": created_at},
     )
-    db.add(notification)
     db.commit()
-    db.refresh(notification)
-    envelope["notificationId"] = notification.id
     try:
         message = str((envelope or {}).get("message") or "You have a new alert.")
         route = str((envelope or {}).get("route") or "")
@@ -129,7 +132,7 @@ def create_notification(
             body=message,
             data={
                 "kind": kind,
-                "notificationId": notification.id,
+                "notificationId": notification_id,
                 "eventId": envelope.get("eventId"),
                 "idempotencyKey": envelope.get("idempotencyKey"),
                 "type": envelope.get("type"),
@@ -146,12 +149,12 @@ def create_notification(
         # Push failures must not block notification creation.
         pass
     payload_for_socket = {
-        "id": notification.id,
-        "kind": notification.kind,
-        "payload": notification.payload,
+        "id": notification_id,
+        "kind": kind,
+        "payload": notification_payload,
         "readAt": None,
-        "createdAt": notification.created_at.isoformat(),
-        "notificationId": notification.id,
+        "createdAt": created_at.isoformat(),
+        "notificationId": notification_id,
         "eventId": envelope.get("eventId"),
         "idempotencyKey": envelope.get("idempotencyKey"),
         "type": envelope.get("type"),
@@ -160,13 +163,6 @@ def create_notification(
         "timestamp": envelope.get("timestamp"),
         "source": source,
     }
-    notification.payload = json.dumps(envelope)
-    db.commit()
-    db.refresh(notification)
-    db_payload = {
-        **payload_for_socket,
-        "payload": notification.payload,
-    }
     _schedule_dashboard_emit(
         emit_dashboard_notification,
         event_name="notification.created",
@@ -175,11 +171,11 @@ def create_notification(
             f"user:{user_id}",
             f"user:{user_id}:notifications",
         ],
-        payload=db_payload,
-        idempotency_key=f"dashboard:notification.created:{notification.id}",
+        payload=payload_for_socket,
+        idempotency_key=f"dashboard:notification.created:{notification_id}",
         source=source,
     )
-    return notification
+    return notification_id
 
 
 def list_notifications(db: Session, user_id: str) -> list[dict]:
@@ -194,11 +190,7 @@ def list_notifications(db: Session, user_id: str) -> list[dict]:
     session_ids: set[str] = set()
     parsed_payloads: dict[str, dict] = {}
     for row in rows:
-        payload_raw = row.payload or "{}"
-        try:
-            payload = json.loads(payload_raw)
-        except Exception:
-            payload = {}
+        payload = _safe_json_payload(row.payload)
         parsed_payloads[row.id] = payload
         appointment_id = str(payload.get("appointmentId") or "").strip()
         session_id = str(payload.get("sessionId") or "").strip()
@@ -305,16 +297,16 @@ def mark_notification_read(db: Session, user_id: str, notification_id: str) -> d
 
 
 def mark_all_notifications_read(db: Session, user_id: str) -> int:
-    rows = (
-        db.query(Notification)
-        .filter(Notification.user_id == user_id, Notification.read_at.is_(None))
-        .all()
+    now = utc_now()
+    result = db.execute(
+        update(Notification)
+        .where(Notification.user_id == user_id, Notification.read_at.is_(None))
+        .values(read_at=now)
+        .execution_options(synchronize_session=False)
     )
-    if not rows:
+    updated = int(result.rowcount or 0)
+    if not updated:
         return 0
-    now = utc_now()
-    for row in rows:
-        row.read_at = now
     db.commit()
     _schedule_dashboard_emit(
         emit_dashboard_notification,
@@ -325,12 +317,12 @@ def mark_all_notifications_read(db: Session, user_id: str) -> int:
             idempotency_key=f"notifications.read_all:{user_id}:{now.isoformat()}",
             user_id=user_id,
             source="notification_service.mark_all_read",
-            payload={"action": "read_all", "updated": len(rows), "readAt": now.isoformat()},
+            payload={"action": "read_all", "updated": updated, "readAt": now.isoformat()},
         ),
         idempotency_key=f"dashboard:notifications.read_all:{user_id}:{now.isoformat()}",
         source="notification_service.mark_all_read",
     )
-    return len(rows)
+    return updated
 
 
 def clear_all_notifications(db: Session, user_id: str) -> int:
@@ -376,11 +368,7 @@ def mark_session_notifications_read(
     now = utc_now()
     updated = 0
     for row in rows:
-        payload_raw = row.payload or "{}"
-        try:
-            payload = json.loads(payload_raw)
-        except Exception:
-            payload = {}
+        payload = _safe_json_payload(row.payload)
         payload_session = str(payload.get("sessionId") or "").strip()
         payload_appointment = str(payload.get("appointmentId") or "").strip()
         matches_session = bool(target_session and payload_session and payload_session == target_session)
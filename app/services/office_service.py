@@ -32,6 +32,8 @@ from app.db.models import (
     UserRole,
     VisitorSession,
 )
+from app.db.uuid7 import uuid7_str
+from app.db.session import get_cached
 from app.services.notification_service import create_notification
 from app.services.provider_integrations import send_transactional_email
 from app.services.realtime_notification_service import (
@@ -326,7 +328,7 @@ def _staff_conversation_item(
     conversation: OfficeStaffConversation,
     current_user_id: str | None = None,
 ) -> dict[str, Any]:
-    staff = db.query(User).filter(User.id == conversation.staff_user_id).first()
+    staff = get_cached(db, User, conversation.staff_user_id)
     member = (
         db.query(OfficeMember)
         .filter(OfficeMember.office_id == office.id, OfficeMember.user_id == conversation.staff_user_id)
@@ -477,7 +479,7 @@ def complete_office_profile(
     office_address: str | None = None,
     number_of_employees: int | None = None,
 ) -> dict[str, Any]:
-    user = db.query(User).filter(User.id == user_id).first()
+    user = get_cached(db, User, user_id)
     if not user:
         raise ValueError("User not found")
     if str(getattr(user.role, "value", user.role) or "").lower() != "office":
@@ -525,7 +527,7 @@ def complete_office_profile(
             qr_id=qr_id,
             plan="office",
             home_id=reception_home.id,
-            doors_csv=reception_door.id,
+            door_ids=[reception_door.id],
             mode="direct",
             estate_id=None,
             active=True,
@@ -680,7 +682,7 @@ def send_office_staff_details(
     if not member or not member.user_id:
         raise ValueError("Staff member not found")
 
-    user = db.query(User).filter(User.id == member.user_id).first()
+    user = get_cached(db, User, member.user_id)
     if not user:
         raise ValueError("Staff user not found")
 
@@ -882,7 +884,7 @@ def _create_office_direct_call_session(
     if active:
         return active
     row = CallSession(
-        id=str(uuid.uuid4()),
+        id=uuid7_str(),
         appointment_id=None,
         visitor_session_id=None,
         security_user_id=caller_id,
@@ -959,7 +961,7 @@ def request_office_call(
         )
     else:
         raise ValueError("visitorSessionId is required for this call target")
-    caller = db.query(User).filter(User.id == user_id).first()
+    caller = get_cached(db, User, user_id)
     caller_name = (caller.full_name if caller else "") or "Office"
     target_user_id = receiver_id or (session.homeowner_id if session else None)
     payload_session_id = session.id if session else row.id
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import hmac
+import time
 import uuid
 import re
 from datetime import datetime, timedelta
@@ -10,7 +11,9 @@ from hashlib import sha512
 from typing import Any
 from urllib.parse import urlparse
 from urllib import error, request
+from threading import Lock
 
+from sqlalchemy import event, inspect
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
@@ -31,6 +34,7 @@ from app.db.models import (
     User,
     UserRole,
 )
+from app.db.session import get_cached
 from app.services.subscription_policy_service import (
     build_subscription_summary,
     create_subscription_event,
@@ -42,6 +46,10 @@ settings = get_settings()
 REFERRAL_REWARD_AMOUNT = 2000
 DEFAULT_GRACE_DAYS = 5
 SIGNUP_TRIAL_DAYS = 30
+PLAN_AMOUNT_CACHE_TTL_SECONDS = 60.0
+
+_plan_amount_cache: tuple[float, dict[str, int]] | None = None
+_plan_amount_cache_lock = Lock()
 
 DEFAULT_PLAN_CATALOG = [
     {
@@ -1076,7 +1084,7 @@ def _ensure_subscription_billing_record(
     if row:
         return row
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = get_cached(db, User, user_id)
     plan_meta = get_plan_or_raise(db, plan_id, include_inactive=True)
     tenant_type, tenant_id, billing_scope = _resolve_subscription_scope(user, str(plan_meta.get("audience") or "homeowner"))
     current_time = utc_now()
@@ -1291,7 +1299,7 @@ def _finalize_successful_payment(
 
 
 def ensure_signup_trial_subscription(db: Session, user_id: str, *, now: datetime | None = None) -> Subscription:
-    user = db.query(User).filter(User.id == user_id).first()
+    user = get_cached(db, User, user_id)
     if not user:
         raise AppException("User not found", status_code=404)
 
@@ -1382,7 +1390,7 @@ def activate_subscription(
     payment_status: str | None = None,
 ):
     plan_meta = get_plan_or_raise(db, plan, include_inactive=True)
-    user = db.query(User).filter(User.id == user_id).first()
+    user = get_cached(db, User, user_id)
     if user and plan_meta.get("audience") not in {"legacy", user.role.value}:
         raise AppException("Selected plan is not available for this account type.", status_code=400)
     if plan_meta.get("manualActivationRequired"):
@@ -1443,7 +1451,7 @@ def _award_referral_reward_if_eligible(db: Session, subscribed_user_id: str, pla
     if int(plan_meta.get("amount") or 0) <= 0:
         return
 
-    user = db.query(User).filter(User.id == subscribed_user_id).first()
+    user = get_cached(db, User, subscribed_user_id)
     if not user or not user.referred_by_user_id:
         return
 
@@ -1455,7 +1463,7 @@ def _award_referral_reward_if_eligible(db: Session, subscribed_user_id: str, pla
     if already_rewarded:
         return
 
-    referrer = db.query(User).filter(User.id == user.referred_by_user_id).first()
+    referrer = get_cached(db, User, user.referred_by_user_id)
     if not referrer:
         return
 
@@ -1490,7 +1498,7 @@ def list_payment_purposes(db: Session):
 
 
 def get_referral_summary(db: Session, user_id: str) -> dict:
-    user = db.query(User).filter(User.id == user_id).first()
+    user = get_cached(db, User, user_id)
     if not user:
         raise AppException("User not found", status_code=404)
 
@@ -1560,6 +1568,39 @@ def list_subscription_plans(db: Session, include_inactive: bool = False):
     return [_plan_payload(row, _catalog_row_by_id(row.id)) for row in rows]
 
 
+def invalidate_plan_amount_cache() -> None:
+    global _plan_amount_cache
+    with _plan_amount_cache_lock:
+        _plan_amount_cache = None
+
+
+@event.listens_for(SubscriptionPlan, "after_insert")
+@event.listens_for(SubscriptionPlan, "after_delete")
+def _invalidate_plan_amounts_on_write(_mapper, _connection, _target: SubscriptionPlan) -> None:
+    invalidate_plan_amount_cache()
+
+
+@event.listens_for(SubscriptionPlan, "after_update")
+def _invalidate_plan_amounts_on_update(_mapper, _connection, target: SubscriptionPlan) -> None:
+    # _ensure_default_plans() reassigns every column on each call; only a real amount change drops the cache.
+    if inspect(target).attrs.amount.history.has_changes():
+        invalidate_plan_amount_cache()
+
+
+def get_plan_amount_map(db: Session) -> dict[str, int]:
+    # Plans change rarely, so admin pages share one {plan_id: amount} map for a short TTL.
+    global _plan_amount_cache
+    now = time.monotonic()
+    with _plan_amount_cache_lock:
+        cached = _plan_amount_cache
+    if cached and cached[0] > now:
+        return cached[1]
+    amounts = {plan["id"]: int(plan["amount"]) for plan in list_subscription_plans(db, include_inactive=True)}
+    with _plan_amount_cache_lock:
+        _plan_amount_cache = (now + PLAN_AMOUNT_CACHE_TTL_SECONDS, amounts)
+    return amounts
+
+
 def get_plan_or_raise(db: Session, plan_id: str, include_inactive: bool = False, user: User | None = None, *, now: datetime | None = None):
     _ensure_default_plans(db)
     q = db.query(SubscriptionPlan).filter(SubscriptionPlan.id == plan_id)
@@ -1608,7 +1649,7 @@ def get_user_subscription(db: Session, user_id: str):
 
 def get_effective_subscription(db: Session, user_id: str, user_role: str | None = None):
     try:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = get_cached(db, User, user_id)
     except Exception:
         user = None
     audience = (user_role or (user.role.value if user else "") or "homeowner").strip().lower()
@@ -1655,7 +1696,7 @@ def get_effective_subscription(db: Session, user_id: str, user_role: str | None
     trial_user = user
     if subscription_owner_id and subscription_owner_id != user_id:
         try:
-            trial_user = db.query(User).filter(User.id == subscription_owner_id).first() or user
+            trial_user = get_cached(db, User, subscription_owner_id) or user
         except Exception:
             trial_user = user
     try:
@@ -2113,20 +2154,28 @@ def verify_paystack_and_activate(db: Session, reference: str, user_id: str):
     }
 
 
-def handle_paystack_webhook(db: Session, raw_body: bytes, signature: str | None):
+def new_paystack_webhook_mac(signature: str | None) -> hmac.HMAC:
+    # Validates configuration and the signature header up front so callers can hash the body while reading it.
     paystack_secret = _normalize_secret(settings.PAYSTACK_SECRET_KEY)
     if not paystack_secret:
         raise AppException("Paystack is not configured", status_code=500)
     if not signature:
         raise AppException("Missing Paystack signature", status_code=400)
+    return hmac.new(paystack_secret.encode("utf-8"), digestmod=sha512)
 
-    computed = hmac.new(
-        paystack_secret.encode("utf-8"),
-        msg=raw_body,
-        digestmod=sha512,
-    ).hexdigest()
 
-    if not hmac.compare_digest(computed, signature):
+def handle_paystack_webhook(
+    db: Session,
+    raw_body: bytes,
+    signature: str | None,
+    computed_signature: str | None = None,
+):
+    if computed_signature is None:
+        mac = new_paystack_webhook_mac(signature)
+        mac.update(raw_body)
+        computed_signature = mac.hexdigest()
+
+    if not signature or not hmac.compare_digest(computed_signature, signature):
         raise AppException("Invalid Paystack signature", status_code=401)
 
     try:
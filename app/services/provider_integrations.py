@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
 from app.db.models import PushSubscription, User
+from app.db.session import get_cached
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -427,4 +428,4 @@ def recognize_face_provider(
 
 
 def get_user_contact(db: Session, *, user_id: str) -> User | None:
-    return db.query(User).filter(User.id == user_id).first()
+    return get_cached(db, User, user_id)
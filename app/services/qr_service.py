@@ -86,7 +86,7 @@ def resolve_qr(db: Session, qr_id: str) -> dict:
             db.commit()
             raise AppException("Estate subscription expired. QR codes are inactive.", status_code=402)
 
-    door_ids = [d.strip() for d in qr.doors_csv.split(",") if d.strip()]
+    door_ids = qr.door_ids
     rows = (
         db.query(Door, Home, User)
         .join(Home, Home.id == Door.home_id)
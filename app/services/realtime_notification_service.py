@@ -165,6 +165,14 @@ async def emit_socket_notification(
         return False
 
 
+def dashboard_activity_rooms(homeowner_id: str | None, estate_id: str | None = None) -> list[str]:
+    # Rooms joined on dashboard connect; activity patches go to them instead of the whole namespace.
+    rooms = [f"user:{homeowner_id}"] if homeowner_id else []
+    if estate_id:
+        rooms.append(f"estate_{estate_id}")
+    return rooms
+
+
 async def emit_dashboard_notification(
     *,
     event_name: str,
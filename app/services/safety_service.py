@@ -19,7 +19,7 @@ from app.core.config import get_settings
 from app.core.exceptions import AppException
 from app.core.time import utc_now
 from app.db.base import Base
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, get_cached
 from app.db.models import (
     AlertDeliveryStatus,
     AuditLog,
@@ -734,7 +734,7 @@ def _panic_rooms(panic: PanicEvent, recipient_ids: list[str]) -> list[str]:
 
 
 def serialize_panic_event(db: Session, panic: PanicEvent) -> dict[str, Any]:
-    trigger_user = db.query(User).filter(User.id == panic.user_id).first()
+    trigger_user = get_cached(db, User, panic.user_id)
     responders = _parse_json_list(getattr(panic, "responder_details_json", "[]"))
     false_reports = _parse_recipient_user_ids(getattr(panic, "false_report_user_ids_json", "[]"))
     ignored_user_ids = _parse_recipient_user_ids(getattr(panic, "ignored_user_ids_json", "[]"))
@@ -852,7 +852,7 @@ def trigger_panic_event(
 ) -> dict[str, Any]:
     target_user = actor
     if user_id and actor.role == UserRole.admin:
-        loaded = db.query(User).filter(User.id == user_id).first()
+        loaded = get_cached(db, User, user_id)
         if not loaded:
             raise AppException("User not found.", status_code=404)
         target_user = loaded
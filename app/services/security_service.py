@@ -10,6 +10,9 @@ from sqlalchemy.orm import Session
 from app.core.exceptions import AppException
 from app.core.time import utc_now
 from app.db.models import AuditLog, Appointment, CallSession, Door, Estate, EstateAlert, GateLog, Home, HomeownerSetting, Message, Notification, Office, OfficeMember, User, UserRole, VisitorSession
+from app.db.session import get_cached
+from app.db.stmts import INSERT_MESSAGE
+from app.db.uuid7 import uuid7_str
 from app.services.notification_service import create_notification
 
 OPEN_SECURITY_STATUSES = {"submitted", "received_by_security", "forwarded_to_homeowner", "approved"}
@@ -243,7 +246,7 @@ def serialize_security_session(db: Session, session: VisitorSession) -> dict[str
     door = db.query(Door).filter(Door.id == session.door_id).first()
     home = db.query(Home).filter(Home.id == session.home_id).first()
     estate = db.query(Estate).filter(Estate.id == (session.estate_id or (home.estate_id if home else None))).first()
-    security_user = db.query(User).filter(User.id == session.handled_by_security_id).first() if session.handled_by_security_id else None
+    security_user = get_cached(db, User, session.handled_by_security_id) if session.handled_by_security_id else None
     session_route = f"/session/{session.id}/message"
     request_source = (session.request_source or "").strip().lower()
     if request_source not in {"visitor_qr", "gateman_assisted"}:
@@ -712,24 +715,28 @@ def create_security_session_message(
 
     session.communication_status = "chatting"
     sender_type = "office" if security_user.role in {UserRole.office, UserRole.office_staff} else "security"
-    message = Message(
-        session_id=session_id,
-        sender_type=sender_type,
-        sender_id=security_user.id,
-        receiver_id=session.homeowner_id,
-        body=body,
-        created_at=utc_now(),
+    message_id = uuid7_str()
+    created_at = utc_now()
+    db.execute(
+        INSERT_MESSAGE,
+        {
+            "id": message_id,
+            "session_id": session_id,
+            "sender_type": sender_type,
+            "sender_id": security_user.id,
+            "receiver_id": session.homeowner_id,
+            "body": body,
+            "created_at": created_at,
+        },
     )
-    db.add(message)
     db.commit()
-    db.refresh(message)
     return {
-        "id": message.id,
-        "sessionId": message.session_id,
-        "text": message.body,
-        "senderType": message.sender_type,
+        "id": message_id,
+        "sessionId": session_id,
+        "text": body,
+        "senderType": sender_type,
         "displayName": security_user.full_name or ("Office" if security_user.role in {UserRole.office, UserRole.office_staff} else "Security"),
-        "at": message.created_at.isoformat(),
+        "at": created_at.isoformat(),
     }
 
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
+from sqlalchemy import Row, func, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
@@ -110,7 +111,8 @@ def create_visitor_session(
     )
     db.add(session)
     try:
-        db.commit()
+        # Flush only: the insert and the trust-rule evaluation below are committed together.
+        db.flush()
     except IntegrityError:
         db.rollback()
         if request_id:
@@ -162,3 +164,24 @@ def mark_session_status(db: Session, session_id: str, status: str) -> VisitorSes
     db.commit()
     db.refresh(session)
     return session
+
+
+def update_session_status_for_homeowner(db: Session, session_id: str, homeowner_id: str, status: str) -> Row | None:
+    # Single UPDATE ... RETURNING with the same timestamp rules as mark_session_status, scoped to the owner.
+    now = utc_now()
+    values: dict = {"status": status, "state_updated_at": now}
+    if status in {"rejected", "closed", "completed"}:
+        values["ended_at"] = func.coalesce(VisitorSession.ended_at, now)
+    if status in {"approved", "rejected"}:
+        values["homeowner_decision_at"] = func.coalesce(VisitorSession.homeowner_decision_at, now)
+    if status == "rejected":
+        values["gate_status"] = func.coalesce(func.nullif(VisitorSession.gate_status, ""), "denied_at_gate")
+    row = db.execute(
+        update(VisitorSession)
+        .where(VisitorSession.id == session_id, VisitorSession.homeowner_id == homeowner_id)
+        .values(**values)
+        .returning(VisitorSession.id, VisitorSession.status, VisitorSession.appointment_id),
+        execution_options={"synchronize_session": False},
+    ).first()
+    db.commit()
+    return row
@@ -3,14 +3,15 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-import uuid
 from datetime import datetime
 
 from app.core.config import get_settings
 from app.core.time import utc_now
 from app.core.security import decode_token
-from app.db.models import CallSession, Estate, Home, Office, OfficeMember, ResidentSetting, Message, Notification, User, UserRole, VisitorSession
-from app.db.session import SessionLocal
+from app.db.models import CallSession, Estate, Home, Office, OfficeMember, ResidentSetting, Notification, User, UserRole, VisitorSession
+from app.db.session import SessionLocal, get_cached
+from app.db.stmts import INSERT_MESSAGE
+from app.db.uuid7 import uuid7_str
 from app.socket.contracts import RealtimeEvent
 from app.socket.manager import socket_state
 from app.services.call_service import (
@@ -141,7 +142,7 @@ def register_socket_events(sio):
             if session and user_id == session.homeowner_id:
                 role = "homeowner"
             else:
-                user = db.query(User).filter(User.id == user_id).first()
+                user = get_cached(db, User, user_id)
                 if user and user.role == UserRole.security:
                     role = "security"
                 elif user and user.role in {UserRole.office, UserRole.office_staff}:
@@ -180,7 +181,7 @@ def register_socket_events(sio):
         if sender_user_id and sender_user_id == session.homeowner_id:
             return "homeowner"
         if sender_user_id:
-            user = db.query(User).filter(User.id == sender_user_id).first()
+            user = get_cached(db, User, sender_user_id)
             if user and user.role == UserRole.security:
                 return "security"
             if user and user.role in {UserRole.office, UserRole.office_staff}:
@@ -320,21 +321,23 @@ def register_socket_events(sio):
                     else:
                         from app.db.models import User
 
-                        sender_user = db.query(User).filter(User.id == sender_user_id).first()
+                        sender_user = get_cached(db, User, sender_user_id)
                         if sender_user and sender_user.role.value == "security":
                             resolved_sender_type = "security"
                         elif sender_user and sender_user.role.value in {"office", "office_staff"}:
                             resolved_sender_type = "office"
-                message = Message(
-                    id=message_id,
-                    session_id=session_id,
-                    sender_type=resolved_sender_type,
-                    sender_id=sender_user_id,
-                    receiver_id=session.homeowner_id if resolved_sender_type != "homeowner" else None,
-                    body=body,
-                    created_at=datetime.fromisoformat(created_at_iso),
+                db.execute(
+                    INSERT_MESSAGE,
+                    {
+                        "id": message_id,
+                        "session_id": session_id,
+                        "sender_type": resolved_sender_type,
+                        "sender_id": sender_user_id,
+                        "receiver_id": session.homeowner_id if resolved_sender_type != "homeowner" else None,
+                        "body": body,
+                        "created_at": datetime.fromisoformat(created_at_iso),
+                    },
                 )
-                db.add(message)
                 db.commit()
 
                 await sio.emit(
@@ -386,7 +389,7 @@ def register_socket_events(sio):
             await sio.enter_room(sid, f"user_{user_id}", namespace=settings.DASHBOARD_NAMESPACE)
             db = SessionLocal()
             try:
-                user = db.query(User).filter(User.id == user_id).first()
+                user = get_cached(db, User, user_id)
                 if user:
                     estate_id = user.estate_id
                     if not estate_id and user.role == UserRole.estate:
@@ -429,7 +432,7 @@ def register_socket_events(sio):
             await sio.enter_room(sid, f"homeowner:{user_id}", namespace=settings.SIGNALING_NAMESPACE)
             db = SessionLocal()
             try:
-                user = db.query(User).filter(User.id == user_id).first()
+                user = get_cached(db, User, user_id)
                 if user and user.role in {UserRole.office, UserRole.office_staff}:
                     await sio.enter_room(sid, f"office:{user_id}", namespace=settings.SIGNALING_NAMESPACE)
                 if user:
@@ -497,7 +500,7 @@ def register_socket_events(sio):
                 return {"ok": False, "reason": "session_not_found"}
 
             if sender_user_id:
-                user = db.query(User).filter(User.id == sender_user_id).first()
+                user = get_cached(db, User, sender_user_id)
                 if not user or not _is_user_allowed_for_session(db, user=user, session=session):
                     _socket_log("session_join_denied", sid=sid, session_id=session_id, reason="not_authorized", user_id=sender_user_id)
                     await sio.emit(
@@ -761,7 +764,7 @@ def register_socket_events(sio):
         optimistic_sender_type = raw_sender_type if raw_sender_type in {"homeowner", "visitor", "security", "office"} else "visitor"
         display_name = (payload or {}).get("displayName") or "Participant"
         created_at = utc_now().isoformat()
-        message_id = str(uuid.uuid4())
+        message_id = uuid7_str()
         snapshot_meta = {"snapshotAuditId": None, "photoUrl": None}
 
         # Validate visitor token again for unauthenticated senders to avoid replay after disconnects.
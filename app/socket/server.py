@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import orjson
 import socketio
 
 from app.core.redis import describe_redis_configuration
@@ -19,6 +20,17 @@ socket_cors_setting = "*"
 if not settings.DEBUG:
     socket_cors_setting = socket_cors_origins
 
+class _OrjsonCodec:
+    # python-socketio/engineio call json.dumps(data, separators=...) per packet; orjson already emits compact JSON.
+    @staticmethod
+    def dumps(obj, **_kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    @staticmethod
+    def loads(data, **_kwargs):
+        return orjson.loads(data)
+
+
 def create_socketio_manager(redis_url: str, channel: str):
     if not str(redis_url or "").strip():
         return None
@@ -47,6 +59,7 @@ else:
 sio = socketio.AsyncServer(
     async_mode="asgi",
     client_manager=sio_manager,
+    json=_OrjsonCodec,
     cors_allowed_origins=socket_cors_setting,
     logger=False,
     engineio_logger=False,
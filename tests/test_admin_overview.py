@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.base import Base
+from app.db.models import Door, Estate, Home, QRCode, Subscription, User, UserRole, VisitorSession
+from app.services.admin_service import get_admin_overview, list_admin_estate_owners, list_admin_homeowners, list_admin_payment_history, list_admin_visits
+from app.services import payment_service
+from app.services.payment_service import get_plan_amount_map, list_subscription_plans, upsert_plan
+
+
+def _user(email: str, role: UserRole) -> User:
+    return User(
+        id=str(uuid.uuid4()),
+        full_name=email.split("@")[0].title(),
+        email=email,
+        password_hash="hashed",
+        role=role,
+        email_verified=True,
+        is_active=True,
+    )
+
+
+class AdminOverviewTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+        Base.metadata.create_all(bind=self.engine)
+        self.db = sessionmaker(bind=self.engine, class_=Session, autoflush=False, autocommit=False)()
+
+        self.owner = _user("owner@example.com", UserRole.estate)
+        self.resident = _user("resident@example.com", UserRole.homeowner)
+        self.solo = _user("solo@example.com", UserRole.homeowner)
+        self.db.add_all([self.owner, self.resident, self.solo])
+        self.db.flush()
+
+        self.estate = Estate(id=str(uuid.uuid4()), name="Palm Estate", owner_id=self.owner.id)
+        self.db.add(self.estate)
+        self.db.flush()
+        self.estate_home = Home(id=str(uuid.uuid4()), name="Unit 1", homeowner_id=self.resident.id, estate_id=self.estate.id)
+        self.solo_home = Home(id=str(uuid.uuid4()), name="Cottage", homeowner_id=self.solo.id)
+        self.db.add_all([self.estate_home, self.solo_home])
+        self.db.flush()
+        self.front = Door(id=str(uuid.uuid4()), name="Front", home_id=self.estate_home.id)
+        self.side = Door(id=str(uuid.uuid4()), name="Side", home_id=self.estate_home.id)
+        self.gate = Door(id=str(uuid.uuid4()), name="Gate", home_id=self.solo_home.id)
+        self.db.add_all([self.front, self.side, self.gate])
+        self.db.add_all(
+            [
+                QRCode(qr_id="qr-estate", home_id=self.estate_home.id, estate_id=self.estate.id, mode="estate"),
+                QRCode(qr_id="qr-solo", home_id=self.solo_home.id),
+            ]
+        )
+
+        base = datetime(2026, 1, 1, 12, 0, 0)
+        statuses = ["pending", "approved", "rejected", "completed", "closed"]
+        for index, status in enumerate(statuses):
+            self.db.add(
+                VisitorSession(
+                    qr_id="qr-estate",
+                    home_id=self.estate_home.id,
+                    door_id=self.front.id,
+                    homeowner_id=self.resident.id,
+                    visitor_label=f"Visitor {index}",
+                    status=status,
+                    started_at=base + timedelta(minutes=index),
+                )
+            )
+        self.db.add(
+            VisitorSession(
+                qr_id="qr-solo",
+                home_id=self.solo_home.id,
+                door_id=self.gate.id,
+                homeowner_id=self.solo.id,
+                visitor_label="Courier",
+                status="approved",
+                started_at=base + timedelta(hours=1),
+            )
+        )
+        self.db.add_all(
+            [
+                Subscription(user_id=self.resident.id, plan="free", status="expired", starts_at=base - timedelta(days=60)),
+                Subscription(user_id=self.resident.id, plan="home_pro", status="active", starts_at=base),
+                Subscription(user_id=self.owner.id, plan="estate_starter", status="active", starts_at=base),
+            ]
+        )
+        self.db.commit()
+        self.plan_amounts = {plan["id"]: int(plan["amount"]) for plan in list_subscription_plans(self.db, include_inactive=True)}
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def test_metrics_and_per_user_breakdowns(self):
+        overview = get_admin_overview(self.db)
+
+        self.assertEqual(
+            {key: overview["metrics"][key] for key in ("totalHomeowners", "totalEstates", "totalUsers", "totalHomes", "totalDoors", "totalQrCodes", "totalVisits")},
+            {"totalHomeowners": 2, "totalEstates": 1, "totalUsers": 3, "totalHomes": 2, "totalDoors": 3, "totalQrCodes": 2, "totalVisits": 6},
+        )
+        expected_total = sum(self.plan_amounts.get(plan, 0) for plan in ("free", "home_pro", "estate_starter"))
+        self.assertEqual(overview["metrics"]["totalPaymentAmount"], expected_total)
+
+        homeowners = {row["email"]: row for row in overview["homeowners"]}
+        resident = homeowners["resident@example.com"]
+        self.assertEqual((resident["homeCount"], resident["doorCount"], resident["qrCount"]), (1, 2, 1))
+        self.assertEqual(resident["visits"], {"total": 5, "pending": 1, "approved": 1, "rejected": 1, "closed": 2})
+        self.assertEqual(resident["subscription"]["plan"], "home_pro")
+        self.assertEqual(resident["subscription"]["amount"], self.plan_amounts.get("home_pro", 0))
+        solo = homeowners["solo@example.com"]
+        self.assertEqual((solo["homeCount"], solo["doorCount"], solo["qrCount"]), (1, 1, 1))
+        self.assertEqual(solo["subscription"], {"plan": "free", "status": "active", "startsAt": None, "amount": 0})
+
+        [owner] = overview["estates"]
+        self.assertEqual(
+            {key: owner[key] for key in ("estateCount", "homeCount", "doorCount", "qrCount", "homeownerCount", "visits")},
+            {"estateCount": 1, "homeCount": 1, "doorCount": 2, "qrCount": 1, "homeownerCount": 1, "visits": 5},
+        )
+        self.assertEqual(owner["subscription"]["plan"], "estate_starter")
+
+    def test_estate_owner_totals_span_all_owned_estates(self):
+        second_estate = Estate(id=str(uuid.uuid4()), name="Lake Estate", owner_id=self.owner.id)
+        self.db.add(second_estate)
+        self.db.flush()
+        self.db.add(Home(id=str(uuid.uuid4()), name="Unit 9", homeowner_id=self.resident.id, estate_id=second_estate.id))
+        self.db.commit()
+
+        [owner] = get_admin_overview(self.db)["estates"]
+
+        self.assertEqual((owner["estateCount"], owner["homeCount"], owner["homeownerCount"]), (2, 2, 1))
+
+    def test_payment_history_and_recent_visits(self):
+        overview = get_admin_overview(self.db)
+
+        homeowner_history = overview["payments"]["homeownerHistory"]
+        self.assertEqual([row["plan"] for row in homeowner_history], ["home_pro", "free"])
+        self.assertEqual({row["userEmail"] for row in homeowner_history}, {"resident@example.com"})
+        self.assertEqual([row["userName"] for row in overview["payments"]["estateHistory"]], ["Owner"])
+
+        rows = overview["visits"]["rows"]
+        self.assertEqual(overview["visits"]["total"], 6)
+        self.assertEqual(rows[0]["visitor"], "Courier")
+        self.assertEqual((rows[0]["doorName"], rows[0]["estateId"]), ("Gate", None))
+        self.assertEqual((rows[1]["estateName"], rows[1]["homeownerEmail"]), ("Palm Estate", "resident@example.com"))
+        self.assertEqual([row["visitor"] for row in rows[1:]], [f"Visitor {index}" for index in range(4, -1, -1)])
+
+    def test_paged_listings_match_the_full_overview(self):
+        overview = get_admin_overview(self.db)
+
+        pages = list_admin_homeowners(self.db, limit=1) + list_admin_homeowners(self.db, limit=1, offset=1)
+        self.assertEqual(pages, overview["homeowners"])
+        self.assertEqual(list_admin_estate_owners(self.db, limit=1), overview["estates"])
+        self.assertEqual(list_admin_homeowners(self.db, limit=5, offset=2), [])
+        self.assertEqual(list_admin_payment_history(self.db, UserRole.homeowner, limit=1, offset=1), overview["payments"]["homeownerHistory"][1:])
+        self.assertEqual(list_admin_visits(self.db, limit=2, offset=1), overview["visits"]["rows"][1:3])
+
+
+class PlanAmountCacheTests(unittest.TestCase):
+    def setUp(self):
+        payment_service.invalidate_plan_amount_cache()
+        self.engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+        Base.metadata.create_all(bind=self.engine)
+        self.db = sessionmaker(bind=self.engine, class_=Session, autoflush=False, autocommit=False)()
+
+    def tearDown(self):
+        payment_service.invalidate_plan_amount_cache()
+        self.db.close()
+        self.engine.dispose()
+
+    def test_map_is_reused_until_a_plan_amount_changes(self):
+        amounts = get_plan_amount_map(self.db)
+        list_subscription_plans(self.db, include_inactive=True)
+        self.assertIs(get_plan_amount_map(self.db), amounts)
+
+        upsert_plan(self.db, "home_pro", "Home Pro", amounts["home_pro"] + 100, "NGN", 1, 1, True)
+        self.assertIsNone(payment_service._plan_amount_cache)
+        self.assertIsNot(get_plan_amount_map(self.db), amounts)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+
+import orjson
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.models import AuditLog, Door, Estate, Home, QRCode, Subscription, User, UserRole
+from app.db.session import get_db
+from app.main import fastapi_app
+
+
+class AdminListRoutesTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite+pysqlite://",
+            future=True,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, class_=Session, autoflush=False, autocommit=False)
+        self.db = self.SessionLocal()
+
+        self.admin = User(
+            id=str(uuid.uuid4()),
+            full_name="Admin User",
+            email="admin-routes@example.com",
+            password_hash="hashed",
+            role=UserRole.admin,
+            email_verified=True,
+            is_active=True,
+        )
+        self.estate_owner = User(
+            id=str(uuid.uuid4()),
+            full_name="Estate Owner",
+            email="estate-owner@example.com",
+            password_hash="hashed",
+            role=UserRole.estate,
+            email_verified=True,
+            is_active=True,
+        )
+        self.homeowner = User(
+            id=str(uuid.uuid4()),
+            full_name="Home Owner",
+            email="home-owner@example.com",
+            password_hash="hashed",
+            role=UserRole.homeowner,
+            email_verified=True,
+            is_active=True,
+        )
+        self.db.add_all([self.admin, self.estate_owner, self.homeowner])
+        self.db.flush()
+
+        self.estate = Estate(id=str(uuid.uuid4()), name="Palm Estate", owner_id=self.estate_owner.id)
+        self.db.add(self.estate)
+        self.db.flush()
+        self.estate_home = Home(
+            id=str(uuid.uuid4()),
+            name="Unit 1",
+            homeowner_id=self.homeowner.id,
+            estate_id=self.estate.id,
+        )
+        self.standalone_home = Home(id=str(uuid.uuid4()), name="Cottage", homeowner_id=self.homeowner.id)
+        self.db.add_all([self.estate_home, self.standalone_home])
+        self.db.flush()
+        self.front_door = Door(id=str(uuid.uuid4()), name="Front", home_id=self.estate_home.id)
+        self.back_door = Door(id=str(uuid.uuid4()), name="Back", home_id=self.standalone_home.id)
+        self.db.add_all([self.front_door, self.back_door])
+        self.db.add_all(
+            [
+                QRCode(qr_id="qr-multi", home_id=self.estate_home.id, doors_csv=f"{self.front_door.id},{self.back_door.id}"),
+                QRCode(qr_id="qr-single", home_id=self.standalone_home.id, doors_csv=self.back_door.id),
+                QRCode(qr_id="qr-empty", home_id=self.standalone_home.id, doors_csv=""),
+            ]
+        )
+        self.db.add(Subscription(id=str(uuid.uuid4()), user_id=self.homeowner.id, plan="basic", status="active"))
+        self.db.commit()
+
+        self.admin_token = create_access_token(self.admin.id, self.admin.role.value)
+
+        def override_get_db():
+            db = self.SessionLocal()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        fastapi_app.dependency_overrides[get_db] = override_get_db
+        self.client = TestClient(fastapi_app, raise_server_exceptions=False)
+
+    def tearDown(self):
+        fastapi_app.dependency_overrides.clear()
+        self.db.close()
+        self.engine.dispose()
+
+    def _get(self, path: str):
+        return self.client.get(path, headers={"Authorization": f"Bearer {self.admin_token}"})
+
+    def _count_statements(self, path: str) -> int:
+        statements: list[str] = []
+
+        def _record(_conn, _cursor, statement, _params, _context, _executemany):
+            statements.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", _record)
+        try:
+            response = self._get(path)
+        finally:
+            event.remove(self.engine, "before_cursor_execute", _record)
+        self.assertEqual(response.status_code, 200, response.text)
+        return len(statements)
+
+    def test_list_doors_resolves_home_owner_and_estate(self):
+        response = self._get("/api/v1/admin/doors/all")
+        self.assertEqual(response.status_code, 200, response.text)
+        rows = {row["name"]: row for row in response.json()["data"]}
+        self.assertEqual(rows["Front"]["homeName"], "Unit 1")
+        self.assertEqual(rows["Front"]["homeownerEmail"], "home-owner@example.com")
+        self.assertEqual(rows["Front"]["estateId"], self.estate.id)
+        self.assertEqual(rows["Front"]["estateName"], "Palm Estate")
+        self.assertEqual(rows["Back"]["homeName"], "Cottage")
+        self.assertIsNone(rows["Back"]["estateId"])
+        self.assertIsNone(rows["Back"]["estateName"])
+
+    def test_list_estates_includes_owner_email(self):
+        response = self._get("/api/v1/admin/estates")
+        self.assertEqual(response.status_code, 200, response.text)
+        [row] = response.json()["data"]
+        self.assertEqual(row["ownerId"], self.estate_owner.id)
+        self.assertEqual(row["ownerEmail"], "estate-owner@example.com")
+
+    def test_list_subscriptions_includes_user_email_and_role(self):
+        response = self._get("/api/v1/admin/subscriptions")
+        self.assertEqual(response.status_code, 200, response.text)
+        [row] = response.json()["data"]
+        self.assertEqual(row["userEmail"], "home-owner@example.com")
+        self.assertEqual(row["userRole"], "homeowner")
+        self.assertEqual(row["status"], "active")
+
+    def test_list_qrs_counts_doors(self):
+        response = self._get("/api/v1/admin/qrs/all")
+        self.assertEqual(response.status_code, 200, response.text)
+        counts = {row["qrId"]: row["doorCount"] for row in response.json()["data"]}
+        self.assertEqual(counts, {"qr-multi": 2, "qr-single": 1, "qr-empty": 0})
+        self.assertTrue(all(row["active"] is True for row in response.json()["data"]))
+
+    def test_qr_door_links_keep_assignment_order(self):
+        qr = self.db.query(QRCode).filter(QRCode.qr_id == "qr-multi").one()
+        self.assertEqual(qr.door_ids, [self.front_door.id, self.back_door.id])
+        qr.door_ids = [self.back_door.id, self.front_door.id, self.back_door.id]
+        self.db.commit()
+        self.db.expire_all()
+        qr = self.db.query(QRCode).filter(QRCode.qr_id == "qr-multi").one()
+        self.assertEqual(qr.doors_csv, f"{self.back_door.id},{self.front_door.id}")
+
+    def test_list_users_search_is_case_insensitive(self):
+        response = self._get("/api/v1/admin/users?q=Estate-OWNER")
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual([row["email"] for row in response.json()["data"]], ["estate-owner@example.com"])
+
+    def test_list_users_filters_by_role_and_ignores_unknown_roles(self):
+        response = self._get("/api/v1/admin/users?role=estate")
+        self.assertEqual([row["email"] for row in response.json()["data"]], ["estate-owner@example.com"])
+        response = self._get("/api/v1/admin/users?role=not-a-role")
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual(response.json()["data"], [])
+
+    def test_timestamps_keep_isoformat_encoding(self):
+        expected = self.db.get(User, self.homeowner.id).created_at.isoformat()
+        response = self._get("/api/v1/admin/users?q=home-owner")
+        self.assertEqual(response.json()["data"][0]["createdAt"], expected)
+        qr_created = self.db.query(QRCode).filter(QRCode.qr_id == "qr-single").one().created_at.isoformat()
+        rows = {row["qrId"]: row for row in self._get("/api/v1/admin/qrs/all").json()["data"]}
+        self.assertEqual(rows["qr-single"]["createdAt"], qr_created)
+
+    def test_payments_summary_counts_subscriptions(self):
+        response = self._get("/api/v1/admin/payments")
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertEqual(response.json()["data"], {"count": 1})
+
+    def test_patch_user_writes_audit_log_after_response(self):
+        response = self.client.patch(
+            f"/api/v1/admin/users/{self.homeowner.id}",
+            json={"isActive": False},
+            headers={"Authorization": f"Bearer {self.admin_token}"},
+        )
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertFalse(response.json()["data"]["active"])
+        [row] = self.db.query(AuditLog).all()
+        self.assertEqual(row.action, "user.patch")
+        self.assertEqual(row.actor_user_id, self.admin.id)
+        self.assertEqual(row.resource_id, self.homeowner.id)
+        self.assertEqual(orjson.loads(row.meta_json), {"isActive": False})
+
+    def test_list_endpoints_issue_constant_statement_counts(self):
+        # One statement resolves the authenticated admin; each listing should need exactly one more.
+        for path in (
+            "/api/v1/admin/doors/all",
+            "/api/v1/admin/estates",
+            "/api/v1/admin/qrs/all",
+            "/api/v1/admin/subscriptions",
+            "/api/v1/admin/sessions",
+            "/api/v1/admin/notifications",
+        ):
+            with self.subTest(path=path):
+                self.assertLessEqual(self._count_statements(path), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.db.models import AuditLog
+from app.services import audit_service
+
+
+class AuditQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+        Base.metadata.create_all(bind=self.engine)
+        audit_service._pending_audit_rows.clear()
+        self.addCleanup(audit_service._pending_audit_rows.clear)
+        self.addCleanup(self.engine.dispose)
+
+    def _queue(self, *actions: str) -> None:
+        for action in actions:
+            audit_service.queue_audit_log(actor_user_id=None, action=action, resource_type="user")
+
+    def test_failed_flush_keeps_rows_for_the_next_flush(self):
+        self._queue("first", "second")
+        lost_connection = OperationalError("INSERT INTO audit_logs", {}, Exception("server closed the connection"))
+        with mock.patch.object(audit_service, "insert", side_effect=lost_connection):
+            self.assertEqual(audit_service.flush_audit_logs(self.engine), 0)
+        self._queue("third")
+        self.assertEqual([row["action"] for row in audit_service._pending_audit_rows], ["first", "second", "third"])
+
+        self.assertEqual(audit_service.flush_audit_logs(self.engine), 3)
+        with Session(self.engine) as db:
+            self.assertEqual(sorted(action for (action,) in db.query(AuditLog.action)), ["first", "second", "third"])
+
+    def test_rejected_row_is_dropped_without_blocking_the_rest(self):
+        with self.engine.begin() as conn:
+            # SQLite ignores VARCHAR lengths; emulate PostgreSQL rejecting an over-long resource_id.
+            conn.execute(
+                text(
+                    "CREATE TRIGGER audit_resource_id_length BEFORE INSERT ON audit_logs "
+                    "WHEN length(NEW.resource_id) > 64 BEGIN SELECT RAISE(ABORT, 'value too long'); END"
+                )
+            )
+        self._queue("first")
+        audit_service.queue_audit_log(actor_user_id=None, action="oversized", resource_type="user", resource_id="x" * 65)
+        self._queue("second")
+
+        with self.assertLogs(audit_service.logger, "ERROR") as logs:
+            self.assertEqual(audit_service.flush_audit_logs(self.engine), 2)
+
+        self.assertEqual(len(audit_service._pending_audit_rows), 0)
+        self.assertIn("'action': 'oversized'", logs.output[0])
+        self._queue("third")
+        self.assertEqual(audit_service.flush_audit_logs(self.engine), 1)
+        with Session(self.engine) as db:
+            self.assertEqual(sorted(action for (action,) in db.query(AuditLog.action)), ["first", "second", "third"])
+
+    def test_full_queue_logs_and_counts_each_dropped_row(self):
+        with mock.patch.object(audit_service, "_AUDIT_QUEUE_MAX_ROWS", 2), mock.patch.object(
+            audit_service, "_dropped_audit_rows", 0
+        ), self.assertLogs(audit_service.logger, "ERROR") as logs:
+            self._queue("first", "second", "third")
+            self.assertEqual(audit_service._dropped_audit_rows, 1)
+
+        self.assertEqual([row["action"] for row in audit_service._pending_audit_rows], ["second", "third"])
+        self.assertIn("'action': 'first'", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
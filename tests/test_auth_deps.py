@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+from unittest import mock
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api import deps
+from app.core.exceptions import AppException
+from app.core.security import create_refresh_token, hash_password
+from app.db.base import Base
+from app.db.models import DeviceSession, User, UserRole
+from app.db.session import get_cached
+from app.services import auth_service
+from app.services.auth_service import _issue_auth_tokens, login, request_password_reset, reset_password, rotate_refresh_token
+
+
+class _AuthDbTestCase(unittest.TestCase):
+    def setUp(self):
+        deps.clear_user_cache()
+        self.engine = create_engine(
+            "sqlite+pysqlite://",
+            future=True,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, class_=Session, autoflush=False, autocommit=False)
+        with self.SessionLocal() as db:
+            self.user_id = str(uuid.uuid4())
+            db.add(
+                User(
+                    id=self.user_id,
+                    full_name="Cached User",
+                    email="cached-user@example.com",
+                    password_hash="hashed",
+                    role=UserRole.homeowner,
+                    email_verified=True,
+                    is_active=True,
+                )
+            )
+            db.commit()
+        self.statements: list[str] = []
+        event.listen(self.engine, "before_cursor_execute", self._record)
+
+    def tearDown(self):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+        deps.clear_user_cache()
+        self.engine.dispose()
+
+    def _record(self, _conn, _cursor, statement, _params, _context, _executemany):
+        self.statements.append(statement)
+
+
+class AuthenticatedUserCacheTests(_AuthDbTestCase):
+    def test_second_lookup_is_served_without_a_query(self):
+        with self.SessionLocal() as db:
+            self.assertEqual(deps._load_authenticated_user(db, self.user_id).email, "cached-user@example.com")
+        first_count = len(self.statements)
+        with self.SessionLocal() as db:
+            user = deps._load_authenticated_user(db, self.user_id)
+            self.assertEqual(user.role, UserRole.homeowner)
+            self.assertIn(user, db)
+        self.assertEqual(len(self.statements), first_count)
+
+    def test_orm_update_invalidates_cached_user(self):
+        with self.SessionLocal() as db:
+            user = deps._load_authenticated_user(db, self.user_id)
+            user.is_active = False
+            db.commit()
+        with self.SessionLocal() as db:
+            self.assertFalse(deps._load_authenticated_user(db, self.user_id).is_active)
+
+    def test_service_lookups_reuse_the_authenticated_user_within_a_session(self):
+        with self.SessionLocal() as db:
+            user = deps._load_authenticated_user(db, self.user_id)
+            count_after_auth = len(self.statements)
+            self.assertIs(get_cached(db, User, self.user_id), user)
+            self.assertIsNone(get_cached(db, User, None))
+            self.assertEqual(len(self.statements), count_after_auth)
+
+
+class RotateRefreshTokenTests(_AuthDbTestCase):
+    def test_refresh_loads_session_and_user_in_one_select(self):
+        refresh_token = create_refresh_token(self.user_id)
+        with self.SessionLocal() as db:
+            db.add(DeviceSession(user_id=self.user_id, refresh_token=refresh_token))
+            db.commit()
+        self.statements.clear()
+        with self.SessionLocal() as db:
+            tokens = rotate_refresh_token(db, refresh_token)
+        selects = [statement for statement in self.statements if statement.lstrip().upper().startswith("SELECT")]
+        self.assertEqual(len(selects), 1)
+        self.assertIn("JOIN users", selects[0])
+        self.assertTrue(tokens["accessToken"])
+
+
+class IssueAuthTokensTests(_AuthDbTestCase):
+    def test_issuing_tokens_does_not_reload_the_user_after_commit(self):
+        with self.SessionLocal() as db:
+            user = db.get(User, self.user_id)
+            self.statements.clear()
+            auth = _issue_auth_tokens(db=db, user=user)
+        self.assertEqual(auth.user.email, "cached-user@example.com")
+        self.assertEqual([statement for statement in self.statements if statement.lstrip().upper().startswith("SELECT")], [])
+        with self.SessionLocal() as db:
+            [device_session] = db.query(DeviceSession).all()
+        self.assertEqual((device_session.user_id, device_session.refresh_token), (self.user_id, auth.refreshToken))
+        self.assertTrue(device_session.id)
+        self.assertIsNotNone(device_session.created_at)
+
+
+class LoginLookupTests(_AuthDbTestCase):
+    def setUp(self):
+        super().setUp()
+        with self.SessionLocal() as db:
+            db.get(User, self.user_id).password_hash = hash_password("Secret123")
+            db.commit()
+
+    def tearDown(self):
+        auth_service._failed_login_hits.clear()
+        auth_service._failed_login_blocked_until.clear()
+        super().tearDown()
+
+    def test_full_email_and_bare_username_both_sign_in(self):
+        for login_key in ("Cached-User@Example.com", "cached-user"):
+            with self.subTest(login_key=login_key), self.SessionLocal() as db:
+                self.assertEqual(login(db, login_key, "Secret123").user.id, self.user_id)
+
+    def test_unknown_account_still_runs_a_password_check(self):
+        with mock.patch.object(auth_service, "verify_password", wraps=auth_service.verify_password) as verify:
+            with self.SessionLocal() as db, self.assertRaises(AppException):
+                login(db, "nobody@example.com", "Secret123")
+        verify.assert_called_once_with("Secret123", auth_service._dummy_password_hash())
+
+    def test_full_email_login_never_issues_a_like_scan(self):
+        self.statements.clear()
+        with self.SessionLocal() as db:
+            login(db, "cached-user@example.com", "Secret123")
+        user_selects = [sql for sql in self.statements if sql.lstrip().upper().startswith("SELECT") and "FROM users" in sql]
+        self.assertTrue(user_selects)
+        self.assertFalse([sql for sql in user_selects if " LIKE " in sql.upper()])
+
+    def test_login_is_one_select_and_one_insert(self):
+        self.statements.clear()
+        with self.SessionLocal() as db:
+            login(db, "cached-user@example.com", "Secret123")
+        verbs = [sql.lstrip().split(None, 1)[0].upper() for sql in self.statements]
+        self.assertEqual(verbs, ["SELECT", "INSERT"])
+        self.assertIn("device_sessions", self.statements[1])
+
+    def test_username_wildcards_are_matched_literally(self):
+        with self.SessionLocal() as db, self.assertRaises(AppException) as ctx:
+            login(db, "cached%", "Secret123")
+        self.assertEqual(ctx.exception.status_code, 401)
+
+
+class PasswordResetTests(_AuthDbTestCase):
+    def tearDown(self):
+        auth_service._token_issue_hits.clear()
+        super().tearDown()
+
+    def test_unknown_account_and_wrong_token_get_the_same_answer(self):
+        for email in ("nobody@example.com", "cached-user@example.com"):
+            with self.subTest(email=email), self.SessionLocal() as db, self.assertRaises(AppException) as ctx:
+                reset_password(db, email, "not-a-token", "Secret1234!")
+            self.assertEqual((ctx.exception.status_code, ctx.exception.message), (401, "Invalid or expired reset token"))
+
+    def test_reset_email_is_sent_off_the_request_path(self):
+        with mock.patch.object(auth_service, "send_transactional_email") as send, mock.patch.object(
+            auth_service, "_queue_transactional_email"
+        ) as queue:
+            with self.SessionLocal() as db:
+                self.assertEqual(request_password_reset(db, "nobody@example.com")["status"], "ok")
+                self.assertEqual(request_password_reset(db, "cached-user@example.com")["status"], "ok")
+        send.assert_not_called()
+        queue.assert_called_once()
+        self.assertEqual(queue.call_args.args[:2], ("cached-user@example.com", "QRing password reset"))
+
+
+if __name__ == "__main__":
+    unittest.main()
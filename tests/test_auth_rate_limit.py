@@ -2,14 +2,19 @@ from __future__ import annotations
 
 import asyncio
 import unittest
+from datetime import timedelta
+from unittest import mock
 
 from redis.exceptions import ConnectionError as RedisConnectionError
 from starlette.requests import Request
 
+from app.core.exceptions import AppException
 from app.middleware.rate_limit import RateLimitMiddleware
 from app.middleware.request_context import get_client_ip
 from app.services import auth_service
 
+_VICTIM_KEY = "password_reset:203.0.113.10:victim@example.com"
+
 
 def _build_request(headers: list[tuple[bytes, bytes]], client: tuple[str, int] | None = None) -> Request:
     scope = {
@@ -26,10 +31,14 @@ class AuthRateLimitTests(unittest.TestCase):
     def setUp(self):
         auth_service._failed_login_hits.clear()
         auth_service._failed_login_blocked_until.clear()
+        auth_service._token_issue_hits.clear()
+        auth_service._hit_store_swept_at.clear()
 
     def tearDown(self):
         auth_service._failed_login_hits.clear()
         auth_service._failed_login_blocked_until.clear()
+        auth_service._token_issue_hits.clear()
+        auth_service._hit_store_swept_at.clear()
 
     def test_login_failures_are_scoped_only_by_ip(self):
         for _ in range(auth_service._LOGIN_MAX_FAILURES):
@@ -40,6 +49,34 @@ class AuthRateLimitTests(unittest.TestCase):
 
         auth_service._enforce_login_rate_limit("first@example.com", "198.51.100.9")
 
+    def test_token_issue_store_stays_bounded_without_evicting_live_keys(self):
+        start = auth_service.utc_now()
+        with mock.patch.object(auth_service, "_AUTH_HIT_STORE_MAX_KEYS", 3):
+            for _ in range(auth_service._TOKEN_ISSUE_MAX):
+                auth_service._enforce_token_issue_rate_limit("victim@example.com", "203.0.113.10", "password_reset")
+            for index in range(2):
+                auth_service._enforce_token_issue_rate_limit(f"spray-{index}@example.com", "198.51.100.9", "password_reset")
+            self.assertEqual(len(auth_service._token_issue_hits), 3)
+
+            # A new key in a full store is rate-limited; the victim's counter survives.
+            with self.assertRaises(AppException) as ctx:
+                auth_service._enforce_token_issue_rate_limit("spray-2@example.com", "198.51.100.9", "password_reset")
+            self.assertEqual(ctx.exception.status_code, 429)
+            self.assertEqual(len(auth_service._token_issue_hits[_VICTIM_KEY]), auth_service._TOKEN_ISSUE_MAX)
+
+            # Within the same window the store is not rescanned for every new key.
+            swept_at = dict(auth_service._hit_store_swept_at)
+            with mock.patch.object(auth_service, "utc_now", return_value=start + timedelta(seconds=10)):
+                with self.assertRaises(AppException):
+                    auth_service._enforce_token_issue_rate_limit("spray-3@example.com", "198.51.100.9", "password_reset")
+            self.assertEqual(auth_service._hit_store_swept_at, swept_at)
+
+            # Once the window has passed, the sweep frees room for new keys.
+            later = start + timedelta(seconds=auth_service._TOKEN_ISSUE_WINDOW_SECONDS + 1)
+            with mock.patch.object(auth_service, "utc_now", return_value=later):
+                auth_service._enforce_token_issue_rate_limit("spray-4@example.com", "198.51.100.9", "password_reset")
+            self.assertEqual(list(auth_service._token_issue_hits), ["password_reset:198.51.100.9:spray-4@example.com"])
+
     def test_client_ip_prefers_forwarded_headers(self):
         request = _build_request(
             headers=[(b"x-forwarded-for", b"198.51.100.7, 10.0.0.1")],
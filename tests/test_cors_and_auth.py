@@ -6,6 +6,8 @@ import unittest
 from fastapi.testclient import TestClient
 from fastapi.routing import APIRoute
 
+from app.core.config import Settings, get_settings
+from app.core.cors import get_allowed_origins, is_allowed_origin
 from app.main import app, fastapi_app
 
 
@@ -60,6 +62,12 @@ class CorsAndAuthRegressionTests(unittest.TestCase):
         self.assertEqual(response.status_code, 401)
         self.assertCorsHeaders(response)
 
+    def test_responses_carry_short_url_safe_request_ids(self):
+        first = self.client.get("/api/v1/health").headers.get("x-request-id")
+        second = self.client.get("/api/v1/health").headers.get("x-request-id")
+        self.assertRegex(first or "", r"^[A-Za-z0-9_-]{16}$")
+        self.assertNotEqual(first, second)
+
     def test_unhandled_500_response_preserves_cors_headers(self):
         response = self.client.get("/api/v1/__tests__/boom", headers={"Origin": TEST_ORIGIN})
         self.assertEqual(response.status_code, 500)
@@ -76,6 +84,23 @@ class CorsAndAuthRegressionTests(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertCorsHeaders(response)
 
+    def test_default_origin_regex_matches_local_network_origins(self):
+        pattern = re.compile(Settings.model_fields["CORS_ALLOW_ORIGIN_REGEX"].default)
+        for origin in ("http://127.0.0.1:5173", "http://192.168.1.20:3000", "capacitor://localhost", "https://www.qring.io"):
+            with self.subTest(origin=origin):
+                self.assertIsNotNone(pattern.fullmatch(origin))
+        self.assertIsNone(pattern.fullmatch("http://127x0x0x1"))
+        self.assertIsNone(pattern.fullmatch("https://evil.example"))
+
+    def test_allowed_origins_are_cached_but_returned_as_fresh_lists(self):
+        settings = get_settings()
+        origins = get_allowed_origins(settings)
+        self.assertIn(TEST_ORIGIN, origins)
+        origins.append("https://mutated.example")
+        self.assertNotIn("https://mutated.example", get_allowed_origins(settings))
+        self.assertTrue(is_allowed_origin(settings, f"{TEST_ORIGIN}/"))
+        self.assertFalse(is_allowed_origin(settings, "https://mutated.example"))
+
 
 if __name__ == "__main__":
     unittest.main()
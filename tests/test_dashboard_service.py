@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.base import Base
+from app.db.models import Door, Home, Message, User, UserRole, VisitorSession
+from app.services.dashboard_service import get_dashboard_overview
+
+
+class DashboardOverviewTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+        Base.metadata.create_all(bind=self.engine)
+        self.db = sessionmaker(bind=self.engine, class_=Session, autoflush=False, autocommit=False)()
+
+        self.user = User(
+            id=str(uuid.uuid4()),
+            full_name="Resident",
+            email="resident@example.com",
+            password_hash="hashed",
+            role=UserRole.homeowner,
+            email_verified=True,
+            is_active=True,
+        )
+        self.db.add(self.user)
+        self.db.flush()
+        home = Home(id=str(uuid.uuid4()), name="Cottage", homeowner_id=self.user.id)
+        self.db.add(home)
+        self.db.flush()
+        self.door = Door(id=str(uuid.uuid4()), name="Front", gate_label="Main Gate", home_id=home.id)
+        self.db.add(self.door)
+
+        base = datetime(2026, 1, 1, 12, 0, 0)
+        statuses = ["pending"] * 12 + ["active", "active", "approved", "closed"]
+        for index, status in enumerate(statuses):
+            self.db.add(
+                VisitorSession(
+                    qr_id="qr-1",
+                    home_id=home.id,
+                    door_id=self.door.id,
+                    homeowner_id=self.user.id,
+                    visitor_label=f"Visitor {index}",
+                    status=status,
+                    started_at=base + timedelta(minutes=index),
+                )
+            )
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def test_metrics_count_every_session_while_slices_stay_bounded(self):
+        overview = get_dashboard_overview(self.db, self.user.id)
+
+        self.assertEqual(
+            overview["metrics"],
+            {"activeVisitors": 2, "pendingApprovals": 12, "callsToday": 3, "unreadMessages": 0},
+        )
+        self.assertEqual([row["visitorName"] for row in overview["waitingRoom"]], [f"Visitor {index}" for index in range(11, 1, -1)])
+        self.assertEqual(overview["session"]["id"], self._session_id("Visitor 13"))
+        self.assertEqual(overview["session"]["location"], "Main Gate")
+        self.assertEqual(
+            [item["state"] for item in overview["activity"]],
+            ["closed", "approved", "active", "active", "pending", "pending"],
+        )
+
+    def test_no_sessions_query_loads_the_full_history(self):
+        statements: list[str] = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", _capture)
+        try:
+            get_dashboard_overview(self.db, self.user.id)
+        finally:
+            event.remove(self.engine, "before_cursor_execute", _capture)
+
+        session_selects = [sql for sql in statements if "FROM visitor_sessions" in sql and "GROUP BY" not in sql and "messages" not in sql]
+        self.assertTrue(session_selects)
+        self.assertTrue(all("LIMIT" in sql for sql in session_selects))
+
+    def test_latest_messages_are_scoped_to_the_homeowner(self):
+        session_id = self._session_id("Visitor 13")
+        self.db.add_all(
+            [
+                Message(session_id=session_id, sender_type="visitor", body="At the gate", created_at=datetime(2026, 1, 1, 13, 0)),
+                Message(session_id=session_id, sender_type="homeowner", body="Coming", created_at=datetime(2026, 1, 1, 13, 1)),
+            ]
+        )
+        self.db.commit()
+
+        overview = get_dashboard_overview(self.db, self.user.id)
+
+        self.assertEqual(
+            [(row["from"], row["text"], row["unread"]) for row in overview["messages"]],
+            [("homeowner", "Coming", False), ("visitor", "At the gate", True)],
+        )
+        self.assertEqual(overview["metrics"]["unreadMessages"], 1)
+        self.assertEqual(get_dashboard_overview(self.db, str(uuid.uuid4()))["messages"], [])
+
+    def _session_id(self, label: str) -> str:
+        return self.db.query(VisitorSession.id).filter(VisitorSession.visitor_label == label).scalar()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+from datetime import timedelta
+
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.base import Base
+from app.db.models import Notification, User, UserRole
+from app.core.time import utc_now
+from app.db.types import UTCNow, UUIDKey
+from app.db.uuid7 import uuid7
+
+
+class UUIDKeyTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, class_=Session, autoflush=False, autocommit=False)
+        self.db = self.SessionLocal()
+        user = User(
+            id=str(uuid.uuid4()),
+            full_name="Key User",
+            email="uuid-key@test.com",
+            password_hash="hashed",
+            role=UserRole.homeowner,
+            email_verified=True,
+        )
+        self.db.add(user)
+        self.db.flush()
+        self.notification = Notification(user_id=user.id, kind="system", payload="{}")
+        self.db.add(self.notification)
+        self.db.commit()
+        self.notification_id = self.notification.id
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def test_ids_round_trip_as_canonical_strings_stored_in_16_bytes(self):
+        self.assertEqual(str(uuid.UUID(self.notification_id)), self.notification_id)
+        stored = self.db.execute(text("SELECT id FROM notifications")).scalar_one()
+        self.assertEqual(stored, uuid.UUID(self.notification_id).bytes)
+        self.db.expire_all()
+        self.assertEqual(self.db.get(Notification, self.notification_id).id, self.notification_id)
+
+    def test_malformed_id_lookup_misses_instead_of_raising(self):
+        self.assertIsNone(self.db.query(Notification).filter(Notification.id == "not-a-uuid").first())
+
+    def test_postgresql_uses_native_uuid(self):
+        self.assertIsInstance(UUIDKey().load_dialect_impl(postgresql.dialect()), postgresql.UUID)
+
+
+class UUID7Tests(unittest.TestCase):
+    def test_version_variant_and_time_ordering(self):
+        ids = [uuid7() for _ in range(50)]
+        for value in ids:
+            self.assertEqual(value.version, 7)
+            self.assertEqual(value.variant, uuid.RFC_4122)
+        timestamps = [value.int >> 80 for value in ids]
+        self.assertEqual(timestamps, sorted(timestamps))
+        self.assertEqual(len(set(ids)), len(ids))
+
+    def test_models_default_to_uuid7_keys(self):
+        self.assertEqual(uuid.UUID(Notification.__table__.c.id.default.arg(None)).version, 7)
+        self.assertEqual(uuid.UUID(User.__table__.c.id.default.arg(None)).version, 7)
+
+
+class UTCNowDefaultTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+        Base.metadata.create_all(bind=self.engine)
+        self.db = sessionmaker(bind=self.engine, class_=Session, autoflush=False, autocommit=False)()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def test_timestamps_come_back_from_the_insert_and_update(self):
+        statements: list[str] = []
+        event.listen(self.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        user = User(full_name="Clock User", email="clock@test.com", password_hash="hashed", role=UserRole.homeowner)
+        self.db.add(user)
+        self.db.flush()
+        self.assertEqual(len(statements), 1)
+        self.assertIn("RETURNING", statements[0])
+        self.assertIsNone(user.created_at.tzinfo)
+        self.assertLess(abs(user.created_at - utc_now()), timedelta(seconds=5))
+
+        created_at = user.updated_at
+        user.full_name = "Clock User Renamed"
+        self.db.flush()
+        self.assertEqual(len(statements), 2)
+        self.assertGreaterEqual(user.updated_at, created_at)
+
+    def test_compiles_to_naive_utc_per_dialect(self):
+        self.assertIn("STATEMENT_TIMESTAMP", str(select(UTCNow()).compile(dialect=postgresql.dialect())))
+        self.assertIn("%f000", str(select(UTCNow()).compile(dialect=self.engine.dialect)))
+
+
+class UserRoleColumnTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+        Base.metadata.create_all(bind=self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_role_is_a_checked_varchar_that_loads_as_user_role(self):
+        with Session(self.engine) as db:
+            db.add(User(full_name="Role User", email="role@test.com", password_hash="hashed", role=UserRole.office_staff))
+            db.commit()
+            self.assertIs(db.execute(select(User.role)).scalar_one(), UserRole.office_staff)
+            with self.assertRaises(IntegrityError):
+                db.execute(text("UPDATE users SET role = 'superuser'"))
+
+
+if __name__ == "__main__":
+    unittest.main()
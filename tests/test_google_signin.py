@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import base64
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import httpx
+import orjson
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from jose import jwk, jwt
+
+from app.core import firebase_tokens
+from app.core.exceptions import AppException
+from app.services import auth_service
+
+
+class GoogleTokenCacheTests(unittest.TestCase):
+    def setUp(self):
+        auth_service._google_token_cache.clear()
+        self.verify = mock.Mock(
+            return_value={"email": "Ada@Example.com", "name": " Ada ", "exp": time.time() + 3600}
+        )
+        patches = [
+            mock.patch.object(auth_service, "verify_firebase_id_token", self.verify),
+            mock.patch.object(auth_service.settings, "FIREBASE_PROJECT_ID", "qring-test"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(auth_service._google_token_cache.clear)
+
+    def test_repeated_token_is_verified_once(self):
+        first = auth_service._verify_google_id_token("token-a")
+        second = auth_service._verify_google_id_token("token-a")
+
+        self.assertEqual(first, ("ada@example.com", "Ada"))
+        self.assertEqual(second, first)
+        self.verify.assert_called_once()
+        self.assertNotIn("token-a", auth_service._google_token_cache)
+
+    def test_expired_or_failed_tokens_are_not_cached(self):
+        self.verify.return_value = {"email": "ada@example.com", "exp": time.time() - 1}
+        auth_service._verify_google_id_token("stale")
+        auth_service._verify_google_id_token("stale")
+        self.assertEqual(self.verify.call_count, 2)
+
+        self.verify.side_effect = ValueError("bad signature")
+        for _ in range(2):
+            with self.assertRaises(AppException):
+                auth_service._verify_google_id_token("forged")
+        self.assertEqual(self.verify.call_count, 4)
+        self.assertEqual(auth_service._google_token_cache, {})
+
+    def test_unreachable_cert_endpoint_is_not_reported_as_a_bad_token(self):
+        self.verify.side_effect = firebase_tokens.SigningKeysUnavailable("offline")
+        with self.assertRaises(AppException) as ctx:
+            auth_service._verify_google_id_token("token-b")
+        self.assertEqual(ctx.exception.status_code, 503)
+
+
+class FirebaseTokenVerifierTests(unittest.TestCase):
+    project_id = "qring-test"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "securetoken")])
+        now = datetime.now(timezone.utc)
+        certificate = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(cls.private_key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - timedelta(days=1))
+            .not_valid_after(now + timedelta(days=1))
+            .sign(cls.private_key, hashes.SHA256())
+        )
+        cls.cert_pem = certificate.public_bytes(serialization.Encoding.PEM).decode()
+        cls.private_pem = cls.private_key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ).decode()
+
+    def setUp(self):
+        self.fetch = mock.Mock(
+            side_effect=lambda: ({"kid-1": jwk.construct(self.cert_pem, "RS256")}, time.monotonic() + 3600)
+        )
+        patches = [
+            mock.patch.object(firebase_tokens, "_fetch_signing_keys", self.fetch),
+            mock.patch.object(firebase_tokens, "_signing_keys", {}),
+            mock.patch.object(firebase_tokens, "_signing_keys_expire_at", 0.0),
+            mock.patch.object(firebase_tokens, "_signing_keys_attempted_at", None),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _token(self, kid: str = "kid-1", **overrides) -> str:
+        now = int(time.time())
+        claims = {
+            "aud": self.project_id,
+            "iss": f"https://securetoken.google.com/{self.project_id}",
+            "sub": "firebase-uid",
+            "email": "ada@example.com",
+            "iat": now,
+            "auth_time": now,
+            "exp": now + 3600,
+            **overrides,
+        }
+        return jwt.encode(claims, self.private_pem, algorithm="RS256", headers={"kid": kid})
+
+    def test_signing_keys_are_fetched_once_and_reused(self):
+        for _ in range(2):
+            claims = firebase_tokens.verify_firebase_id_token(self._token(), self.project_id)
+            self.assertEqual(claims["email"], "ada@example.com")
+        self.fetch.assert_called_once()
+
+    def test_claims_for_another_project_or_subject_are_rejected(self):
+        bad_tokens = {
+            "audience": self._token(aud="other-project"),
+            "issuer": self._token(iss="https://securetoken.google.com/other-project"),
+            "subject": self._token(sub=""),
+            "expired": self._token(exp=int(time.time()) - 10),
+            "issued in the future": self._token(iat=int(time.time()) + 600),
+        }
+        for reason, token in bad_tokens.items():
+            with self.subTest(reason=reason), self.assertRaises(Exception):
+                firebase_tokens.verify_firebase_id_token(token, self.project_id)
+
+    def test_unknown_kid_refreshes_keys_at_most_once_per_cooldown(self):
+        firebase_tokens.verify_firebase_id_token(self._token(), self.project_id)
+        with mock.patch.object(firebase_tokens.time, "monotonic", return_value=time.monotonic() + 61):
+            with self.assertRaises(ValueError):
+                firebase_tokens.verify_firebase_id_token(self._token(kid="rotated"), self.project_id)
+            self.assertEqual(self.fetch.call_count, 2)
+            for kid in ("random-1", "random-2"):
+                with self.assertRaises(ValueError):
+                    firebase_tokens.verify_firebase_id_token(self._token(kid=kid), self.project_id)
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_failed_fetch_backs_off_and_keeps_serving_stale_keys(self):
+        firebase_tokens.verify_firebase_id_token(self._token(), self.project_id)
+        self.fetch.side_effect = httpx.ConnectError("offline")
+        later = time.monotonic() + 3601
+        with mock.patch.object(firebase_tokens.time, "monotonic", return_value=later):
+            for _ in range(3):
+                claims = firebase_tokens.verify_firebase_id_token(self._token(), self.project_id)
+                self.assertEqual(claims["sub"], "firebase-uid")
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_failed_first_fetch_fails_fast_until_the_cooldown_passes(self):
+        self.fetch.side_effect = httpx.ConnectError("offline")
+        for _ in range(3):
+            with self.assertRaises(firebase_tokens.SigningKeysUnavailable):
+                firebase_tokens.verify_firebase_id_token(self._token(), self.project_id)
+        self.assertEqual(self.fetch.call_count, 1)
+
+        self.fetch.side_effect = lambda: ({"kid-1": jwk.construct(self.cert_pem, "RS256")}, time.monotonic() + 3600)
+        with mock.patch.object(firebase_tokens.time, "monotonic", return_value=time.monotonic() + 61):
+            firebase_tokens.verify_firebase_id_token(self._token(), self.project_id)
+        self.assertEqual(self.fetch.call_count, 2)
+
+
+class PeekTokenClaimsTests(unittest.TestCase):
+    def test_preview_decodes_unpadded_payloads_of_any_length(self):
+        for padding in range(3):
+            claims = {"aud": "qring", "email": "a" * padding + "@example.com", "nonce": "ignored"}
+            payload = base64.urlsafe_b64encode(orjson.dumps(claims)).rstrip(b"=").decode()
+            with self.subTest(padding=padding):
+                preview = auth_service._peek_token_claims(f"header.{payload}.signature")
+                self.assertEqual(set(preview), set(auth_service._PEEK_CLAIM_KEYS))
+                self.assertEqual((preview["aud"], preview["email"], preview["iss"]), ("qring", claims["email"], None))
+
+    def test_malformed_tokens_report_instead_of_raising(self):
+        self.assertEqual(auth_service._peek_token_claims("no-dots"), {"error": "malformed_jwt"})
+        self.assertEqual(auth_service._peek_token_claims("a.!!!.c"), {"error": "peek_failed:JSONDecodeError"})
+
+
+if __name__ == "__main__":
+    unittest.main()
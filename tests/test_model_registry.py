@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import unittest
+from collections import Counter
+
+from app.db.base import Base
+from app.db.models import User
+from app.schemas.auth import AuthUser
+
+
+class ModelRegistryTests(unittest.TestCase):
+    def test_each_model_class_is_mapped_once(self):
+        names = Counter(mapper.class_.__name__ for mapper in Base.registry.mappers)
+        self.assertEqual([name for name, count in names.items() if count > 1], [])
+        self.assertIs(Base.registry._class_registry["User"], User)
+
+    def test_user_model_and_schema_carry_referral_fields(self):
+        self.assertEqual(User.__module__, "app.db.models.user")
+        self.assertTrue({"referral_code", "referral_earnings"} <= set(User.__table__.c.keys()))
+        self.assertTrue({"referralCode", "referralEarnings"} <= set(AuthUser.model_fields))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+import unittest
+import uuid
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.base import Base
+from app.db.models import Notification, User, UserRole
+from app.services import notification_service
+
+
+class _NotificationDbTestCase(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, class_=Session, autoflush=False, autocommit=False)
+        self.db = self.SessionLocal()
+        self.user = User(
+            id=str(uuid.uuid4()),
+            full_name="Notified User",
+            email="notified-user@test.com",
+            password_hash="hashed",
+            role=UserRole.homeowner,
+            email_verified=True,
+        )
+        self.other_user = User(
+            id=str(uuid.uuid4()),
+            full_name="Other User",
+            email="other-user@test.com",
+            password_hash="hashed",
+            role=UserRole.homeowner,
+            email_verified=True,
+        )
+        self.db.add_all([self.user, self.other_user])
+        self.db.flush()
+        self.db.add_all(
+            [Notification(user_id=self.user.id, kind="visitor.request", payload="{}") for _ in range(3)]
+            + [Notification(user_id=self.other_user.id, kind="visitor.request", payload="{}")]
+        )
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+
+class MarkAllNotificationsReadTests(_NotificationDbTestCase):
+    def test_marks_unread_rows_with_a_single_update(self):
+        user_id, other_user_id = self.user.id, self.other_user.id
+        statements: list[str] = []
+
+        def _record(_conn, _cursor, statement, _params, _context, _executemany):
+            statements.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", _record)
+        try:
+            with patch.object(notification_service, "_schedule_dashboard_emit") as schedule:
+                updated = notification_service.mark_all_notifications_read(self.db, user_id)
+        finally:
+            event.remove(self.engine, "before_cursor_execute", _record)
+
+        self.assertEqual(updated, 3)
+        self.assertEqual(schedule.call_count, 1)
+        self.assertEqual([s.split()[0] for s in statements], ["UPDATE"])
+        self.db.expire_all()
+        unread = self.db.query(Notification.user_id).filter(Notification.read_at.is_(None)).all()
+        self.assertEqual([row.user_id for row in unread], [other_user_id])
+
+    def test_returns_zero_without_emitting_when_nothing_is_unread(self):
+        with patch.object(notification_service, "_schedule_dashboard_emit") as schedule:
+            notification_service.mark_all_notifications_read(self.db, self.user.id)
+            self.assertEqual(notification_service.mark_all_notifications_read(self.db, self.user.id), 0)
+        self.assertEqual(schedule.call_count, 1)
+
+
+class CreateNotificationTests(_NotificationDbTestCase):
+    def test_notification_is_written_with_a_single_insert(self):
+        user_id = self.user.id
+        statements: list[str] = []
+
+        def _record(_conn, _cursor, statement, _params, _context, _executemany):
+            statements.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", _record)
+        try:
+            with patch.object(notification_service, "_schedule_dashboard_emit"), patch.object(
+                notification_service, "send_push_fcm"
+            ):
+                notification_id = notification_service.create_notification(
+                    self.db, user_id, "visitor.request", {"message": "Visitor at the gate"}, idempotency_key=None
+                )
+        finally:
+            event.remove(self.engine, "before_cursor_execute", _record)
+
+        self.assertEqual([s.split()[0] for s in statements], ["INSERT"])
+        stored = self.db.get(Notification, notification_id)
+        self.assertEqual((stored.user_id, stored.kind), (user_id, "visitor.request"))
+        self.assertEqual(json.loads(stored.payload)["message"], "Visitor at the gate")
+
+    def test_listing_tolerates_malformed_payloads(self):
+        self.db.add(Notification(user_id=self.user.id, kind="system", payload="not json"))
+        self.db.commit()
+        items = notification_service.list_notifications(self.db, self.user.id)
+        self.assertIn("not json", [item["payload"] for item in items])
+        self.assertEqual({item["userId"] for item in items}, {self.user.id})
+
+
+if __name__ == "__main__":
+    unittest.main()
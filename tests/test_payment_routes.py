@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import unittest
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+from app.db.session import get_db
+from app.main import fastapi_app
+
+
+class PaymentCatalogRoutesTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite+pysqlite://",
+            future=True,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, class_=Session, autoflush=False, autocommit=False)
+
+        def override_get_db():
+            db = self.SessionLocal()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        fastapi_app.dependency_overrides[get_db] = override_get_db
+        self.client = TestClient(fastapi_app, raise_server_exceptions=False)
+
+    def tearDown(self):
+        fastapi_app.dependency_overrides.clear()
+        self.engine.dispose()
+
+    def test_plans_are_cacheable_and_revalidate_with_etag(self):
+        response = self.client.get("/api/v1/payment/plans")
+        self.assertEqual(response.status_code, 200, response.text)
+        self.assertIn("data", response.json())
+        self.assertEqual(response.headers["cache-control"], "public, max-age=60")
+        etag = response.headers["etag"]
+
+        revalidated = self.client.get("/api/v1/payment/plans", headers={"If-None-Match": etag})
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated.content, b"")
+        self.assertEqual(revalidated.headers["etag"], etag)
+
+        stale = self.client.get("/api/v1/payment/plans", headers={"If-None-Match": '"stale"'})
+        self.assertEqual(stale.status_code, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import unittest
+
+from sqlalchemy import create_engine, event, inspect
+
+from app.db.schema_version import get_schema_version, set_schema_version
+
+
+class SchemaVersionTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_missing_table_reads_as_version_zero(self):
+        self.assertEqual(get_schema_version(self.engine), 0)
+        self.assertFalse(inspect(self.engine).has_table("schema_meta"))
+
+    def test_read_is_a_single_select_once_the_table_exists(self):
+        set_schema_version(self.engine, 3)
+        statements: list[str] = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", _capture)
+        try:
+            self.assertEqual(get_schema_version(self.engine), 3)
+        finally:
+            event.remove(self.engine, "before_cursor_execute", _capture)
+        self.assertEqual(len(statements), 1)
+        self.assertIn("FROM schema_meta", statements[0])
+
+    def test_set_inserts_then_updates_the_stamp(self):
+        set_schema_version(self.engine, 1)
+        self.assertEqual(get_schema_version(self.engine), 1)
+        set_schema_version(self.engine, 2)
+        self.assertEqual(get_schema_version(self.engine), 2)
+        self.assertEqual(get_schema_version(self.engine, key="other"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
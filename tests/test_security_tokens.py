@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import unittest
+from datetime import timedelta
+
+from app.core import security
+
+
+class CachedTokenDecodeTests(unittest.TestCase):
+    def setUp(self):
+        security.clear_token_cache()
+
+    def tearDown(self):
+        security.clear_token_cache()
+
+    def test_cached_decode_matches_plain_decode(self):
+        token = security.create_access_token("user-1", "homeowner")
+        payload = security.decode_token_cached(token)
+        self.assertEqual(payload, security.decode_token(token))
+        security.decode_token_cached(token)
+        self.assertEqual(security._decode_token_cached.cache_info().hits, 1)
+
+    def test_cached_decode_rejects_token_once_expired(self):
+        token = security._create_token("user-1", timedelta(seconds=60), "access")
+        security.decode_token_cached(token)
+        original_time = security.time.time
+        security.time.time = lambda: original_time() + 120
+        try:
+            with self.assertRaises(ValueError):
+                security.decode_token_cached(token)
+        finally:
+            security.time.time = original_time
+
+    def test_invalid_tokens_are_not_cached(self):
+        with self.assertRaises(ValueError):
+            security.decode_token_cached("not-a-token")
+        self.assertEqual(security._decode_token_cached.cache_info().currsize, 0)
+
+
+class PasswordHashingTests(unittest.TestCase):
+    def test_new_hashes_use_argon2id(self):
+        hashed = security.hash_password("Password123!")
+        self.assertTrue(hashed.startswith("$argon2id$"))
+        self.assertTrue(security.verify_password("Password123!", hashed))
+        self.assertFalse(security.verify_password("wrong-password", hashed))
+
+    def test_bcrypt_hashes_verify_and_are_upgraded(self):
+        legacy = security.pwd_context.handler("bcrypt").using(rounds=4).hash("Password123!")
+        verified, upgraded = security.verify_and_update_password("Password123!", legacy)
+        self.assertTrue(verified)
+        self.assertTrue(upgraded.startswith("$argon2id$"))
+        self.assertEqual(security.verify_and_update_password("wrong-password", legacy), (False, None))
+
+
+class PasswordHashCostTests(unittest.TestCase):
+    def test_new_hashes_use_configured_argon2_cost(self):
+        settings = security.settings
+        expected = f"m={settings.PASSWORD_HASH_MEMORY_KIB},t={settings.PASSWORD_HASH_TIME_COST},p={settings.PASSWORD_HASH_PARALLELISM}"
+        self.assertIn(expected, security.hash_password("Secret123"))
+
+    def test_hash_with_other_cost_verifies_and_is_upgraded(self):
+        cheaper = security.pwd_context.handler("argon2").using(time_cost=1, memory_cost=8192, parallelism=1).hash("Secret123")
+        verified, upgraded = security.verify_and_update_password("Secret123", cheaper)
+        self.assertTrue(verified)
+        self.assertIsNotNone(upgraded)
+
+    def test_unusable_hash_never_verifies(self):
+        self.assertFalse(security.is_password_usable(security.UNUSABLE_PASSWORD_HASH))
+        self.assertFalse(security.verify_password("!", security.UNUSABLE_PASSWORD_HASH))
+        self.assertEqual(security.verify_and_update_password("", security.UNUSABLE_PASSWORD_HASH), (False, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
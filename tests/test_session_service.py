@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import unittest
+import uuid
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.base import Base
+from app.db.models import Door, Home, User, UserRole, VisitorSession
+from app.services.session_service import update_session_status_for_homeowner
+
+
+class UpdateSessionStatusForHomeownerTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, class_=Session, autoflush=False, autocommit=False)
+        self.db = self.SessionLocal()
+
+        self.homeowner = User(
+            id=str(uuid.uuid4()),
+            full_name="Homeowner Test",
+            email="homeowner-session-status@test.com",
+            password_hash="hashed",
+            role=UserRole.homeowner,
+            email_verified=True,
+        )
+        self.db.add(self.homeowner)
+        self.db.flush()
+        self.home = Home(id=str(uuid.uuid4()), name="Unit 7", homeowner_id=self.homeowner.id)
+        self.db.add(self.home)
+        self.db.flush()
+        self.door = Door(id=str(uuid.uuid4()), name="Main Gate", home_id=self.home.id)
+        self.db.add(self.door)
+        self.db.flush()
+        self.session = VisitorSession(
+            id=str(uuid.uuid4()),
+            qr_id="qr-session-status",
+            home_id=self.home.id,
+            door_id=self.door.id,
+            homeowner_id=self.homeowner.id,
+            status="approved",
+        )
+        self.db.add(self.session)
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def test_closes_session_and_sets_ended_at(self):
+        row = update_session_status_for_homeowner(
+            self.db, session_id=self.session.id, homeowner_id=self.homeowner.id, status="closed"
+        )
+        self.assertEqual((row.id, row.status), (self.session.id, "closed"))
+        self.db.expire_all()
+        stored = self.db.get(VisitorSession, self.session.id)
+        self.assertEqual(stored.status, "closed")
+        self.assertIsNotNone(stored.ended_at)
+        self.assertIsNotNone(stored.state_updated_at)
+
+    def test_other_homeowner_cannot_update_session(self):
+        row = update_session_status_for_homeowner(
+            self.db, session_id=self.session.id, homeowner_id=str(uuid.uuid4()), status="closed"
+        )
+        self.assertIsNone(row)
+        self.db.expire_all()
+        self.assertEqual(self.db.get(VisitorSession, self.session.id).status, "approved")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import unittest
+
+from fastapi.testclient import TestClient
+
+from app.main import fastapi_app
+
+
+class WebsocketGatewayTests(unittest.TestCase):
+    def test_gateway_echoes_text_and_binary_frames_unchanged(self):
+        client = TestClient(fastapi_app)
+        with client.websocket_connect("/api/v1/ws/gateway") as websocket:
+            websocket.send_text("ping")
+            self.assertEqual(websocket.receive_text(), "ping")
+            websocket.send_bytes(b"\x00\xffframe")
+            self.assertEqual(websocket.receive_bytes(), b"\x00\xffframe")
+
+
+if __name__ == "__main__":
+    unittest.main()